@@ -1,6 +1,9 @@
+import datetime
+import re
 from collections import deque
-from copy import copy
+from copy import copy, deepcopy
 from dataclasses import dataclass, is_dataclass
+from decimal import Decimal
 from enum import Enum
 from functools import lru_cache
 from typing import (
@@ -9,6 +12,7 @@ from typing import (
     Deque,
     Dict,
     FrozenSet,
+    Hashable,
     List,
     Mapping,
     Sequence,
@@ -17,6 +21,8 @@ from typing import (
     Type,
     Union,
 )
+from uuid import UUID
+from weakref import WeakValueDictionary
 
 from fastapi.exceptions import RequestErrorModel
 from fastapi.types import IncEx, ModelNameMap, UnionType
@@ -47,7 +53,57 @@ sequence_types = tuple(sequence_annotation_to_type.keys())
 
 Url: Type[Any]
 
+_immutable_types = {
+    type(None),
+    bool,
+    int,
+    float,
+    complex,
+    str,
+    bytes,
+    Decimal,
+    UUID,
+    datetime.date,
+    datetime.datetime,
+    datetime.time,
+    datetime.timedelta,
+}
+
+
+def _is_immutable(value: Any) -> bool:
+    if type(value) in _immutable_types or isinstance(value, Enum):
+        return True
+    if type(value) in (tuple, frozenset):
+        return all(_is_immutable(v) for v in value)
+    if isinstance(value, BaseModel):
+        config = _get_model_config(value)
+        frozen = (
+            config.get("frozen", False)
+            if PYDANTIC_V2
+            else getattr(config, "frozen", False)
+        )
+        return bool(frozen) and all(_is_immutable(v) for v in value.__dict__.values())
+    return False
+
+
+def _return_value(value: Any) -> Any:
+    return value
+
+
+def _get_default_copier(default: Any) -> Callable[[Any], Any]:
+    # Parameter defaults are returned to each request, the mutable ones have to be
+    # copied, but a shallow copy is enough when they only contain immutable values
+    if _is_immutable(default):
+        return _return_value
+    if type(default) in (list, set) and all(_is_immutable(v) for v in default):
+        return copy
+    if type(default) is dict and all(_is_immutable(v) for v in default.values()):
+        return copy
+    return deepcopy
+
+
 if PYDANTIC_V2:
+    import annotated_types
     from pydantic import PydanticSchemaGenerationError as PydanticSchemaGenerationError
     from pydantic import TypeAdapter
     from pydantic import ValidationError as ValidationError
@@ -84,6 +140,160 @@ if PYDANTIC_V2:
     class ErrorWrapper(Exception):
         pass
 
+    _MISSING: Any = object()
+    # Only the inputs that are certainly parsed the same way by Pydantic are
+    # handled, anything else goes through Pydantic
+    _int_re = re.compile(r"-?[0-9]{1,18}")
+    _float_re = re.compile(r"-?[0-9]{1,15}(?:\.[0-9]{1,15})?")
+    _uuid_re = re.compile(
+        r"[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}"
+    )
+    _bool_values = {
+        "0": False,
+        "off": False,
+        "f": False,
+        "false": False,
+        "n": False,
+        "no": False,
+        "1": True,
+        "on": True,
+        "t": True,
+        "true": True,
+        "y": True,
+        "yes": True,
+    }
+
+    def _validate_int(value: Any) -> Any:
+        if type(value) is int:
+            return value
+        if type(value) is str and _int_re.fullmatch(value):
+            return int(value)
+        return _MISSING
+
+    def _validate_float(value: Any) -> Any:
+        if type(value) is float:
+            return value
+        if type(value) is int:
+            return float(value)
+        if type(value) is str and _float_re.fullmatch(value):
+            return float(value)
+        return _MISSING
+
+    def _validate_str(value: Any) -> Any:
+        return value if type(value) is str else _MISSING
+
+    def _validate_bool(value: Any) -> Any:
+        if type(value) is bool:
+            return value
+        if type(value) is str:
+            return _bool_values.get(value, _MISSING)
+        return _MISSING
+
+    def _validate_uuid(value: Any) -> Any:
+        if type(value) is UUID:
+            return value
+        if type(value) is str and _uuid_re.fullmatch(value):
+            return UUID(value)
+        return _MISSING
+
+    _scalar_validators: Dict[Any, Callable[[Any], Any]] = {
+        int: _validate_int,
+        float: _validate_float,
+        str: _validate_str,
+        bool: _validate_bool,
+        UUID: _validate_uuid,
+    }
+
+    def _get_enum_validator(enum_class: Type[Enum]) -> Callable[[Any], Any]:
+        value_to_member = enum_class._value2member_map_
+
+        def validate_enum(value: Any) -> Any:
+            if type(value) is enum_class:
+                return value
+            if type(value) is str:
+                return value_to_member.get(value, _MISSING)
+            return _MISSING
+
+        return validate_enum
+
+    def _get_scalar_validator(
+        field_info: FieldInfo,
+    ) -> Union[Callable[[Any], Any], None]:
+        # Unconstrained int, float, str, bool, UUID, and Enum annotations (or
+        # Optional of them) can be converted without Pydantic
+        if field_info.metadata:
+            return None
+        annotation = field_info.annotation
+        origin = get_origin(annotation)
+        if origin is Union or origin is UnionType:
+            args = [arg for arg in get_args(annotation) if arg is not type(None)]
+            if len(args) != 1:
+                return None
+            annotation = args[0]
+        validator = _scalar_validators.get(annotation)
+        if validator is not None:
+            return validator
+        if lenient_issubclass(annotation, Enum):
+            return _get_enum_validator(annotation)  # type: ignore[arg-type]
+        return None
+
+    # The TypeAdapters shared by the fields with the same annotation, field info and
+    # mode, an adapter is removed when no field uses it anymore
+    _type_adapters: "WeakValueDictionary[Hashable, TypeAdapter[Any]]" = (
+        WeakValueDictionary()
+    )
+
+    @lru_cache
+    def _get_field_info_slots(field_info_class: Type[FieldInfo]) -> Tuple[str, ...]:
+        return tuple(
+            slot
+            for cls in field_info_class.__mro__
+            for slot in getattr(cls, "__slots__", ())
+        )
+
+    def _get_key(value: Any) -> Hashable:
+        # Values that are equal but validated differently, like 1 and True, or
+        # Union[int, str] and Union[str, int], must have different keys
+        origin = get_origin(value)
+        if origin is not None:
+            return (origin, tuple(_get_key(arg) for arg in get_args(value)))
+        if isinstance(value, (list, tuple)):
+            return (type(value), tuple(_get_key(item) for item in value))
+        if isinstance(value, dict):
+            return (
+                dict,
+                tuple((_get_key(k), _get_key(v)) for k, v in value.items()),
+            )
+        if (
+            isinstance(value, annotated_types.BaseMetadata)
+            and type(value).__eq__ is object.__eq__
+        ):
+            # Like the metadata created by Pydantic for pattern or strict
+            return (type(value), _get_key(vars(value)))
+        return (type(value), value)
+
+    def _get_type_adapter(
+        field_info: FieldInfo, mode: Literal["validation", "serialization"]
+    ) -> TypeAdapter[Any]:
+        try:
+            key = (
+                type(field_info),
+                mode,
+                tuple(
+                    _get_key(getattr(field_info, slot, _MISSING))
+                    for slot in _get_field_info_slots(type(field_info))  # type: ignore[arg-type]
+                ),
+                _get_key(getattr(field_info, "__dict__", {})),
+            )
+            type_adapter = _type_adapters.get(key)
+        except TypeError:
+            # Some value is not hashable
+            return TypeAdapter(Annotated[field_info.annotation, field_info])
+        if type_adapter is None:
+            type_adapter = TypeAdapter(Annotated[field_info.annotation, field_info])
+            _type_adapters[key] = type_adapter
+        return type_adapter
+
     @dataclass
     class ModelField:
         field_info: FieldInfo
@@ -108,9 +318,16 @@ if PYDANTIC_V2:
             return self.field_info.annotation
 
         def __post_init__(self) -> None:
-            self._type_adapter: TypeAdapter[Any] = TypeAdapter(
-                Annotated[self.field_info.annotation, self.field_info]
+            self._type_adapter: TypeAdapter[Any] = _get_type_adapter(
+                self.field_info, self.mode
             )
+            self._scalar_validator = _get_scalar_validator(self.field_info)
+            self._default_copier: Callable[[Any], Any] = deepcopy
+            if (
+                not self.field_info.is_required()
+                and self.field_info.default_factory is None
+            ):
+                self._default_copier = _get_default_copier(self.field_info.default)
 
         def get_default(self) -> Any:
             if self.field_info.is_required():
@@ -124,6 +341,10 @@ if PYDANTIC_V2:
             *,
             loc: Tuple[Union[int, str], ...] = (),
         ) -> Tuple[Any, Union[List[Dict[str, Any]], None]]:
+            if self._scalar_validator is not None:
+                validated = self._scalar_validator(value)
+                if validated is not _MISSING:
+                    return validated, None
             try:
                 return (
                     self._type_adapter.validate_python(value, from_attributes=True),
@@ -134,6 +355,20 @@ if PYDANTIC_V2:
                     errors=exc.errors(include_url=False), loc_prefix=loc
                 )
 
+        def validate_json(
+            self,
+            value: Union[str, bytes],
+            values: Dict[str, Any] = {},  # noqa: B006
+            *,
+            loc: Tuple[Union[int, str], ...] = (),
+        ) -> Tuple[Any, Union[List[Dict[str, Any]], None]]:
+            try:
+                return self._type_adapter.validate_json(value), None
+            except ValidationError as exc:
+                return None, _regenerate_error_with_loc(
+                    errors=exc.errors(include_url=False), loc_prefix=loc
+                )
+
         def serialize(
             self,
             value: Any,
@@ -159,6 +394,29 @@ if PYDANTIC_V2:
                 exclude_none=exclude_none,
             )
 
+        def serialize_json(
+            self,
+            value: Any,
+            *,
+            include: Union[IncEx, None] = None,
+            exclude: Union[IncEx, None] = None,
+            by_alias: bool = True,
+            exclude_unset: bool = False,
+            exclude_defaults: bool = False,
+            exclude_none: bool = False,
+        ) -> bytes:
+            # What calls this code passes a value that already called
+            # self._type_adapter.validate_python(value)
+            return self._type_adapter.dump_json(
+                value,
+                include=include,
+                exclude=exclude,
+                by_alias=by_alias,
+                exclude_unset=exclude_unset,
+                exclude_defaults=exclude_defaults,
+                exclude_none=exclude_none,
+            )
+
         def __hash__(self) -> int:
             # Each ModelField is unique for our purposes, to allow making a dict from
             # ModelField to its JSON Schema.
@@ -287,6 +545,15 @@ if PYDANTIC_V2:
             for name, field_info in model.model_fields.items()
         ]
 
+    def copy_field_default(field: ModelField) -> Any:
+        return field._default_copier(field.default)
+
+    def rename_model_field(field: ModelField, name: str) -> ModelField:
+        # The copy shares the TypeAdapter, it doesn't depend on the name
+        new_field = copy(field)
+        new_field.name = name
+        return new_field
+
 else:
     from fastapi.openapi.constants import REF_PREFIX as REF_PREFIX
     from pydantic import AnyUrl as Url  # noqa: F401
@@ -525,6 +792,16 @@ else:
     def get_model_fields(model: Type[BaseModel]) -> List[ModelField]:
         return list(model.__fields__.values())  # type: ignore[attr-defined]
 
+    def copy_field_default(field: ModelField) -> Any:
+        return _get_default_copier(field.default)(field.default)
+
+    def rename_model_field(field: ModelField, name: str) -> ModelField:
+        new_field = copy(field)
+        new_field.name = name
+        if not field.has_alias:  # type: ignore[attr-defined]
+            new_field.alias = name  # type: ignore[misc]
+        return new_field
+
 
 def _regenerate_error_with_loc(
     *, errors: Sequence[Any], loc_prefix: Tuple[Union[str, int], ...]
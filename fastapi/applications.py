@@ -1,6 +1,9 @@
+import json
+from contextlib import asynccontextmanager
 from enum import Enum
 from typing import (
     Any,
+    AsyncIterator,
     Awaitable,
     Callable,
     Coroutine,
@@ -8,26 +11,39 @@ from typing import (
     List,
     Optional,
     Sequence,
+    Set,
+    Tuple,
     Type,
     TypeVar,
     Union,
 )
 
 from fastapi import routing
+from fastapi.cache import RequestCoalescer, ResponseCache, _PrecompressedContent
+from fastapi.concurrency import run_in_threadpool
 from fastapi.datastructures import Default, DefaultPlaceholder
+from fastapi.dependencies.utils import AppDependencyStore
 from fastapi.exception_handlers import (
     http_exception_handler,
     request_validation_exception_handler,
     websocket_request_validation_exception_handler,
 )
-from fastapi.exceptions import RequestValidationError, WebSocketRequestValidationError
+from fastapi.exceptions import (
+    FastAPIError,
+    RequestValidationError,
+    WebSocketRequestValidationError,
+)
 from fastapi.logger import logger
 from fastapi.openapi.docs import (
     get_redoc_html,
     get_swagger_ui_html,
     get_swagger_ui_oauth2_redirect_html,
 )
-from fastapi.openapi.utils import get_openapi
+from fastapi.openapi.utils import (
+    OpenAPIFragments,
+    get_openapi,
+    get_openapi_checksum,
+)
 from fastapi.params import Depends
 from fastapi.types import DecoratedCallable, IncEx
 from fastapi.utils import generate_unique_id
@@ -810,6 +826,153 @@ class FastAPI(Starlette):
                 """
             ),
         ] = True,
+        incremental_openapi: Annotated[
+            bool,
+            Doc(
+                """
+                Keep the parts of the OpenAPI schema generated for each *path
+                operation*, and when *path operations* are added or removed after
+                the schema was generated, e.g. by including a router at runtime,
+                generate it again only generating the parts of the new ones.
+
+                If `app.openapi_schema` is set to a different schema, it's not
+                generated again.
+                """
+            ),
+        ] = False,
+        openapi_source: Annotated[
+            Optional[str],
+            Doc(
+                """
+                The path of a file with the OpenAPI schema exported with
+                `app.export_openapi()`, e.g. at build time, to serve it instead of
+                generating it.
+
+                The file has a checksum of the *path operations* it was exported
+                from. If they changed since, an error is raised when the
+                application starts, or when the schema is first used.
+
+                **Example**
+
+                ```python
+                from fastapi import FastAPI
+
+                app = FastAPI(openapi_source="openapi.json")
+                ```
+                """
+            ),
+        ] = None,
+        validate_openapi: Annotated[
+            bool,
+            Doc(
+                """
+                Whether to validate the generated OpenAPI schema with the Pydantic
+                models in `fastapi.openapi.models` before returning it.
+
+                Set it to `False` to return the generated schema directly, which
+                is faster and uses less memory for large applications. The content
+                is the same, but the keys of some objects can be in a different
+                order.
+
+                You can keep it enabled in your tests to check the schema.
+
+                **Example**
+
+                ```python
+                from fastapi import FastAPI
+
+                app = FastAPI(validate_openapi=False)
+                ```
+                """
+            ),
+        ] = True,
+        validate_json_bytes: Annotated[
+            bool,
+            Doc(
+                """
+                Validate JSON request bodies with Pydantic directly from the raw
+                bytes, parsing and validating them in a single pass, for the *path
+                operations* that receive a single (not embedded) Pydantic model as
+                the body.
+
+                The JSON is validated in Pydantic's JSON mode, so, for example, models
+                with `strict=True` accept values that are only valid in JSON, like
+                strings for dates.
+                """
+            ),
+        ] = Default(False),
+        serialize_json_bytes: Annotated[
+            bool,
+            Doc(
+                """
+                Serialize the responses of the *path operations* with a response model
+                and the default `JSONResponse` with Pydantic directly to JSON bytes, in
+                a single pass, instead of converting them to JSON-compatible data and
+                then encoding it with `json.dumps()`.
+
+                The JSON is generated by Pydantic, so some floats are formatted
+                differently, like `1e16` instead of `1e+16`, and `NaN` and infinite
+                floats are sent as `null` instead of raising an error.
+                """
+            ),
+        ] = Default(False),
+        concurrent_dependencies: Annotated[
+            bool,
+            Doc(
+                """
+                Solve the sibling dependencies of the *path operations* at the same
+                time, when they are `async def` functions without `yield` that don't
+                share sub-dependencies.
+
+                The values cached with `use_cache`, the validation errors, and the exit
+                order of dependencies with `yield` are the same as when they are solved
+                one after the other.
+                """
+            ),
+        ] = Default(False),
+        etag: Annotated[
+            bool,
+            Doc(
+                """
+                Add a strong `ETag` header to the `200` responses of the `GET` and
+                `HEAD` path operations in this application, and reply with an empty `304
+                Not Modified` when the request's `If-None-Match` header matches it.
+
+                The `ETag` is a hash of the rendered body. If the path operation
+                function already sets an `ETag` header in the `Response` parameter, for
+                example with a version of the data it returns, that value is used
+                instead, and the response is not serialized at all when it matches.
+                """
+            ),
+        ] = Default(False),
+        lazy_compile: Annotated[
+            bool,
+            Doc(
+                """
+                Compile the *path operations* lazily, the first time they match a
+                request or when they are needed, for example to generate the OpenAPI
+                schema, instead of when they are declared.
+
+                This makes startup faster for apps with a large number of routes. Errors
+                in the declaration of a *path operation* are only raised when it's
+                compiled, call `app.compile_all()` to compile all of them at once, for
+                example in tests or to warm up the app.
+                """
+            ),
+        ] = Default(False),
+        radix_routing: Annotated[
+            bool,
+            Doc(
+                """
+                Find the route for each request with a prefix tree of the path
+                segments of the routes, instead of trying each route in order.
+
+                The routes are still matched with the same precedence (the first one
+                declared wins), including "405 Method Not Allowed" responses. This is
+                useful for applications with a large number of routes.
+                """
+            ),
+        ] = False,
         **extra: Annotated[
             Any,
             Doc(
@@ -838,6 +1001,18 @@ class FastAPI(Starlette):
         self.swagger_ui_parameters = swagger_ui_parameters
         self.servers = servers or []
         self.separate_input_output_schemas = separate_input_output_schemas
+        self.incremental_openapi = incremental_openapi
+        self.openapi_source = openapi_source
+        self.validate_openapi = validate_openapi
+        # The schema loaded from openapi_source, and its file content
+        self._openapi_source_document: Optional[Tuple[Dict[str, Any], bytes]] = None
+        # The server URLs added to self.servers from the root_path of the requests
+        self._root_path_server_urls: Set[str] = set()
+        self._openapi_fragments = OpenAPIFragments()
+        # The schema generated with incremental_openapi, and the routes it has
+        self._incremental_openapi: Optional[
+            Tuple[Dict[str, Any], Tuple[BaseRoute, ...]]
+        ] = None
         self.extra = extra
         self.openapi_version: Annotated[
             str,
@@ -871,6 +1046,10 @@ class FastAPI(Starlette):
             ),
         ] = "3.1.0"
         self.openapi_schema: Optional[Dict[str, Any]] = None
+        # The rendered OpenAPI documents by root_path, with the schema they come from
+        self._openapi_documents: Dict[
+            str, Tuple[Dict[str, Any], _PrecompressedContent]
+        ] = {}
         if self.openapi_url:
             assert self.title, "A title must be provided for OpenAPI, e.g.: 'My API'"
             assert self.version, "A version must be provided for OpenAPI, e.g.: '2.1.0'"
@@ -943,6 +1122,30 @@ class FastAPI(Starlette):
             include_in_schema=include_in_schema,
             responses=responses,
             generate_unique_id_function=generate_unique_id_function,
+            validate_json_bytes=validate_json_bytes,
+            serialize_json_bytes=serialize_json_bytes,
+            concurrent_dependencies=concurrent_dependencies,
+            etag=etag,
+            lazy_compile=lazy_compile,
+            radix_routing=radix_routing,
+        )
+        self.app_dependency_store: Annotated[
+            AppDependencyStore,
+            Doc(
+                """
+                The values of the dependencies declared with `scope="app"`.
+
+                They are solved when the application starts (or when they are first
+                used, if the lifespan is not run), and the ones with `yield` are
+                exited when the application shuts down.
+                """
+            ),
+        ] = AppDependencyStore(dependency_overrides_provider=self)
+        self.router.lifespan_context = routing._merge_lifespan_context(
+            self.router.lifespan_context, self._app_dependencies_lifespan
+        )
+        self.router.lifespan_context = routing._merge_lifespan_context(
+            self.router.lifespan_context, self._openapi_source_lifespan
         )
         self.exception_handlers: Dict[
             Any, Callable[[Request, Any], Union[Response, Awaitable[Response]]]
@@ -977,6 +1180,27 @@ class FastAPI(Starlette):
         Read more in the
         [FastAPI docs for OpenAPI](https://fastapi.tiangolo.com/how-to/extending-openapi/).
         """
+        if self.openapi_source is not None:
+            if not self.openapi_schema:
+                self.openapi_schema = self._load_openapi_source()
+            return self.openapi_schema
+        routes: Tuple[BaseRoute, ...] = ()
+        if self.incremental_openapi:
+            routes = (*self.routes, *self.webhooks.routes)
+            if (
+                self.openapi_schema is not None
+                and self._incremental_openapi is not None
+                and self.openapi_schema is self._incremental_openapi[0]
+                and (
+                    len(routes) != len(self._incremental_openapi[1])
+                    or any(
+                        route is not previous
+                        for route, previous in zip(routes, self._incremental_openapi[1])
+                    )
+                )
+            ):
+                # Routes were added or removed since it was generated
+                self.openapi_schema = None
         if not self.openapi_schema:
             self.openapi_schema = get_openapi(
                 title=self.title,
@@ -992,21 +1216,148 @@ class FastAPI(Starlette):
                 tags=self.openapi_tags,
                 servers=self.servers,
                 separate_input_output_schemas=self.separate_input_output_schemas,
+                fragments=self._openapi_fragments if self.incremental_openapi else None,
+                validate=self.validate_openapi,
             )
+            if self.incremental_openapi:
+                self._incremental_openapi = (self.openapi_schema, routes)
         return self.openapi_schema
 
+    def _get_openapi_checksum(self) -> str:
+        return get_openapi_checksum(
+            title=self.title,
+            version=self.version,
+            openapi_version=self.openapi_version,
+            summary=self.summary,
+            description=self.description,
+            terms_of_service=self.terms_of_service,
+            contact=self.contact,
+            license_info=self.license_info,
+            routes=self.routes,
+            webhooks=self.webhooks.routes,
+            tags=self.openapi_tags,
+            # The same with or without the servers added for the root_path
+            servers=[
+                server_data
+                for server_data in self.servers
+                if server_data.get("url") not in self._root_path_server_urls
+            ],
+            separate_input_output_schemas=self.separate_input_output_schemas,
+        )
+
+    def _load_openapi_source(self) -> Dict[str, Any]:
+        assert self.openapi_source is not None
+        if self._openapi_source_document is None:
+            with open(self.openapi_source, "rb") as f:
+                body = f.read()
+            source_schema: Dict[str, Any] = json.loads(body)
+            if source_schema.get("x-fastapi-checksum") != self._get_openapi_checksum():
+                raise FastAPIError(
+                    f"The OpenAPI schema in {self.openapi_source} doesn't match the "
+                    "path operations of the application, export it again with "
+                    "app.export_openapi()"
+                )
+            self._openapi_source_document = (source_schema, body)
+        schema = self._openapi_source_document[0]
+        if self.servers == schema.get("servers", []):
+            return schema
+        # The servers added for the root_path since it was exported, in the same
+        # place get_openapi() puts them
+        with_servers: Dict[str, Any] = {}
+        for key, value in schema.items():
+            if key != "servers":
+                with_servers[key] = value
+            if key == "info":
+                with_servers["servers"] = self.servers
+        return with_servers
+
+    def export_openapi(
+        self,
+        path: Annotated[
+            str,
+            Doc(
+                """
+                The path of the file to write the OpenAPI schema to.
+                """
+            ),
+        ],
+    ) -> None:
+        """
+        Write the OpenAPI schema of the application to a file, with a checksum of
+        the *path operations* it was generated from, to serve it later with
+        `FastAPI(openapi_source=path)`, without generating it.
+
+        ## Example
+
+        ```python
+        from myapp.main import app
+
+        app.export_openapi("openapi.json")
+        ```
+        """
+        schema = {**self.openapi(), "x-fastapi-checksum": self._get_openapi_checksum()}
+        with open(path, "wb") as f:
+            f.write(JSONResponse(schema).body)
+
+    def compile_all(self) -> None:
+        """
+        Compile all the *path operations* that were not compiled yet, because they
+        were declared with `lazy_compile`.
+
+        This raises any error in the declaration of a *path operation* right away,
+        and avoids compiling them while serving the first requests.
+
+        ## Example
+
+        ```python
+        from fastapi import FastAPI
+
+        app = FastAPI(lazy_compile=True)
+
+
+        @app.get("/items/")
+        def read_items():
+            return [{"name": "Empire State Building"}]
+
+
+        app.compile_all()
+        ```
+        """
+        self.router.compile_all()
+
     def setup(self) -> None:
         if self.openapi_url:
             urls = (server_data.get("url") for server_data in self.servers)
             server_urls = {url for url in urls if url}
 
-            async def openapi(req: Request) -> JSONResponse:
+            async def openapi(req: Request) -> Response:
                 root_path = req.scope.get("root_path", "").rstrip("/")
                 if root_path not in server_urls:
                     if root_path and self.root_path_in_servers:
                         self.servers.insert(0, {"url": root_path})
                         server_urls.add(root_path)
-                return JSONResponse(self.openapi())
+                        self._root_path_server_urls.add(root_path)
+                        if self.openapi_source is not None:
+                            # Loaded without this server, e.g. on startup
+                            self.openapi_schema = None
+                schema = self.openapi()
+                document = self._openapi_documents.get(root_path)
+                # A new schema, e.g. after resetting app.openapi_schema, is rendered
+                # again
+                if document is None or document[0] is not schema:
+
+                    def render() -> _PrecompressedContent:
+                        source = self._openapi_source_document
+                        if source is not None and source[0] is schema:
+                            # Served as it was exported
+                            body = source[1]
+                        else:
+                            body = JSONResponse(schema).body
+                        return _PrecompressedContent(body, "application/json")
+
+                    content = await run_in_threadpool(render)
+                    document = self._openapi_documents[root_path] = (schema, content)
+                return document[1].get_response(req)
 
             self.add_route(self.openapi_url, openapi, include_in_schema=False)
         if self.openapi_url and self.docs_url:
@@ -1053,6 +1404,26 @@ class FastAPI(Starlette):
             scope["root_path"] = self.root_path
         await super().__call__(scope, receive, send)
 
+    @asynccontextmanager
+    async def _openapi_source_lifespan(self, app: Any) -> AsyncIterator[None]:
+        if self.openapi_source is not None:
+            # Detect a stale schema on startup, not when it's first requested
+            self.openapi()
+        yield
+
+    @asynccontextmanager
+    async def _app_dependencies_lifespan(self, app: Any) -> AsyncIterator[None]:
+        for route in self.router.routes:
+            if isinstance(route, routing.APIRoute) and not route._compiled:
+                # Their app scoped dependencies are solved when they are first used
+                continue
+            if isinstance(route, (routing.APIRoute, routing.APIWebSocketRoute)):
+                await self.app_dependency_store.setup(route.dependant)
+        try:
+            yield
+        finally:
+            await self.app_dependency_store.close()
+
     def add_api_route(
         self,
         path: str,
@@ -1084,6 +1455,13 @@ class FastAPI(Starlette):
         generate_unique_id_function: Callable[[routing.APIRoute], str] = Default(
             generate_unique_id
         ),
+        coalesce: Optional[RequestCoalescer] = None,
+        cache: Optional[ResponseCache] = None,
+        validate_json_bytes: Union[bool, DefaultPlaceholder] = Default(False),
+        serialize_json_bytes: Union[bool, DefaultPlaceholder] = Default(False),
+        concurrent_dependencies: Union[bool, DefaultPlaceholder] = Default(False),
+        etag: Union[bool, DefaultPlaceholder] = Default(False),
+        lazy_compile: Union[bool, DefaultPlaceholder] = Default(False),
     ) -> None:
         self.router.add_api_route(
             path,
@@ -1110,6 +1488,13 @@ class FastAPI(Starlette):
             name=name,
             openapi_extra=openapi_extra,
             generate_unique_id_function=generate_unique_id_function,
+            coalesce=coalesce,
+            cache=cache,
+            validate_json_bytes=validate_json_bytes,
+            serialize_json_bytes=serialize_json_bytes,
+            concurrent_dependencies=concurrent_dependencies,
+            etag=etag,
+            lazy_compile=lazy_compile,
         )
 
     def api_route(
@@ -1140,6 +1525,9 @@ class FastAPI(Starlette):
         generate_unique_id_function: Callable[[routing.APIRoute], str] = Default(
             generate_unique_id
         ),
+        coalesce: Optional[RequestCoalescer] = None,
+        etag: Union[bool, DefaultPlaceholder] = Default(False),
+        cache: Optional[ResponseCache] = None,
     ) -> Callable[[DecoratedCallable], DecoratedCallable]:
         def decorator(func: DecoratedCallable) -> DecoratedCallable:
             self.router.add_api_route(
@@ -1167,6 +1555,9 @@ class FastAPI(Starlette):
                 name=name,
                 openapi_extra=openapi_extra,
                 generate_unique_id_function=generate_unique_id_function,
+                coalesce=coalesce,
+                etag=etag,
+                cache=cache,
             )
             return func
 
@@ -1788,6 +2179,45 @@ class FastAPI(Starlette):
                 """
             ),
         ] = Default(generate_unique_id),
+        coalesce: Annotated[
+            Optional[RequestCoalescer],
+            Doc(
+                """
+                A `RequestCoalescer` to handle only once the concurrent `GET` and `HEAD`
+                requests to this *path operation* that are the same. The others wait for
+                the response of the first one and get a copy of it.
+                """
+            ),
+        ] = None,
+        etag: Annotated[
+            Union[bool, DefaultPlaceholder],
+            Doc(
+                """
+                Add a strong `ETag` header to the `200` responses of this path operation
+                to `GET` and `HEAD` requests, and reply with an empty `304 Not Modified`
+                when the request's `If-None-Match` header matches it.
+
+                The `ETag` is a hash of the rendered body. If the path operation
+                function already sets an `ETag` header in the `Response` parameter, for
+                example with a version of the data it returns, that value is used
+                instead, and the response is not serialized at all when it matches.
+                """
+            ),
+        ] = Default(False),
+        cache: Annotated[
+            Optional[ResponseCache],
+            Doc(
+                """
+                A `ResponseCache` to cache the responses of this *path operation*, it
+                can only be used with `GET` and `HEAD` *path operations*.
+
+                A cached response is returned without parsing the request, solving the
+                dependencies, or calling the *path operation function*, so any request
+                header the response depends on, like `Authorization`, has to be declared
+                in its `vary`.
+                """
+            ),
+        ] = None,
     ) -> Callable[[DecoratedCallable], DecoratedCallable]:
         """
         Add a *path operation* using an HTTP GET operation.
@@ -1828,6 +2258,9 @@ class FastAPI(Starlette):
             callbacks=callbacks,
             openapi_extra=openapi_extra,
             generate_unique_id_function=generate_unique_id_function,
+            coalesce=coalesce,
+            etag=etag,
+            cache=cache,
         )
 
     def put(
@@ -2161,6 +2594,45 @@ class FastAPI(Starlette):
                 """
             ),
         ] = Default(generate_unique_id),
+        coalesce: Annotated[
+            Optional[RequestCoalescer],
+            Doc(
+                """
+                A `RequestCoalescer` to handle only once the concurrent `GET` and `HEAD`
+                requests to this *path operation* that are the same. The others wait for
+                the response of the first one and get a copy of it.
+                """
+            ),
+        ] = None,
+        etag: Annotated[
+            Union[bool, DefaultPlaceholder],
+            Doc(
+                """
+                Add a strong `ETag` header to the `200` responses of this path operation
+                to `GET` and `HEAD` requests, and reply with an empty `304 Not Modified`
+                when the request's `If-None-Match` header matches it.
+
+                The `ETag` is a hash of the rendered body. If the path operation
+                function already sets an `ETag` header in the `Response` parameter, for
+                example with a version of the data it returns, that value is used
+                instead, and the response is not serialized at all when it matches.
+                """
+            ),
+        ] = Default(False),
+        cache: Annotated[
+            Optional[ResponseCache],
+            Doc(
+                """
+                A `ResponseCache` to cache the responses of this *path operation*, it
+                can only be used with `GET` and `HEAD` *path operations*.
+
+                A cached response is returned without parsing the request, solving the
+                dependencies, or calling the *path operation function*, so any request
+                header the response depends on, like `Authorization`, has to be declared
+                in its `vary`.
+                """
+            ),
+        ] = None,
     ) -> Callable[[DecoratedCallable], DecoratedCallable]:
         """
         Add a *path operation* using an HTTP PUT operation.
@@ -2206,6 +2678,9 @@ class FastAPI(Starlette):
             callbacks=callbacks,
             openapi_extra=openapi_extra,
             generate_unique_id_function=generate_unique_id_function,
+            coalesce=coalesce,
+            etag=etag,
+            cache=cache,
         )
 
     def post(
@@ -2539,6 +3014,45 @@ class FastAPI(Starlette):
                 """
             ),
         ] = Default(generate_unique_id),
+        coalesce: Annotated[
+            Optional[RequestCoalescer],
+            Doc(
+                """
+                A `RequestCoalescer` to handle only once the concurrent `GET` and `HEAD`
+                requests to this *path operation* that are the same. The others wait for
+                the response of the first one and get a copy of it.
+                """
+            ),
+        ] = None,
+        etag: Annotated[
+            Union[bool, DefaultPlaceholder],
+            Doc(
+                """
+                Add a strong `ETag` header to the `200` responses of this path operation
+                to `GET` and `HEAD` requests, and reply with an empty `304 Not Modified`
+                when the request's `If-None-Match` header matches it.
+
+                The `ETag` is a hash of the rendered body. If the path operation
+                function already sets an `ETag` header in the `Response` parameter, for
+                example with a version of the data it returns, that value is used
+                instead, and the response is not serialized at all when it matches.
+                """
+            ),
+        ] = Default(False),
+        cache: Annotated[
+            Optional[ResponseCache],
+            Doc(
+                """
+                A `ResponseCache` to cache the responses of this *path operation*, it
+                can only be used with `GET` and `HEAD` *path operations*.
+
+                A cached response is returned without parsing the request, solving the
+                dependencies, or calling the *path operation function*, so any request
+                header the response depends on, like `Authorization`, has to be declared
+                in its `vary`.
+                """
+            ),
+        ] = None,
     ) -> Callable[[DecoratedCallable], DecoratedCallable]:
         """
         Add a *path operation* using an HTTP POST operation.
@@ -2584,6 +3098,9 @@ class FastAPI(Starlette):
             callbacks=callbacks,
             openapi_extra=openapi_extra,
             generate_unique_id_function=generate_unique_id_function,
+            coalesce=coalesce,
+            etag=etag,
+            cache=cache,
         )
 
     def delete(
@@ -2917,6 +3434,45 @@ class FastAPI(Starlette):
                 """
             ),
         ] = Default(generate_unique_id),
+        coalesce: Annotated[
+            Optional[RequestCoalescer],
+            Doc(
+                """
+                A `RequestCoalescer` to handle only once the concurrent `GET` and `HEAD`
+                requests to this *path operation* that are the same. The others wait for
+                the response of the first one and get a copy of it.
+                """
+            ),
+        ] = None,
+        etag: Annotated[
+            Union[bool, DefaultPlaceholder],
+            Doc(
+                """
+                Add a strong `ETag` header to the `200` responses of this path operation
+                to `GET` and `HEAD` requests, and reply with an empty `304 Not Modified`
+                when the request's `If-None-Match` header matches it.
+
+                The `ETag` is a hash of the rendered body. If the path operation
+                function already sets an `ETag` header in the `Response` parameter, for
+                example with a version of the data it returns, that value is used
+                instead, and the response is not serialized at all when it matches.
+                """
+            ),
+        ] = Default(False),
+        cache: Annotated[
+            Optional[ResponseCache],
+            Doc(
+                """
+                A `ResponseCache` to cache the responses of this *path operation*, it
+                can only be used with `GET` and `HEAD` *path operations*.
+
+                A cached response is returned without parsing the request, solving the
+                dependencies, or calling the *path operation function*, so any request
+                header the response depends on, like `Authorization`, has to be declared
+                in its `vary`.
+                """
+            ),
+        ] = None,
     ) -> Callable[[DecoratedCallable], DecoratedCallable]:
         """
         Add a *path operation* using an HTTP DELETE operation.
@@ -2957,6 +3513,9 @@ class FastAPI(Starlette):
             callbacks=callbacks,
             openapi_extra=openapi_extra,
             generate_unique_id_function=generate_unique_id_function,
+            coalesce=coalesce,
+            etag=etag,
+            cache=cache,
         )
 
     def options(
@@ -3290,6 +3849,45 @@ class FastAPI(Starlette):
                 """
             ),
         ] = Default(generate_unique_id),
+        coalesce: Annotated[
+            Optional[RequestCoalescer],
+            Doc(
+                """
+                A `RequestCoalescer` to handle only once the concurrent `GET` and `HEAD`
+                requests to this *path operation* that are the same. The others wait for
+                the response of the first one and get a copy of it.
+                """
+            ),
+        ] = None,
+        etag: Annotated[
+            Union[bool, DefaultPlaceholder],
+            Doc(
+                """
+                Add a strong `ETag` header to the `200` responses of this path operation
+                to `GET` and `HEAD` requests, and reply with an empty `304 Not Modified`
+                when the request's `If-None-Match` header matches it.
+
+                The `ETag` is a hash of the rendered body. If the path operation
+                function already sets an `ETag` header in the `Response` parameter, for
+                example with a version of the data it returns, that value is used
+                instead, and the response is not serialized at all when it matches.
+                """
+            ),
+        ] = Default(False),
+        cache: Annotated[
+            Optional[ResponseCache],
+            Doc(
+                """
+                A `ResponseCache` to cache the responses of this *path operation*, it
+                can only be used with `GET` and `HEAD` *path operations*.
+
+                A cached response is returned without parsing the request, solving the
+                dependencies, or calling the *path operation function*, so any request
+                header the response depends on, like `Authorization`, has to be declared
+                in its `vary`.
+                """
+            ),
+        ] = None,
     ) -> Callable[[DecoratedCallable], DecoratedCallable]:
         """
         Add a *path operation* using an HTTP OPTIONS operation.
@@ -3330,6 +3928,9 @@ class FastAPI(Starlette):
             callbacks=callbacks,
             openapi_extra=openapi_extra,
             generate_unique_id_function=generate_unique_id_function,
+            coalesce=coalesce,
+            etag=etag,
+            cache=cache,
         )
 
     def head(
@@ -3663,6 +4264,45 @@ class FastAPI(Starlette):
                 """
             ),
         ] = Default(generate_unique_id),
+        coalesce: Annotated[
+            Optional[RequestCoalescer],
+            Doc(
+                """
+                A `RequestCoalescer` to handle only once the concurrent `GET` and `HEAD`
+                requests to this *path operation* that are the same. The others wait for
+                the response of the first one and get a copy of it.
+                """
+            ),
+        ] = None,
+        etag: Annotated[
+            Union[bool, DefaultPlaceholder],
+            Doc(
+                """
+                Add a strong `ETag` header to the `200` responses of this path operation
+                to `GET` and `HEAD` requests, and reply with an empty `304 Not Modified`
+                when the request's `If-None-Match` header matches it.
+
+                The `ETag` is a hash of the rendered body. If the path operation
+                function already sets an `ETag` header in the `Response` parameter, for
+                example with a version of the data it returns, that value is used
+                instead, and the response is not serialized at all when it matches.
+                """
+            ),
+        ] = Default(False),
+        cache: Annotated[
+            Optional[ResponseCache],
+            Doc(
+                """
+                A `ResponseCache` to cache the responses of this *path operation*, it
+                can only be used with `GET` and `HEAD` *path operations*.
+
+                A cached response is returned without parsing the request, solving the
+                dependencies, or calling the *path operation function*, so any request
+                header the response depends on, like `Authorization`, has to be declared
+                in its `vary`.
+                """
+            ),
+        ] = None,
     ) -> Callable[[DecoratedCallable], DecoratedCallable]:
         """
         Add a *path operation* using an HTTP HEAD operation.
@@ -3703,6 +4343,9 @@ class FastAPI(Starlette):
             callbacks=callbacks,
             openapi_extra=openapi_extra,
             generate_unique_id_function=generate_unique_id_function,
+            coalesce=coalesce,
+            etag=etag,
+            cache=cache,
         )
 
     def patch(
@@ -4036,6 +4679,45 @@ class FastAPI(Starlette):
                 """
             ),
         ] = Default(generate_unique_id),
+        coalesce: Annotated[
+            Optional[RequestCoalescer],
+            Doc(
+                """
+                A `RequestCoalescer` to handle only once the concurrent `GET` and `HEAD`
+                requests to this *path operation* that are the same. The others wait for
+                the response of the first one and get a copy of it.
+                """
+            ),
+        ] = None,
+        etag: Annotated[
+            Union[bool, DefaultPlaceholder],
+            Doc(
+                """
+                Add a strong `ETag` header to the `200` responses of this path operation
+                to `GET` and `HEAD` requests, and reply with an empty `304 Not Modified`
+                when the request's `If-None-Match` header matches it.
+
+                The `ETag` is a hash of the rendered body. If the path operation
+                function already sets an `ETag` header in the `Response` parameter, for
+                example with a version of the data it returns, that value is used
+                instead, and the response is not serialized at all when it matches.
+                """
+            ),
+        ] = Default(False),
+        cache: Annotated[
+            Optional[ResponseCache],
+            Doc(
+                """
+                A `ResponseCache` to cache the responses of this *path operation*, it
+                can only be used with `GET` and `HEAD` *path operations*.
+
+                A cached response is returned without parsing the request, solving the
+                dependencies, or calling the *path operation function*, so any request
+                header the response depends on, like `Authorization`, has to be declared
+                in its `vary`.
+                """
+            ),
+        ] = None,
     ) -> Callable[[DecoratedCallable], DecoratedCallable]:
         """
         Add a *path operation* using an HTTP PATCH operation.
@@ -4081,6 +4763,9 @@ class FastAPI(Starlette):
             callbacks=callbacks,
             openapi_extra=openapi_extra,
             generate_unique_id_function=generate_unique_id_function,
+            coalesce=coalesce,
+            etag=etag,
+            cache=cache,
         )
 
     def trace(
@@ -4414,6 +5099,45 @@ class FastAPI(Starlette):
                 """
             ),
         ] = Default(generate_unique_id),
+        coalesce: Annotated[
+            Optional[RequestCoalescer],
+            Doc(
+                """
+                A `RequestCoalescer` to handle only once the concurrent `GET` and `HEAD`
+                requests to this *path operation* that are the same. The others wait for
+                the response of the first one and get a copy of it.
+                """
+            ),
+        ] = None,
+        etag: Annotated[
+            Union[bool, DefaultPlaceholder],
+            Doc(
+                """
+                Add a strong `ETag` header to the `200` responses of this path operation
+                to `GET` and `HEAD` requests, and reply with an empty `304 Not Modified`
+                when the request's `If-None-Match` header matches it.
+
+                The `ETag` is a hash of the rendered body. If the path operation
+                function already sets an `ETag` header in the `Response` parameter, for
+                example with a version of the data it returns, that value is used
+                instead, and the response is not serialized at all when it matches.
+                """
+            ),
+        ] = Default(False),
+        cache: Annotated[
+            Optional[ResponseCache],
+            Doc(
+                """
+                A `ResponseCache` to cache the responses of this *path operation*, it
+                can only be used with `GET` and `HEAD` *path operations*.
+
+                A cached response is returned without parsing the request, solving the
+                dependencies, or calling the *path operation function*, so any request
+                header the response depends on, like `Authorization`, has to be declared
+                in its `vary`.
+                """
+            ),
+        ] = None,
     ) -> Callable[[DecoratedCallable], DecoratedCallable]:
         """
         Add a *path operation* using an HTTP TRACE operation.
@@ -4454,6 +5178,9 @@ class FastAPI(Starlette):
             callbacks=callbacks,
             openapi_extra=openapi_extra,
             generate_unique_id_function=generate_unique_id_function,
+            coalesce=coalesce,
+            etag=etag,
+            cache=cache,
         )
 
     def websocket_route(
@@ -0,0 +1,622 @@
+import gzip
+import hashlib
+import time
+from collections import OrderedDict
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
+from typing import OrderedDict as OrderedDictType
+
+import anyio
+from starlette.background import BackgroundTask
+from starlette.exceptions import HTTPException
+from starlette.requests import Request
+from starlette.responses import Response
+from typing_extensions import Annotated, Doc
+
+try:
+    import brotli
+except ImportError:  # pragma: nocover
+    brotli = None
+
+_MISSING: Any = object()
+
+
+class TTLCache:
+    """
+    A size-bounded cache of values that expire after some time, shared by all the
+    requests.
+
+    When it's full, the least recently used value is evicted.
+
+    Pass it to `Depends()` to cache the result of a dependency across requests,
+    keyed by the values of its parameters.
+
+    ## Example
+
+    ```python
+    from fastapi import Depends, FastAPI, Header
+    from fastapi.cache import TTLCache
+
+    app = FastAPI()
+
+
+    async def get_user(authorization: str = Header()):
+        return await load_user_from_token(authorization)
+
+
+    @app.get("/users/me")
+    async def read_me(
+        user=Depends(get_user, cache=TTLCache(maxsize=1024, ttl=60)),
+    ):
+        return user
+    ```
+    """
+
+    def __init__(
+        self,
+        maxsize: Annotated[
+            int,
+            Doc(
+                """
+                The maximum number of values to keep. When there are more, the least
+                recently used ones are evicted.
+                """
+            ),
+        ] = 128,
+        ttl: Annotated[
+            Optional[float],
+            Doc(
+                """
+                The number of seconds after which a value expires. If `None`, the
+                values only expire when they are evicted.
+                """
+            ),
+        ] = None,
+    ) -> None:
+        assert maxsize > 0, "maxsize must be greater than 0"
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._data: OrderedDictType[Hashable, Tuple[Optional[float], Any]] = (
+            OrderedDict()
+        )
+        self._in_flight: Dict[Hashable, anyio.Event] = {}
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self._get(key) is not _MISSING
+
+    def _get(self, key: Hashable) -> Any:
+        item = self._data.get(key)
+        if item is None:
+            return _MISSING
+        expires_at, value = item
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._data[key]
+            return _MISSING
+        self._data.move_to_end(key)
+        return value
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        value = self._get(key)
+        if value is _MISSING:
+            self.misses += 1
+            return default
+        self.hits += 1
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        expires_at = None if self.ttl is None else time.monotonic() + self.ttl
+        self._data[key] = (expires_at, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    async def get_or_set(
+        self, key: Hashable, factory: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """
+        Return the value for `key`, or await `factory()` to create it.
+
+        Concurrent misses for the same key only call `factory()` once, the rest
+        wait for its value. If it raises, the next one waiting tries again.
+        """
+        while True:
+            value = self._get(key)
+            if value is not _MISSING:
+                self.hits += 1
+                return value
+            in_flight = self._in_flight.get(key)
+            if in_flight is None:
+                break
+            await in_flight.wait()
+        self.misses += 1
+        event = self._in_flight[key] = anyio.Event()
+        try:
+            value = await factory()
+            self.set(key, value)
+        finally:
+            del self._in_flight[key]
+            event.set()
+        return value
+
+
+def _get_request_key(request: Request, vary: List[str]) -> Hashable:
+    # Sorted by name only, the order of the values of a repeated param matters
+    query = sorted(request.query_params.multi_items(), key=lambda item: item[0])
+    headers = request.headers
+    return (
+        request.method,
+        request.url.path,
+        tuple(query),
+        tuple(headers.get(header) for header in vary),
+    )
+
+
+# The request headers that make a response specific to the user, a response to a
+# request with any of them is only shared when the header is part of the key
+_CREDENTIALS_HEADERS = ("authorization", "cookie")
+
+
+def _has_undeclared_credentials(request: Request, vary: List[str]) -> bool:
+    headers = request.headers
+    return any(
+        header in headers and header not in vary for header in _CREDENTIALS_HEADERS
+    )
+
+
+class _CachedResponse:
+    __slots__ = ("status_code", "raw_headers", "body", "fresh_until")
+
+    def __init__(
+        self,
+        status_code: int,
+        raw_headers: List[Tuple[bytes, bytes]],
+        body: bytes,
+        fresh_until: Optional[float],
+    ) -> None:
+        self.status_code = status_code
+        self.raw_headers = raw_headers
+        self.body = body
+        self.fresh_until = fresh_until
+
+    def to_response(self) -> Response:
+        response = Response(status_code=self.status_code)
+        response.body = self.body
+        response.raw_headers = list(self.raw_headers)
+        return response
+
+
+class ResponseCache:
+    """
+    A size-bounded cache of the rendered responses of a *path operation* for `GET`
+    and `HEAD` requests, shared by all the requests.
+
+    The responses are keyed by the method, the path, the query parameters and the
+    headers declared in `vary`. A cached response is returned right away, without
+    parsing the request, solving the dependencies, or calling the *path operation
+    function*. When it's full, the least recently used response is evicted.
+
+    Only `200` responses with a body are cached, not the ones that set cookies or
+    that have a `Cache-Control: no-store` or `private` header. Requests with an
+    `Authorization` or `Cookie` header are not cached, unless that header is
+    declared in `vary`.
+
+    ## Example
+
+    ```python
+    from fastapi import FastAPI
+    from fastapi.cache import ResponseCache
+
+    app = FastAPI()
+
+
+    @app.get(
+        "/items/",
+        cache=ResponseCache(ttl=30, vary=["authorization"]),
+    )
+    async def read_items():
+        return await load_items()
+    ```
+    """
+
+    def __init__(
+        self,
+        ttl: Annotated[
+            Optional[float],
+            Doc(
+                """
+                The number of seconds a response is fresh. If `None`, the responses
+                only expire when they are evicted.
+                """
+            ),
+        ] = 60,
+        maxsize: Annotated[
+            int,
+            Doc(
+                """
+                The maximum number of responses to keep. When there are more, the
+                least recently used ones are evicted.
+                """
+            ),
+        ] = 128,
+        vary: Annotated[
+            Optional[Sequence[str]],
+            Doc(
+                """
+                The request headers the response depends on, they are part of the
+                cache key.
+
+                As the dependencies are not solved for cached responses, any header
+                used to authenticate the request has to be declared here. Requests
+                with an `Authorization` or `Cookie` header that is not declared
+                here are never cached.
+                """
+            ),
+        ] = None,
+        stale_while_revalidate: Annotated[
+            float,
+            Doc(
+                """
+                The number of seconds after a response expires during which it's
+                still returned, while it's refreshed in the background after it's
+                sent.
+                """
+            ),
+        ] = 0,
+    ) -> None:
+        self.ttl = ttl
+        self.vary = [header.lower() for header in vary or []]
+        self.stale_while_revalidate = stale_while_revalidate
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self._responses = TTLCache(
+            maxsize=maxsize, ttl=None if ttl is None else ttl + stale_while_revalidate
+        )
+        self._revalidating: Set[Hashable] = set()
+
+    def __len__(self) -> int:
+        return len(self._responses)
+
+    def clear(self) -> None:
+        self._responses.clear()
+
+    def get_key(self, request: Request) -> Hashable:
+        return _get_request_key(request, self.vary)
+
+    def set(self, key: Hashable, response: Response) -> bool:
+        """
+        Store the response for the key, if it can be cached, and return if it was
+        stored.
+        """
+        body = getattr(response, "body", None)
+        if response.status_code != 200 or not isinstance(body, bytes):
+            return False
+        for name, value in response.raw_headers:
+            if name == b"set-cookie":
+                return False
+            if name == b"cache-control" and (
+                b"no-store" in value.lower() or b"private" in value.lower()
+            ):
+                return False
+        fresh_until = None if self.ttl is None else time.monotonic() + self.ttl
+        self._responses.set(
+            key,
+            _CachedResponse(
+                response.status_code, list(response.raw_headers), body, fresh_until
+            ),
+        )
+        return True
+
+    async def get_or_render(
+        self, request: Request, render: Callable[[Request], Awaitable[Response]]
+    ) -> Response:
+        """
+        Return the cached response for the request, or await `render(request)` to
+        create it.
+        """
+        if request.method not in ("GET", "HEAD") or _has_undeclared_credentials(
+            request, self.vary
+        ):
+            return await render(request)
+        key = self.get_key(request)
+        cached: Optional[_CachedResponse] = self._responses.get(key)
+        if cached is None:
+            self.misses += 1
+            response = await render(request)
+            self.set(key, response)
+            return response
+        response = cached.to_response()
+        if cached.fresh_until is None or time.monotonic() < cached.fresh_until:
+            self.hits += 1
+            return response
+        self.stale_hits += 1
+        if key not in self._revalidating:
+            self._revalidating.add(key)
+            response.background = BackgroundTask(self._revalidate, key, request, render)
+        return response
+
+    async def _revalidate(
+        self,
+        key: Hashable,
+        request: Request,
+        render: Callable[[Request], Awaitable[Response]],
+    ) -> None:
+        try:
+            response = await render(request)
+        except HTTPException:
+            self._responses.delete(key)
+            return
+        except Exception:
+            self._responses.delete(key)
+            raise
+        finally:
+            self._revalidating.discard(key)
+        if not self.set(key, response):
+            self._responses.delete(key)
+        if response.background is not None:
+            await response.background()
+
+
+class _InFlightRequest:
+    __slots__ = ("event", "response", "exception")
+
+    def __init__(self) -> None:
+        self.event = anyio.Event()
+        self.response: Optional[_CachedResponse] = None
+        self.exception: Optional[Exception] = None
+
+
+def _copy_exception(exception: Exception) -> Exception:
+    # A copy for each waiting request, raising the same exception in each one would
+    # add their frames to its traceback. Without calling __init__(), the args don't
+    # always match its parameters
+    exception_copy: Exception = type(exception).__new__(
+        type(exception), *exception.args
+    )
+    exception_copy.__dict__.update(exception.__dict__)
+    return exception_copy
+
+
+class RequestCoalescer:
+    """
+    Handle only once the concurrent `GET` and `HEAD` requests to a *path operation*
+    that are the same.
+
+    The requests are the same when they have the same method, path, query
+    parameters and headers declared in `vary`. While the first one is handled, the
+    others wait for its response, and each one gets a copy of it. The background
+    tasks of the response only run once, for the first request.
+
+    Requests with an `Authorization` or `Cookie` header are always handled on their
+    own, unless that header is declared in `vary`.
+
+    If the first request raises an exception, the others raise a copy of it. If
+    its response can't be copied because it's streamed or it sets cookies, the
+    others are handled on their own.
+
+    ## Example
+
+    ```python
+    from fastapi import FastAPI
+    from fastapi.cache import RequestCoalescer
+
+    app = FastAPI()
+
+
+    @app.get("/reports/daily", coalesce=RequestCoalescer(vary=["authorization"]))
+    async def read_daily_report():
+        return await build_daily_report()
+    ```
+    """
+
+    def __init__(
+        self,
+        vary: Annotated[
+            Optional[Sequence[str]],
+            Doc(
+                """
+                The request headers the response depends on, they are part of the
+                key that decides which requests are the same.
+
+                As the dependencies are not solved for the requests that wait, any
+                header used to authenticate the request has to be declared here.
+                Requests with an `Authorization` or `Cookie` header that is not
+                declared here are never coalesced.
+                """
+            ),
+        ] = None,
+    ) -> None:
+        self.vary = [header.lower() for header in vary or []]
+        self.coalesced = 0
+        self._in_flight: Dict[Hashable, _InFlightRequest] = {}
+
+    def get_key(self, request: Request) -> Hashable:
+        return _get_request_key(request, self.vary)
+
+    async def get_or_render(
+        self, request: Request, render: Callable[[Request], Awaitable[Response]]
+    ) -> Response:
+        """
+        Await `render(request)`, or the response of the same request being handled
+        already, and return it.
+        """
+        if request.method not in ("GET", "HEAD") or _has_undeclared_credentials(
+            request, self.vary
+        ):
+            return await render(request)
+        key = self.get_key(request)
+        in_flight = self._in_flight.get(key)
+        if in_flight is not None:
+            await in_flight.event.wait()
+            if in_flight.exception is not None:
+                self.coalesced += 1
+                raise _copy_exception(in_flight.exception) from in_flight.exception
+            if in_flight.response is not None:
+                self.coalesced += 1
+                return in_flight.response.to_response()
+            return await render(request)
+        in_flight = self._in_flight[key] = _InFlightRequest()
+        try:
+            response = await render(request)
+            body = getattr(response, "body", None)
+            if isinstance(body, bytes) and all(
+                name != b"set-cookie" for name, _ in response.raw_headers
+            ):
+                # Copied without the background tasks, they only run once
+                in_flight.response = _CachedResponse(
+                    response.status_code, list(response.raw_headers), body, None
+                )
+        except Exception as e:
+            in_flight.exception = e
+            raise
+        finally:
+            del self._in_flight[key]
+            in_flight.event.set()
+        return response
+
+
+# The headers a 200 response would have that are kept in a 304 response
+_NOT_MODIFIED_HEADERS = {
+    b"cache-control",
+    b"content-location",
+    b"date",
+    b"etag",
+    b"expires",
+    b"vary",
+}
+
+
+def _get_etag(body: bytes) -> str:
+    # A strong validator, a collision would return 304 for changed content, so
+    # a 128-bit digest, BLAKE2 is still fast
+    return f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def _quote_etag(value: str) -> str:
+    # A version key set as the ETag header is used as the opaque tag
+    if value.startswith('"') or value.startswith('W/"'):
+        return value
+    return f'"{value}"'
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    # If-None-Match uses the weak comparison
+    etag = etag[2:] if etag.startswith("W/") else etag
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag.startswith("W/"):
+            tag = tag[2:]
+        if tag == etag:
+            return True
+    return False
+
+
+def _get_not_modified_response(response: Response) -> Response:
+    not_modified = Response(status_code=304, background=response.background)
+    not_modified.raw_headers = [
+        (name, value)
+        for name, value in response.raw_headers
+        if name in _NOT_MODIFIED_HEADERS
+    ]
+    return not_modified
+
+
+def _set_etag(response: Response) -> None:
+    # Only for a 200 response with a body that doesn't have one
+    if response.status_code != 200 or "etag" in response.headers:
+        return
+    body = getattr(response, "body", None)
+    if isinstance(body, bytes):
+        response.headers["etag"] = _get_etag(body)
+
+
+def _get_conditional_response(request: Request, response: Response) -> Response:
+    # An empty 304 response if the client already has this version
+    if request.method not in ("GET", "HEAD") or response.status_code != 200:
+        return response
+    etag = response.headers.get("etag")
+    if etag is not None and _etag_matches(request, etag):
+        return _get_not_modified_response(response)
+    return response
+
+
+def _get_accepted_encodings(request: Request) -> Set[str]:
+    accepted: Set[str] = set()
+    for item in request.headers.get("accept-encoding", "").split(","):
+        coding, _, params = item.partition(";")
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0
+        coding = coding.strip().lower()
+        if coding and quality > 0:
+            accepted.add(coding)
+    return accepted
+
+
+class _PrecompressedContent:
+    """
+    The rendered bytes of a document, with their compressed variants, each with its
+    own strong ETag.
+    """
+
+    def __init__(self, body: bytes, media_type: str) -> None:
+        self.media_type = media_type
+        self.variants: Dict[str, Tuple[bytes, str]] = {
+            "identity": (body, _get_etag(body))
+        }
+        compressed = {"gzip": gzip.compress(body, compresslevel=9, mtime=0)}
+        if brotli is not None:  # pragma: nocover
+            compressed["br"] = brotli.compress(body)
+        for encoding, compressed_body in compressed.items():
+            # Not worth it for small documents
+            if len(compressed_body) < len(body):
+                self.variants[encoding] = (compressed_body, _get_etag(compressed_body))
+
+    def get_response(self, request: Request) -> Response:
+        accepted = _get_accepted_encodings(request)
+        encoding = "identity"
+        for preferred in ("br", "gzip"):
+            if preferred in self.variants and (
+                preferred in accepted or "*" in accepted
+            ):
+                encoding = preferred
+                break
+        body, etag = self.variants[encoding]
+        headers = {"etag": etag, "vary": "Accept-Encoding"}
+        if encoding != "identity":
+            headers["content-encoding"] = encoding
+        response = Response(body, media_type=self.media_type, headers=headers)
+        if _etag_matches(request, etag):
+            return _get_not_modified_response(response)
+        return response
@@ -2,6 +2,7 @@ from dataclasses import dataclass, field
 from typing import Any, Callable, List, Optional, Sequence, Tuple
 
 from fastapi._compat import ModelField
+from fastapi.cache import TTLCache
 from fastapi.security.base import SecurityBase
 
 
@@ -30,6 +31,9 @@ class Dependant:
     security_scopes_param_name: Optional[str] = None
     security_scopes: Optional[List[str]] = None
     use_cache: bool = True
+    concurrent: bool = False
+    scope: str = "request"
+    cache: Optional[TTLCache] = None
     path: Optional[str] = None
     cache_key: Tuple[Optional[Callable[..., Any]], Tuple[str, ...]] = field(init=False)
 
@@ -1,22 +1,27 @@
 import inspect
 from contextlib import AsyncExitStack, contextmanager
-from copy import copy, deepcopy
+from copy import copy
 from dataclasses import dataclass
+from functools import partial
 from typing import (
     Any,
     Callable,
     Coroutine,
     Dict,
     ForwardRef,
+    FrozenSet,
+    Hashable,
     List,
     Mapping,
     Optional,
     Sequence,
+    Set,
     Tuple,
     Type,
     Union,
     cast,
 )
+from weakref import WeakKeyDictionary
 
 import anyio
 from fastapi import params
@@ -26,7 +31,9 @@ from fastapi._compat import (
     ModelField,
     RequiredParam,
     Undefined,
+    _model_dump,
     _regenerate_error_with_loc,
+    copy_field_default,
     copy_field_info,
     create_body_model,
     evaluate_forwardref,
@@ -47,6 +54,7 @@ from fastapi._compat import (
     value_is_sequence,
 )
 from fastapi.background import BackgroundTasks
+from fastapi.cache import TTLCache
 from fastapi.concurrency import (
     asynccontextmanager,
     contextmanager_in_threadpool,
@@ -165,12 +173,66 @@ def get_sub_dependant(
         name=name,
         security_scopes=security_scopes,
         use_cache=depends.use_cache,
+        concurrent=depends.concurrent,
+        scope=depends.scope,
+        cache=depends.cache,
     )
     if security_requirement:
         sub_dependant.security_requirements.append(security_requirement)
+    if depends.scope == "app":
+        _check_app_scoped_dependant(sub_dependant)
+    if depends.cache is not None:
+        _check_cached_dependant(sub_dependant)
     return sub_dependant
 
 
+def _check_cached_dependant(dependant: Dependant) -> None:
+    call = cast(Callable[..., Any], dependant.call)
+    assert not (is_gen_callable(call) or is_async_gen_callable(call)), (
+        f"Dependencies with yield can't be cached across requests: {call}"
+    )
+    assert not (
+        dependant.request_param_name
+        or dependant.websocket_param_name
+        or dependant.http_connection_param_name
+        or dependant.response_param_name
+        or dependant.background_tasks_param_name
+    ), (
+        "Dependencies cached across requests can't use the request, websocket, "
+        f"response, or background tasks: {call}"
+    )
+
+
+def _check_app_scoped_dependant(dependant: Dependant) -> None:
+    flat_dependant = get_flat_dependant(dependant)
+    assert not (
+        flat_dependant.path_params
+        or flat_dependant.query_params
+        or flat_dependant.header_params
+        or flat_dependant.cookie_params
+        or flat_dependant.body_params
+    ), (
+        f'Dependencies with scope="app" can\'t declare request parameters: '
+        f"{dependant.call}"
+    )
+
+    def check_special_params(sub_dependant: Dependant) -> None:
+        assert not (
+            sub_dependant.request_param_name
+            or sub_dependant.websocket_param_name
+            or sub_dependant.http_connection_param_name
+            or sub_dependant.response_param_name
+            or sub_dependant.background_tasks_param_name
+        ), (
+            f'Dependencies with scope="app" can\'t use the request, websocket, '
+            f"response, or background tasks: {sub_dependant.call}"
+        )
+        for sub_sub_dependant in sub_dependant.dependencies:
+            check_special_params(sub_sub_dependant)
+
+    check_special_params(dependant)
+
+
 CacheKey = Tuple[Optional[Callable[..., Any]], Tuple[str, ...]]
 
 
@@ -262,6 +324,63 @@ def get_typed_return_annotation(call: Callable[..., Any]) -> Any:
     return get_typed_annotation(annotation, globalns)
 
 
+@dataclass
+class _DependantAnalysis:
+    # The Dependant of a callable, without the callable and the settings of its
+    # Depends(), copied for each use and never modified
+    dependant: Dependant
+    # The security scopes list the analysis was given, the dependants that share
+    # it share the list of each use instead
+    security_scopes: Optional[List[str]]
+    # The scopes the analysis added to that list
+    added_security_scopes: List[str]
+
+
+# The analyses of each callable, by the path param names and the security scopes
+_Analyses = Dict[Hashable, _DependantAnalysis]
+_dependant_analyses: "WeakKeyDictionary[Callable[..., Any], _Analyses]" = (
+    WeakKeyDictionary()
+)
+
+
+def _copy_dependant(
+    dependant: Dependant,
+    *,
+    path: str,
+    analysis_scopes: Optional[List[str]],
+    security_scopes: Optional[List[str]],
+) -> Dependant:
+    new_dependant = copy(dependant)
+    new_dependant.path_params = dependant.path_params.copy()
+    new_dependant.query_params = dependant.query_params.copy()
+    new_dependant.header_params = dependant.header_params.copy()
+    new_dependant.cookie_params = dependant.cookie_params.copy()
+    new_dependant.body_params = dependant.body_params.copy()
+    # Like the security scopes, the scopes of the requirements share the list of
+    # each use, the scopes of sibling dependencies are added to it later
+    new_dependant.security_requirements = [
+        SecurityRequirement(
+            security_scheme=requirement.security_scheme, scopes=security_scopes
+        )
+        if analysis_scopes is not None and requirement.scopes is analysis_scopes
+        else requirement
+        for requirement in dependant.security_requirements
+    ]
+    new_dependant.dependencies = [
+        _copy_dependant(
+            sub_dependant,
+            path=path,
+            analysis_scopes=analysis_scopes,
+            security_scopes=security_scopes,
+        )
+        for sub_dependant in dependant.dependencies
+    ]
+    new_dependant.path = path
+    if analysis_scopes is not None and dependant.security_scopes is analysis_scopes:
+        new_dependant.security_scopes = security_scopes
+    return new_dependant
+
+
 def get_dependant(
     *,
     path: str,
@@ -269,17 +388,62 @@ def get_dependant(
     name: Optional[str] = None,
     security_scopes: Optional[List[str]] = None,
     use_cache: bool = True,
+    concurrent: bool = False,
+    scope: str = "request",
+    cache: Optional[TTLCache] = None,
 ) -> Dependant:
-    path_param_names = get_path_param_names(path)
-    endpoint_signature = get_typed_signature(call)
-    signature_params = endpoint_signature.parameters
-    dependant = Dependant(
-        call=call,
-        name=name,
+    # The analysis of a callable only depends on which of its params are path params
+    # and on the security scopes, it's shared by all the routes that use it
+    analysis_key = (
+        frozenset(get_path_param_names(path)),
+        None if security_scopes is None else tuple(security_scopes),
+    )
+    try:
+        analyses = _dependant_analyses.setdefault(call, {})
+    except TypeError:
+        # Not hashable or not weakly referenceable
+        analyses = {}
+    analysis = analyses.get(analysis_key)
+    if analysis is None:
+        analysis_scopes = None if security_scopes is None else list(security_scopes)
+        analyzed = _analyze_dependant(
+            path=path, call=call, security_scopes=analysis_scopes
+        )
+        analyzed.call = None
+        analyzed.cache_key = (None, analyzed.cache_key[1])
+        analysis = analyses[analysis_key] = _DependantAnalysis(
+            dependant=analyzed,
+            security_scopes=analysis_scopes,
+            added_security_scopes=(analysis_scopes or [])[len(security_scopes or []) :],
+        )
+    if security_scopes is not None:
+        security_scopes.extend(analysis.added_security_scopes)
+    dependant = _copy_dependant(
+        analysis.dependant,
         path=path,
+        analysis_scopes=analysis.security_scopes,
         security_scopes=security_scopes,
-        use_cache=use_cache,
     )
+    dependant.call = call
+    dependant.name = name
+    dependant.use_cache = use_cache
+    dependant.concurrent = concurrent
+    dependant.scope = scope
+    dependant.cache = cache
+    dependant.cache_key = (call, analysis.dependant.cache_key[1])
+    return dependant
+
+
+def _analyze_dependant(
+    *,
+    path: str,
+    call: Callable[..., Any],
+    security_scopes: Optional[List[str]],
+) -> Dependant:
+    path_param_names = get_path_param_names(path)
+    endpoint_signature = get_typed_signature(call)
+    signature_params = endpoint_signature.parameters
+    dependant = Dependant(call=call, path=path, security_scopes=security_scopes)
     for param_name, param in signature_params.items():
         is_path_param = param_name in path_param_names
         param_details = analyze_param(
@@ -569,123 +733,614 @@ class SolvedDependency:
     dependency_cache: Dict[Tuple[Callable[..., Any], Tuple[str]], Any]
 
 
-async def solve_dependencies(
+@dataclass
+class ParamsExtractor:
+    """
+    Extracts the parameters of a `Dependant` from one source of the request (path,
+    query, headers, or cookies), with the aliases and the fields that are sequences
+    already decided when the route is created.
+    """
+
+    in_: params.ParamTypes
+    fields: List[ModelField]
+    # The field, the key to get it from the request, and if it's a sequence
+    entries: List[Tuple[ModelField, str, bool]]
+    # A single Pydantic model declaring all the parameters in this source, if any
+    model_field: Optional[ModelField] = None
+    processed_keys: FrozenSet[str] = frozenset()
+
+    def __post_init__(self) -> None:
+        # Only query params and headers can have several values for the same key
+        self.use_getlist = self.in_ in (
+            params.ParamTypes.query,
+            params.ParamTypes.header,
+        )
+
+    def extract(
+        self, received_params: Union[Mapping[str, Any], QueryParams, Headers]
+    ) -> Tuple[Dict[str, Any], List[Any]]:
+        use_getlist = self.use_getlist
+        if self.model_field is not None:
+            params_to_process: Dict[str, Any] = {}
+            for field, key, is_sequence in self.entries:
+                value = _get_param_value(
+                    field, received_params, key, is_sequence, use_getlist
+                )
+                if value is not None:
+                    params_to_process[field.name] = value
+            for key, value in received_params.items():
+                if key not in self.processed_keys:
+                    params_to_process[key] = value
+            v_, errors_ = _validate_value_with_model_field(
+                field=self.model_field,
+                value=params_to_process,
+                values={},
+                loc=(self.in_.value,),
+            )
+            return {self.model_field.name: v_}, errors_
+        values: Dict[str, Any] = {}
+        errors: List[Any] = []
+        for field, key, is_sequence in self.entries:
+            value = _get_param_value(
+                field, received_params, key, is_sequence, use_getlist
+            )
+            v_, errors_ = _validate_value_with_model_field(
+                field=field, value=value, values=values, loc=(self.in_.value, key)
+            )
+            if errors_:
+                errors.extend(errors_)
+            else:
+                values[field.name] = v_
+        return values, errors
+
+
+def get_params_extractor(
+    fields: List[ModelField], *, in_: params.ParamTypes
+) -> ParamsExtractor:
+    if len(fields) == 1 and lenient_issubclass(fields[0].type_, BaseModel):
+        model_field = fields[0]
+        # If headers are in a Pydantic model, the way to disable convert_underscores
+        # would be with Header(convert_underscores=False) at the Pydantic model level
+        default_convert_underscores = getattr(
+            model_field.field_info, "convert_underscores", True
+        )
+        entries: List[Tuple[ModelField, str, bool]] = []
+        processed_keys: Set[str] = set()
+        for field in get_cached_model_fields(model_field.type_):
+            key = field.alias
+            # Fields extracted from a Pydantic Model for a header don't have a
+            # FieldInfo of type Header with the default convert_underscores=True
+            if in_ == params.ParamTypes.header and getattr(
+                field.field_info, "convert_underscores", default_convert_underscores
+            ):
+                key = (
+                    field.alias
+                    if field.alias != field.name
+                    else field.name.replace("_", "-")
+                )
+            entries.append((field, key, is_sequence_field(field)))
+            processed_keys.update((key, field.name))
+        return ParamsExtractor(
+            in_=in_,
+            fields=fields,
+            entries=entries,
+            model_field=model_field,
+            processed_keys=frozenset(processed_keys),
+        )
+    for field in fields:
+        assert isinstance(field.field_info, params.Param), (
+            "Params must be subclasses of Param"
+        )
+    return ParamsExtractor(
+        in_=in_,
+        fields=fields,
+        entries=[(field, field.alias, is_sequence_field(field)) for field in fields],
+    )
+
+
+def get_params_extractors(dependant: Dependant) -> List[ParamsExtractor]:
+    extractors = []
+    for in_, fields in (
+        (params.ParamTypes.path, dependant.path_params),
+        (params.ParamTypes.query, dependant.query_params),
+        (params.ParamTypes.header, dependant.header_params),
+        (params.ParamTypes.cookie, dependant.cookie_params),
+    ):
+        if fields:
+            extractors.append(get_params_extractor(fields, in_=in_))
+    return extractors
+
+
+def _get_params_source(
+    request: Union[Request, WebSocket], in_: params.ParamTypes
+) -> Union[Mapping[str, Any], QueryParams, Headers]:
+    if in_ == params.ParamTypes.path:
+        return request.path_params
+    elif in_ == params.ParamTypes.query:
+        return request.query_params
+    elif in_ == params.ParamTypes.header:
+        return request.headers
+    return request.cookies
+
+
+@dataclass
+class DependencyStep:
+    """
+    A single dependency to solve as part of a `DependencyPlan`, with everything
+    that doesn't depend on the request already decided.
+    """
+
+    dependant: Dependant
+    call: Optional[Callable[..., Any]]
+    # The cache key and use_cache of the declared dependency, even when overridden
+    cache_key: CacheKey
+    use_cache: bool
+    # One of "generator", "async_generator", "coroutine", "sync", or "app" for
+    # dependencies with scope="app", solved by the AppDependencyStore
+    kind: str
+    # The parameter name (if any) and the index of the step of each sub-dependency,
+    # cached sub-dependencies point to the step that solved them first
+    sub_dependencies: List[Tuple[Optional[str], int]]
+    # The path, query, header, and cookie parameters declared by the dependency
+    params_extractors: List[ParamsExtractor]
+
+
+@dataclass
+class ConcurrentDependencies:
+    """
+    Sibling dependencies that don't share sub-dependencies, solved at the same
+    time. Each branch is solved in order, as a regular plan would.
+    """
+
+    branches: List[List["PlanUnit"]]
+
+
+PlanUnit = Union[int, ConcurrentDependencies]
+
+
+@dataclass
+class DependencyPlan:
+    """
+    The dependencies of a `Dependant` flattened in the order they are solved, each
+    sub-dependency before the dependency that uses it. The last step is the
+    `Dependant` itself, its call is not called, only its values are returned.
+    """
+
+    steps: List[DependencyStep]
+    # The indexes of the steps in the order they are solved, with the ones that
+    # can be solved concurrently grouped together
+    units: List[PlanUnit]
+    concurrent: bool = False
+    # Whether any step is a dependency with scope="app"
+    has_app_scoped: bool = False
+
+
+def _get_call_kind(call: Callable[..., Any]) -> str:
+    if is_gen_callable(call):
+        return "generator"
+    elif is_async_gen_callable(call):
+        return "async_generator"
+    elif is_coroutine_callable(call):
+        return "coroutine"
+    return "sync"
+
+
+def get_dependency_plan(
+    dependant: Dependant,
+    *,
+    dependency_overrides_provider: Optional[Any] = None,
+    concurrent: bool = False,
+) -> DependencyPlan:
+    dependency_overrides: Dict[Callable[..., Any], Callable[..., Any]] = (
+        getattr(dependency_overrides_provider, "dependency_overrides", None) or {}
+    )
+    steps: List[DependencyStep] = []
+    solved_steps: Dict[CacheKey, int] = {}
+
+    def can_run_concurrently(start: int, end: int, group_start: int) -> bool:
+        # Only plain async functions, the teardown order of dependencies with
+        # yield is decided by the order they are entered in the exit stack
+        if steps[end].kind != "coroutine":
+            return False
+        for step in steps[start : end + 1]:
+            if step.kind in ("generator", "async_generator"):
+                return False
+            for _, sub_index in step.sub_dependencies:
+                if group_start <= sub_index < start:
+                    return False
+        return True
+
+    def add_step(
+        use_dependant: Dependant,
+        *,
+        call: Optional[Callable[..., Any]],
+        cache_key: CacheKey,
+        use_cache: bool,
+    ) -> Tuple[int, List[PlanUnit]]:
+        sub_dependencies: List[Tuple[Optional[str], int]] = []
+        units: List[PlanUnit] = []
+        group: List[List[PlanUnit]] = []
+        group_start = 0
+
+        def flush_group() -> None:
+            if len(group) == 1:
+                units.extend(group[0])
+            elif group:
+                units.append(ConcurrentDependencies(branches=group.copy()))
+            group.clear()
+
+        for sub_dependant in use_dependant.dependencies:
+            if sub_dependant.use_cache and sub_dependant.cache_key in solved_steps:
+                sub_dependencies.append(
+                    (sub_dependant.name, solved_steps[sub_dependant.cache_key])
+                )
+                continue
+            original_call = cast(Callable[..., Any], sub_dependant.call)
+            sub_call = dependency_overrides.get(original_call, original_call)
+            use_sub_dependant = sub_dependant
+            if sub_call is not original_call:
+                use_path: str = sub_dependant.path  # type: ignore
+                use_sub_dependant = get_dependant(
+                    path=use_path,
+                    call=sub_call,
+                    name=sub_dependant.name,
+                    security_scopes=sub_dependant.security_scopes,
+                    concurrent=sub_dependant.concurrent,
+                    scope=sub_dependant.scope,
+                    cache=sub_dependant.cache,
+                )
+            if use_sub_dependant.scope == "app":
+                # Solved once by the AppDependencyStore, with its sub-dependencies
+                flush_group()
+                steps.append(
+                    DependencyStep(
+                        dependant=use_sub_dependant,
+                        call=sub_call,
+                        cache_key=sub_dependant.cache_key,
+                        use_cache=sub_dependant.use_cache,
+                        kind="app",
+                        sub_dependencies=[],
+                        params_extractors=[],
+                    )
+                )
+                sub_index = len(steps) - 1
+                solved_steps.setdefault(sub_dependant.cache_key, sub_index)
+                sub_dependencies.append((sub_dependant.name, sub_index))
+                units.append(sub_index)
+                continue
+            start = len(steps)
+            sub_index, sub_units = add_step(
+                use_sub_dependant,
+                call=sub_call,
+                cache_key=sub_dependant.cache_key,
+                use_cache=sub_dependant.use_cache,
+            )
+            sub_dependencies.append((sub_dependant.name, sub_index))
+            if not (concurrent or sub_dependant.concurrent):
+                flush_group()
+                units.extend(sub_units)
+            elif group and can_run_concurrently(start, sub_index, group_start):
+                group.append(sub_units)
+            elif can_run_concurrently(start, sub_index, start):
+                flush_group()
+                group_start = start
+                group.append(sub_units)
+            else:
+                flush_group()
+                units.extend(sub_units)
+        flush_group()
+        steps.append(
+            DependencyStep(
+                dependant=use_dependant,
+                call=call,
+                cache_key=cache_key,
+                use_cache=use_cache,
+                kind=_get_call_kind(call) if call is not None else "sync",
+                sub_dependencies=sub_dependencies,
+                params_extractors=get_params_extractors(use_dependant),
+            )
+        )
+        index = len(steps) - 1
+        if call is not None:
+            solved_steps.setdefault(cache_key, index)
+        units.append(index)
+        return index, units
+
+    _, units = add_step(
+        dependant,
+        call=None,
+        cache_key=dependant.cache_key,
+        use_cache=dependant.use_cache,
+    )
+    return DependencyPlan(
+        steps=steps,
+        units=units,
+        concurrent=concurrent,
+        has_app_scoped=any(step.kind == "app" for step in steps),
+    )
+
+
+class AppDependencyStore:
+    """
+    The values of the dependencies declared with `scope="app"`, solved once and
+    shared by all the requests. The dependencies with `yield` are exited when the
+    store is closed, on application shutdown.
+    """
+
+    def __init__(self, *, dependency_overrides_provider: Optional[Any] = None) -> None:
+        self.dependency_overrides_provider = dependency_overrides_provider
+        self.values: Dict[CacheKey, Any] = {}
+        self._lock = anyio.Lock()
+        self._exit_stack: Optional[AsyncExitStack] = None
+
+    async def get(self, dependant: Dependant) -> Any:
+        if dependant.cache_key in self.values:
+            return self.values[dependant.cache_key]
+        async with self._lock:
+            return await self._solve_app_scoped(dependant)
+
+    async def setup(self, dependant: Dependant) -> None:
+        plan = get_dependency_plan(
+            dependant, dependency_overrides_provider=self.dependency_overrides_provider
+        )
+        for step in plan.steps:
+            if step.kind == "app":
+                await self.get(step.dependant)
+
+    async def close(self) -> None:
+        async with self._lock:
+            exit_stack = self._exit_stack
+            self._exit_stack = None
+            self.values.clear()
+        if exit_stack is not None:
+            await exit_stack.aclose()
+
+    async def _solve_app_scoped(self, dependant: Dependant) -> Any:
+        if dependant.cache_key not in self.values:
+            self.values[dependant.cache_key] = await self._solve(dependant, {})
+        return self.values[dependant.cache_key]
+
+    async def _solve(
+        self, dependant: Dependant, dependency_cache: Dict[CacheKey, Any]
+    ) -> Any:
+        dependency_overrides: Dict[Callable[..., Any], Callable[..., Any]] = (
+            getattr(self.dependency_overrides_provider, "dependency_overrides", None)
+            or {}
+        )
+        values: Dict[str, Any] = {}
+        for sub_dependant in dependant.dependencies:
+            original_call = cast(Callable[..., Any], sub_dependant.call)
+            call = dependency_overrides.get(original_call, original_call)
+            use_sub_dependant = sub_dependant
+            if call is not original_call:
+                use_path: str = sub_dependant.path  # type: ignore
+                use_sub_dependant = get_dependant(
+                    path=use_path,
+                    call=call,
+                    name=sub_dependant.name,
+                    security_scopes=sub_dependant.security_scopes,
+                    scope=sub_dependant.scope,
+                )
+            if use_sub_dependant.scope == "app":
+                solved = await self._solve_app_scoped(use_sub_dependant)
+            elif (
+                sub_dependant.use_cache and sub_dependant.cache_key in dependency_cache
+            ):
+                solved = dependency_cache[sub_dependant.cache_key]
+            else:
+                solved = await self._solve(use_sub_dependant, dependency_cache)
+                dependency_cache.setdefault(sub_dependant.cache_key, solved)
+            if sub_dependant.name is not None:
+                values[sub_dependant.name] = solved
+        if dependant.security_scopes_param_name:
+            values[dependant.security_scopes_param_name] = SecurityScopes(
+                scopes=dependant.security_scopes
+            )
+        call = cast(Callable[..., Any], dependant.call)
+        if is_gen_callable(call) or is_async_gen_callable(call):
+            if self._exit_stack is None:
+                self._exit_stack = AsyncExitStack()
+            return await solve_generator(
+                call=call, stack=self._exit_stack, sub_values=values
+            )
+        elif is_coroutine_callable(call):
+            return await call(**values)
+        return await run_in_threadpool(call, **values)
+
+
+async def _call_dependency(
+    step: DependencyStep, call: Callable[..., Any], values: Dict[str, Any]
+) -> Any:
+    if step.kind == "coroutine":
+        return await call(**values)
+    return await run_in_threadpool(call, **values)
+
+
+def _make_hashable(value: Any) -> Hashable:
+    if isinstance(value, BaseModel):
+        return (type(value), _make_hashable(_model_dump(value)))
+    if isinstance(value, dict):
+        items = [(k, _make_hashable(v)) for k, v in value.items()]
+        try:
+            # The keys are unique, so only the keys are compared
+            return (dict, tuple(sorted(items)))
+        except TypeError:
+            # Keys of different types that can't be sorted
+            return (dict, frozenset(items))
+    if isinstance(value, (list, tuple)):
+        return tuple(_make_hashable(v) for v in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_make_hashable(v) for v in value)
+    if value is None or value is Ellipsis or value is NotImplemented:
+        # Singletons, hashed by identity but the same in every request
+        return cast(Hashable, value)
+    if type(value).__hash__ is object.__hash__:  # type: ignore[comparison-overlap]
+        # Hashed by identity, an equal value in another request would never match
+        # the key, and the cache would keep the object alive
+        raise TypeError(f"{type(value).__name__} is hashed by identity")
+    return cast(Hashable, value)
+
+
+def _get_cache_key(
+    dependant: Dependant, call: Callable[..., Any], values: Dict[str, Any]
+) -> Optional[Hashable]:
+    # The security scopes are already part of the cache key, the SecurityScopes
+    # object is new for each request
+    try:
+        key = (
+            call,
+            dependant.cache_key[1],
+            tuple(
+                (name, _make_hashable(value))
+                for name, value in sorted(values.items())
+                if name != dependant.security_scopes_param_name
+            ),
+        )
+        hash(key)
+    except TypeError:
+        # Can't be cached, e.g. a sub-dependency returned an unhashable object or
+        # one hashed by identity
+        return None
+    return key
+
+
+async def solve_dependency_plan(
     *,
     request: Union[Request, WebSocket],
-    dependant: Dependant,
+    plan: DependencyPlan,
     body: Optional[Union[Dict[str, Any], FormData]] = None,
     background_tasks: Optional[StarletteBackgroundTasks] = None,
     response: Optional[Response] = None,
-    dependency_overrides_provider: Optional[Any] = None,
     dependency_cache: Optional[Dict[Tuple[Callable[..., Any], Tuple[str]], Any]] = None,
     async_exit_stack: AsyncExitStack,
     embed_body_fields: bool,
+    app_dependency_store: Optional[AppDependencyStore] = None,
 ) -> SolvedDependency:
-    values: Dict[str, Any] = {}
-    errors: List[Any] = []
     if response is None:
         response = Response()
         del response.headers["content-length"]
         response.status_code = None  # type: ignore
+    current_response = response
+    if app_dependency_store is None and plan.has_app_scoped:
+        # Without an app, dependencies with scope="app" live as long as the request
+        app_dependency_store = AppDependencyStore()
+        async_exit_stack.push_async_callback(app_dependency_store.close)
+    current_app_dependency_store = app_dependency_store
     dependency_cache = dependency_cache or {}
-    sub_dependant: Dependant
-    for sub_dependant in dependant.dependencies:
-        sub_dependant.call = cast(Callable[..., Any], sub_dependant.call)
-        sub_dependant.cache_key = cast(
-            Tuple[Callable[..., Any], Tuple[str]], sub_dependant.cache_key
-        )
-        call = sub_dependant.call
-        use_sub_dependant = sub_dependant
-        if (
-            dependency_overrides_provider
-            and dependency_overrides_provider.dependency_overrides
-        ):
-            original_call = sub_dependant.call
-            call = getattr(
-                dependency_overrides_provider, "dependency_overrides", {}
-            ).get(original_call, original_call)
-            use_path: str = sub_dependant.path  # type: ignore
-            use_sub_dependant = get_dependant(
-                path=use_path,
-                call=call,
-                name=sub_dependant.name,
-                security_scopes=sub_dependant.security_scopes,
-            )
+    step_errors: List[List[Any]] = [[] for _ in plan.steps]
+    results: List[Any] = [None] * len(plan.steps)
+    failed: List[bool] = [False] * len(plan.steps)
+    values: Dict[str, Any] = {}
 
-        solved_result = await solve_dependencies(
-            request=request,
-            dependant=use_sub_dependant,
-            body=body,
-            background_tasks=background_tasks,
-            response=response,
-            dependency_overrides_provider=dependency_overrides_provider,
-            dependency_cache=dependency_cache,
-            async_exit_stack=async_exit_stack,
-            embed_body_fields=embed_body_fields,
-        )
-        background_tasks = solved_result.background_tasks
-        dependency_cache.update(solved_result.dependency_cache)
-        if solved_result.errors:
-            errors.extend(solved_result.errors)
-            continue
-        if sub_dependant.use_cache and sub_dependant.cache_key in dependency_cache:
-            solved = dependency_cache[sub_dependant.cache_key]
-        elif is_gen_callable(call) or is_async_gen_callable(call):
+    async def solve_step(index: int) -> None:
+        nonlocal background_tasks, values
+        step = plan.steps[index]
+        if step.kind == "app":
+            assert current_app_dependency_store is not None
+            results[index] = await current_app_dependency_store.get(step.dependant)
+            return
+        dependant = step.dependant
+        step_values: Dict[str, Any] = {}
+        step_failed = False
+        for name, sub_index in step.sub_dependencies:
+            if failed[sub_index]:
+                step_failed = True
+            elif name is not None:
+                step_values[name] = results[sub_index]
+        errors: List[Any] = []
+        for extractor in step.params_extractors:
+            params_values, params_errors = extractor.extract(
+                _get_params_source(request, extractor.in_)
+            )
+            step_values.update(params_values)
+            errors.extend(params_errors)
+        if dependant.body_params:
+            (
+                body_values,
+                body_errors,
+            ) = await request_body_to_args(  # body_params checked above
+                body_fields=dependant.body_params,
+                received_body=body,
+                embed_body_fields=embed_body_fields,
+            )
+            step_values.update(body_values)
+            errors.extend(body_errors)
+        if dependant.http_connection_param_name:
+            step_values[dependant.http_connection_param_name] = request
+        if dependant.request_param_name and isinstance(request, Request):
+            step_values[dependant.request_param_name] = request
+        elif dependant.websocket_param_name and isinstance(request, WebSocket):
+            step_values[dependant.websocket_param_name] = request
+        if dependant.background_tasks_param_name:
+            if background_tasks is None:
+                background_tasks = BackgroundTasks()
+            step_values[dependant.background_tasks_param_name] = background_tasks
+        if dependant.response_param_name:
+            step_values[dependant.response_param_name] = current_response
+        if dependant.security_scopes_param_name:
+            step_values[dependant.security_scopes_param_name] = SecurityScopes(
+                scopes=dependant.security_scopes
+            )
+        if errors:
+            step_errors[index] = errors
+            step_failed = True
+        call = step.call
+        if call is None:
+            values = step_values
+        if step_failed:
+            failed[index] = True
+            return
+        if call is None:
+            return
+        cache = dependant.cache
+        cache_key = (
+            None if cache is None else _get_cache_key(dependant, call, step_values)
+        )
+        if step.use_cache and step.cache_key in dependency_cache:
+            solved = dependency_cache[step.cache_key]  # type: ignore[index]
+        elif step.kind == "generator" or step.kind == "async_generator":
             solved = await solve_generator(
-                call=call, stack=async_exit_stack, sub_values=solved_result.values
+                call=call, stack=async_exit_stack, sub_values=step_values
+            )
+        elif cache is not None and cache_key is not None:
+            solved = await cache.get_or_set(
+                cache_key, partial(_call_dependency, step, call, step_values)
             )
-        elif is_coroutine_callable(call):
-            solved = await call(**solved_result.values)
         else:
-            solved = await run_in_threadpool(call, **solved_result.values)
-        if sub_dependant.name is not None:
-            values[sub_dependant.name] = solved
-        if sub_dependant.cache_key not in dependency_cache:
-            dependency_cache[sub_dependant.cache_key] = solved
-    path_values, path_errors = request_params_to_args(
-        dependant.path_params, request.path_params
-    )
-    query_values, query_errors = request_params_to_args(
-        dependant.query_params, request.query_params
-    )
-    header_values, header_errors = request_params_to_args(
-        dependant.header_params, request.headers
-    )
-    cookie_values, cookie_errors = request_params_to_args(
-        dependant.cookie_params, request.cookies
-    )
-    values.update(path_values)
-    values.update(query_values)
-    values.update(header_values)
-    values.update(cookie_values)
-    errors += path_errors + query_errors + header_errors + cookie_errors
-    if dependant.body_params:
-        (
-            body_values,
-            body_errors,
-        ) = await request_body_to_args(  # body_params checked above
-            body_fields=dependant.body_params,
-            received_body=body,
-            embed_body_fields=embed_body_fields,
-        )
-        values.update(body_values)
-        errors.extend(body_errors)
-    if dependant.http_connection_param_name:
-        values[dependant.http_connection_param_name] = request
-    if dependant.request_param_name and isinstance(request, Request):
-        values[dependant.request_param_name] = request
-    elif dependant.websocket_param_name and isinstance(request, WebSocket):
-        values[dependant.websocket_param_name] = request
-    if dependant.background_tasks_param_name:
-        if background_tasks is None:
-            background_tasks = BackgroundTasks()
-        values[dependant.background_tasks_param_name] = background_tasks
-    if dependant.response_param_name:
-        values[dependant.response_param_name] = response
-    if dependant.security_scopes_param_name:
-        values[dependant.security_scopes_param_name] = SecurityScopes(
-            scopes=dependant.security_scopes
-        )
+            solved = await _call_dependency(step, call, step_values)
+        results[index] = solved
+        if step.cache_key not in dependency_cache:
+            dependency_cache[step.cache_key] = solved  # type: ignore[index]
+
+    async def solve_concurrently(group: ConcurrentDependencies) -> None:
+        # Exceptions are re-raised in the order of the branches, not in the order
+        # they happened, the other branches are not cancelled
+        exceptions: List[Optional[Exception]] = [None] * len(group.branches)
+
+        async def solve_branch(branch_index: int, branch: List[PlanUnit]) -> None:
+            try:
+                await solve_units(branch)
+            except Exception as e:
+                exceptions[branch_index] = e
+
+        async with anyio.create_task_group() as tg:
+            for branch_index, branch in enumerate(group.branches):
+                tg.start_soon(solve_branch, branch_index, branch)
+        for exception in exceptions:
+            if exception is not None:
+                raise exception
+
+    async def solve_units(units: List[PlanUnit]) -> None:
+        for unit in units:
+            if isinstance(unit, int):
+                await solve_step(unit)
+            else:
+                await solve_concurrently(unit)
+
+    await solve_units(plan.units)
+    errors: List[Any] = []
+    for errors_in_step in step_errors:
+        errors.extend(errors_in_step)
     return SolvedDependency(
         values=values,
         errors=errors,
@@ -695,6 +1350,36 @@ async def solve_dependencies(
     )
 
 
+async def solve_dependencies(
+    *,
+    request: Union[Request, WebSocket],
+    dependant: Dependant,
+    body: Optional[Union[Dict[str, Any], FormData]] = None,
+    background_tasks: Optional[StarletteBackgroundTasks] = None,
+    response: Optional[Response] = None,
+    dependency_overrides_provider: Optional[Any] = None,
+    dependency_cache: Optional[Dict[Tuple[Callable[..., Any], Tuple[str]], Any]] = None,
+    async_exit_stack: AsyncExitStack,
+    embed_body_fields: bool,
+) -> SolvedDependency:
+    plan = get_dependency_plan(
+        dependant, dependency_overrides_provider=dependency_overrides_provider
+    )
+    return await solve_dependency_plan(
+        request=request,
+        plan=plan,
+        body=body,
+        background_tasks=background_tasks,
+        response=response,
+        dependency_cache=dependency_cache,
+        async_exit_stack=async_exit_stack,
+        embed_body_fields=embed_body_fields,
+        app_dependency_store=getattr(
+            dependency_overrides_provider, "app_dependency_store", None
+        ),
+    )
+
+
 def _validate_value_with_model_field(
     *, field: ModelField, value: Any, values: Dict[str, Any], loc: Tuple[str, ...]
 ) -> Tuple[Any, List[Any]]:
@@ -702,7 +1387,7 @@ def _validate_value_with_model_field(
         if field.required:
             return None, [get_missing_field_error(loc=loc)]
         else:
-            return deepcopy(field.default), []
+            return copy_field_default(field), []
     v_, errors_ = field.validate(value, values, loc=loc)
     if isinstance(errors_, ErrorWrapper):
         return None, [errors_]
@@ -713,6 +1398,25 @@ def _validate_value_with_model_field(
         return v_, []
 
 
+def _get_param_value(
+    field: ModelField,
+    received_params: Union[Mapping[str, Any], QueryParams, Headers],
+    key: str,
+    is_sequence: bool,
+    use_getlist: bool,
+) -> Any:
+    if is_sequence and use_getlist:
+        value = received_params.getlist(key)  # type: ignore[union-attr]
+    else:
+        value = received_params.get(key, None)
+    if value is None or (is_sequence and len(value) == 0):
+        if field.required:
+            return None
+        else:
+            return copy_field_default(field)
+    return value
+
+
 def _get_multidict_value(
     field: ModelField, values: Mapping[str, Any], alias: Union[str, None] = None
 ) -> Any:
@@ -733,7 +1437,7 @@ def _get_multidict_value(
         if field.required:
             return
         else:
-            return deepcopy(field.default)
+            return copy_field_default(field)
     return value
 
 
@@ -1,5 +1,7 @@
 import dataclasses
 import datetime
+import json
+import math
 from collections import defaultdict, deque
 from decimal import Decimal
 from enum import Enum
@@ -14,7 +16,19 @@ from ipaddress import (
 from pathlib import Path, PurePath
 from re import Pattern
 from types import GeneratorType
-from typing import Any, Callable, Dict, List, Optional, Tuple, Type, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    Union,
+)
 from uuid import UUID
 
 from fastapi.types import IncEx
@@ -202,142 +216,699 @@ def jsonable_encoder(
     [FastAPI docs for JSON Compatible Encoder](https://fastapi.tiangolo.com/tutorial/encoder/).
     """
     custom_encoder = custom_encoder or {}
+    return _encode(
+        obj,
+        include,
+        exclude,
+        by_alias,
+        exclude_unset,
+        exclude_defaults,
+        exclude_none,
+        custom_encoder,
+        sqlalchemy_safe,
+    )
+
+
+# The arguments of jsonable_encoder, positional, with custom_encoder always a dict
+_TypeEncoder = Callable[
+    [
+        Any,
+        Optional[IncEx],
+        Optional[IncEx],
+        bool,
+        bool,
+        bool,
+        bool,
+        Dict[Any, Callable[[Any], Any]],
+        bool,
+    ],
+    Any,
+]
+
+# The maximum number of types in the caches by type, when there are more, e.g.
+# with classes created dynamically, they are cleared so that they don't keep the
+# classes alive
+_MAX_CACHED_TYPES = 1024
+
+# The encoder for each type seen, to check the type of each value only once
+_encoders_by_type: Dict[Type[Any], _TypeEncoder] = {}
+
+
+def _encode(
+    obj: Any,
+    include: Optional[IncEx],
+    exclude: Optional[IncEx],
+    by_alias: bool,
+    exclude_unset: bool,
+    exclude_defaults: bool,
+    exclude_none: bool,
+    custom_encoder: Dict[Any, Callable[[Any], Any]],
+    sqlalchemy_safe: bool,
+) -> Any:
     if custom_encoder:
-        if type(obj) in custom_encoder:
-            return custom_encoder[type(obj)](obj)
-        else:
-            for encoder_type, encoder_instance in custom_encoder.items():
-                if isinstance(obj, encoder_type):
-                    return encoder_instance(obj)
+        custom = _get_custom_encoder(obj, custom_encoder)
+        if custom is not None:
+            return custom(obj)
+    encoder = _encoders_by_type.get(type(obj)) or _get_type_encoder(type(obj))
+    return encoder(
+        obj,
+        include,
+        exclude,
+        by_alias,
+        exclude_unset,
+        exclude_defaults,
+        exclude_none,
+        custom_encoder,
+        sqlalchemy_safe,
+    )
+
+
+def _get_custom_encoder(
+    obj: Any, custom_encoder: Dict[Any, Callable[[Any], Any]]
+) -> Optional[Callable[[Any], Any]]:
+    if type(obj) in custom_encoder:
+        return custom_encoder[type(obj)]
+    else:
+        for encoder_type, encoder_instance in custom_encoder.items():
+            if isinstance(obj, encoder_type):
+                return encoder_instance
+    return None
+
+
+def _get_type_encoder(type_: Type[Any]) -> _TypeEncoder:
+    encoder: _TypeEncoder
+    if issubclass(type_, BaseModel):
+        encoder = _encode_model
+    elif issubclass(type_, type):
+        # Classes are dataclasses or not on their own, not by their metaclass
+        encoder = _encode_class
+    elif dataclasses.is_dataclass(type_):
+        encoder = _encode_dataclass
+    elif issubclass(type_, Enum):
+        encoder = _encode_enum
+    elif issubclass(type_, PurePath):
+        encoder = _encode_path
+    elif issubclass(type_, (str, int, float, type(None))):
+        encoder = _encode_primitive
+    elif issubclass(type_, UndefinedType):
+        encoder = _encode_undefined
+    elif issubclass(type_, dict):
+        encoder = _encode_dict
+    elif issubclass(type_, (list, set, frozenset, GeneratorType, tuple, deque)):
+        encoder = _encode_sequence
+    else:
+        encoder = _encode_other
+    if len(_encoders_by_type) >= _MAX_CACHED_TYPES:
+        _encoders_by_type.clear()
+    _encoders_by_type[type_] = encoder
+    return encoder
+
+
+def _encode_model(
+    obj: Any,
+    include: Optional[IncEx],
+    exclude: Optional[IncEx],
+    by_alias: bool,
+    exclude_unset: bool,
+    exclude_defaults: bool,
+    exclude_none: bool,
+    custom_encoder: Dict[Any, Callable[[Any], Any]],
+    sqlalchemy_safe: bool,
+) -> Any:
     if include is not None and not isinstance(include, (set, dict)):
         include = set(include)
     if exclude is not None and not isinstance(exclude, (set, dict)):
         exclude = set(exclude)
-    if isinstance(obj, BaseModel):
+    # TODO: remove when deprecating Pydantic v1
+    encoders: Dict[Any, Any] = {}
+    if not PYDANTIC_V2:
+        encoders = getattr(obj.__config__, "json_encoders", {})
+        if custom_encoder:
+            encoders.update(custom_encoder)
+    obj_dict = _model_dump(
+        obj,
+        mode="json",
+        include=include,
+        exclude=exclude,
+        by_alias=by_alias,
+        exclude_unset=exclude_unset,
+        exclude_none=exclude_none,
+        exclude_defaults=exclude_defaults,
+    )
+    if "__root__" in obj_dict:
+        obj_dict = obj_dict["__root__"]
+    return jsonable_encoder(
+        obj_dict,
+        exclude_none=exclude_none,
+        exclude_defaults=exclude_defaults,
         # TODO: remove when deprecating Pydantic v1
-        encoders: Dict[Any, Any] = {}
-        if not PYDANTIC_V2:
-            encoders = getattr(obj.__config__, "json_encoders", {})  # type: ignore[attr-defined]
-            if custom_encoder:
-                encoders.update(custom_encoder)
-        obj_dict = _model_dump(
-            obj,
-            mode="json",
-            include=include,
-            exclude=exclude,
-            by_alias=by_alias,
-            exclude_unset=exclude_unset,
-            exclude_none=exclude_none,
-            exclude_defaults=exclude_defaults,
-        )
-        if "__root__" in obj_dict:
-            obj_dict = obj_dict["__root__"]
-        return jsonable_encoder(
-            obj_dict,
-            exclude_none=exclude_none,
-            exclude_defaults=exclude_defaults,
-            # TODO: remove when deprecating Pydantic v1
-            custom_encoder=encoders,
-            sqlalchemy_safe=sqlalchemy_safe,
-        )
-    if dataclasses.is_dataclass(obj):
-        obj_dict = dataclasses.asdict(obj)
-        return jsonable_encoder(
-            obj_dict,
-            include=include,
-            exclude=exclude,
-            by_alias=by_alias,
-            exclude_unset=exclude_unset,
-            exclude_defaults=exclude_defaults,
-            exclude_none=exclude_none,
-            custom_encoder=custom_encoder,
-            sqlalchemy_safe=sqlalchemy_safe,
-        )
-    if isinstance(obj, Enum):
-        return obj.value
-    if isinstance(obj, PurePath):
-        return str(obj)
-    if isinstance(obj, (str, int, float, type(None))):
-        return obj
-    if isinstance(obj, UndefinedType):
-        return None
-    if isinstance(obj, dict):
-        encoded_dict = {}
-        allowed_keys = set(obj.keys())
-        if include is not None:
-            allowed_keys &= set(include)
-        if exclude is not None:
-            allowed_keys -= set(exclude)
-        for key, value in obj.items():
-            if (
-                (
-                    not sqlalchemy_safe
-                    or (not isinstance(key, str))
-                    or (not key.startswith("_sa"))
-                )
-                and (value is not None or not exclude_none)
-                and key in allowed_keys
-            ):
-                encoded_key = jsonable_encoder(
+        custom_encoder=encoders,
+        sqlalchemy_safe=sqlalchemy_safe,
+    )
+
+
+def _encode_class(
+    obj: Any,
+    include: Optional[IncEx],
+    exclude: Optional[IncEx],
+    by_alias: bool,
+    exclude_unset: bool,
+    exclude_defaults: bool,
+    exclude_none: bool,
+    custom_encoder: Dict[Any, Callable[[Any], Any]],
+    sqlalchemy_safe: bool,
+) -> Any:
+    encoder = _encode_dataclass if dataclasses.is_dataclass(obj) else _encode_other
+    return encoder(
+        obj,
+        include,
+        exclude,
+        by_alias,
+        exclude_unset,
+        exclude_defaults,
+        exclude_none,
+        custom_encoder,
+        sqlalchemy_safe,
+    )
+
+
+def _encode_dataclass(
+    obj: Any,
+    include: Optional[IncEx],
+    exclude: Optional[IncEx],
+    by_alias: bool,
+    exclude_unset: bool,
+    exclude_defaults: bool,
+    exclude_none: bool,
+    custom_encoder: Dict[Any, Callable[[Any], Any]],
+    sqlalchemy_safe: bool,
+) -> Any:
+    obj_dict = _get_dataclass_dict(obj)
+    return _encode(
+        obj_dict,
+        include,
+        exclude,
+        by_alias,
+        exclude_unset,
+        exclude_defaults,
+        exclude_none,
+        custom_encoder,
+        sqlalchemy_safe,
+    )
+
+
+# The names of the fields of each dataclass, dataclasses.fields() is slow
+_dataclass_field_names: Dict[Type[Any], Tuple[str, ...]] = {}
+
+
+def _get_dataclass_dict(obj: Any) -> Dict[str, Any]:
+    # Unlike dataclasses.asdict(), the values are not converted or copied, they
+    # are encoded after
+    field_names = _dataclass_field_names.get(type(obj))
+    if field_names is None:
+        if isinstance(obj, type):
+            raise TypeError("asdict() should be called on dataclass instances")
+        field_names = tuple(field.name for field in dataclasses.fields(obj))
+        if len(_dataclass_field_names) >= _MAX_CACHED_TYPES:
+            _dataclass_field_names.clear()
+        _dataclass_field_names[type(obj)] = field_names
+    return {name: getattr(obj, name) for name in field_names}
+
+
+def _encode_enum(obj: Enum, *args: Any) -> Any:
+    return obj.value
+
+
+def _encode_path(obj: PurePath, *args: Any) -> str:
+    return str(obj)
+
+
+def _encode_primitive(obj: Any, *args: Any) -> Any:
+    return obj
+
+
+def _encode_undefined(obj: Any, *args: Any) -> None:
+    return None
+
+
+def _encode_dict(
+    obj: Any,
+    include: Optional[IncEx],
+    exclude: Optional[IncEx],
+    by_alias: bool,
+    exclude_unset: bool,
+    exclude_defaults: bool,
+    exclude_none: bool,
+    custom_encoder: Dict[Any, Callable[[Any], Any]],
+    sqlalchemy_safe: bool,
+) -> Dict[Any, Any]:
+    encoded_dict = {}
+    allowed_keys = set(obj.keys())
+    if include is not None:
+        allowed_keys &= set(include)
+    if exclude is not None:
+        allowed_keys -= set(exclude)
+    for key, value in obj.items():
+        if (
+            (
+                not sqlalchemy_safe
+                or (not isinstance(key, str))
+                or (not key.startswith("_sa"))
+            )
+            and (value is not None or not exclude_none)
+            and key in allowed_keys
+        ):
+            # Plain keys and values are used as is, without a call for each one
+            encoded_key = key
+            key_encoder = _encoders_by_type.get(type(key)) or _get_type_encoder(
+                type(key)
+            )
+            if custom_encoder or key_encoder is not _encode_primitive:
+                encoded_key = _encode(
                     key,
-                    by_alias=by_alias,
-                    exclude_unset=exclude_unset,
-                    exclude_none=exclude_none,
-                    custom_encoder=custom_encoder,
-                    sqlalchemy_safe=sqlalchemy_safe,
+                    None,
+                    None,
+                    by_alias,
+                    exclude_unset,
+                    False,
+                    exclude_none,
+                    custom_encoder,
+                    sqlalchemy_safe,
                 )
-                encoded_value = jsonable_encoder(
+            encoded_value = value
+            value_encoder = _encoders_by_type.get(type(value)) or _get_type_encoder(
+                type(value)
+            )
+            if custom_encoder or value_encoder is not _encode_primitive:
+                encoded_value = _encode(
                     value,
-                    by_alias=by_alias,
-                    exclude_unset=exclude_unset,
-                    exclude_none=exclude_none,
-                    custom_encoder=custom_encoder,
-                    sqlalchemy_safe=sqlalchemy_safe,
-                )
-                encoded_dict[encoded_key] = encoded_value
-        return encoded_dict
-    if isinstance(obj, (list, set, frozenset, GeneratorType, tuple, deque)):
-        encoded_list = []
-        for item in obj:
-            encoded_list.append(
-                jsonable_encoder(
-                    item,
-                    include=include,
-                    exclude=exclude,
-                    by_alias=by_alias,
-                    exclude_unset=exclude_unset,
-                    exclude_defaults=exclude_defaults,
-                    exclude_none=exclude_none,
-                    custom_encoder=custom_encoder,
-                    sqlalchemy_safe=sqlalchemy_safe,
+                    None,
+                    None,
+                    by_alias,
+                    exclude_unset,
+                    False,
+                    exclude_none,
+                    custom_encoder,
+                    sqlalchemy_safe,
                 )
+            encoded_dict[encoded_key] = encoded_value
+    return encoded_dict
+
+
+def _encode_sequence(
+    obj: Any,
+    include: Optional[IncEx],
+    exclude: Optional[IncEx],
+    by_alias: bool,
+    exclude_unset: bool,
+    exclude_defaults: bool,
+    exclude_none: bool,
+    custom_encoder: Dict[Any, Callable[[Any], Any]],
+    sqlalchemy_safe: bool,
+) -> List[Any]:
+    encoded_list = []
+    for item in obj:
+        item_encoder = _encoders_by_type.get(type(item)) or _get_type_encoder(
+            type(item)
+        )
+        if custom_encoder or item_encoder is not _encode_primitive:
+            item = _encode(
+                item,
+                include,
+                exclude,
+                by_alias,
+                exclude_unset,
+                exclude_defaults,
+                exclude_none,
+                custom_encoder,
+                sqlalchemy_safe,
             )
-        return encoded_list
+        encoded_list.append(item)
+    return encoded_list
+
+
+def _encode_other(
+    obj: Any,
+    include: Optional[IncEx],
+    exclude: Optional[IncEx],
+    by_alias: bool,
+    exclude_unset: bool,
+    exclude_defaults: bool,
+    exclude_none: bool,
+    custom_encoder: Dict[Any, Callable[[Any], Any]],
+    sqlalchemy_safe: bool,
+) -> Any:
+    encoder = _get_registered_encoder(obj)
+    if encoder is not None:
+        return encoder(obj)
+    return _encode(
+        _to_dict(obj),
+        include,
+        exclude,
+        by_alias,
+        exclude_unset,
+        exclude_defaults,
+        exclude_none,
+        custom_encoder,
+        sqlalchemy_safe,
+    )
 
+
+def _get_registered_encoder(obj: Any) -> Optional[Callable[[Any], Any]]:
+    # Looked up on each call, ENCODERS_BY_TYPE can be extended by users
     if type(obj) in ENCODERS_BY_TYPE:
-        return ENCODERS_BY_TYPE[type(obj)](obj)
+        return ENCODERS_BY_TYPE[type(obj)]
     for encoder, classes_tuple in encoders_by_class_tuples.items():
         if isinstance(obj, classes_tuple):
-            return encoder(obj)
+            return encoder
+    return None
+
 
+def _to_dict(obj: Any) -> Any:
     try:
-        data = dict(obj)
+        return dict(obj)
     except Exception as e:
         errors: List[Exception] = []
         errors.append(e)
         try:
-            data = vars(obj)
+            return vars(obj)
         except Exception as e:
             errors.append(e)
             raise ValueError(errors) from e
-    return jsonable_encoder(
-        data,
-        include=include,
-        exclude=exclude,
-        by_alias=by_alias,
-        exclude_unset=exclude_unset,
-        exclude_defaults=exclude_defaults,
-        exclude_none=exclude_none,
-        custom_encoder=custom_encoder,
-        sqlalchemy_safe=sqlalchemy_safe,
+
+
+def iter_json(
+    obj: Annotated[
+        Any,
+        Doc(
+            """
+            The input object to convert to JSON.
+            """
+        ),
+    ],
+    include: Annotated[
+        Optional[IncEx],
+        Doc(
+            """
+            Pydantic's `include` parameter, passed to Pydantic models to set the
+            fields to include.
+            """
+        ),
+    ] = None,
+    exclude: Annotated[
+        Optional[IncEx],
+        Doc(
+            """
+            Pydantic's `exclude` parameter, passed to Pydantic models to set the
+            fields to exclude.
+            """
+        ),
+    ] = None,
+    by_alias: Annotated[
+        bool,
+        Doc(
+            """
+            Pydantic's `by_alias` parameter, passed to Pydantic models to define if
+            the output should use the alias names (when provided) or the Python
+            attribute names.
+            """
+        ),
+    ] = True,
+    exclude_unset: Annotated[
+        bool,
+        Doc(
+            """
+            Pydantic's `exclude_unset` parameter, passed to Pydantic models to define
+            if it should exclude from the output the fields that were not explicitly
+            set (and that only had their default values).
+            """
+        ),
+    ] = False,
+    exclude_defaults: Annotated[
+        bool,
+        Doc(
+            """
+            Pydantic's `exclude_defaults` parameter, passed to Pydantic models to define
+            if it should exclude from the output the fields that had the same default
+            value, even when they were explicitly set.
+            """
+        ),
+    ] = False,
+    exclude_none: Annotated[
+        bool,
+        Doc(
+            """
+            Pydantic's `exclude_none` parameter, passed to Pydantic models to define
+            if it should exclude from the output any fields that have a `None` value.
+            """
+        ),
+    ] = False,
+    custom_encoder: Annotated[
+        Optional[Dict[Any, Callable[[Any], Any]]],
+        Doc(
+            """
+            Pydantic's `custom_encoder` parameter, passed to Pydantic models to define
+            a custom encoder.
+            """
+        ),
+    ] = None,
+    sqlalchemy_safe: Annotated[
+        bool,
+        Doc(
+            """
+            Exclude from the output any fields that start with the name `_sa`.
+            """
+        ),
+    ] = True,
+    chunk_size: Annotated[
+        int,
+        Doc(
+            """
+            The approximate size of each chunk, in characters.
+            """
+        ),
+    ] = 65536,
+) -> Iterator[bytes]:
+    """
+    Convert any object to JSON, in chunks of bytes, as it is traversed.
+
+    The content is the same as `JSONResponse(jsonable_encoder(obj)).body`, but
+    without building a converted copy of the object or the whole JSON document in
+    memory, and without recursion, so it also works for very deeply nested data.
+
+    Pydantic models are still converted one at a time.
+
+    You can pass it to a `StreamingResponse`, or return a `StreamingJSONResponse`
+    to let other requests run between chunks.
+    """
+    args = (
+        include,
+        exclude,
+        by_alias,
+        exclude_unset,
+        exclude_defaults,
+        exclude_none,
+        custom_encoder or {},
+        sqlalchemy_safe,
     )
+    parts: List[str] = []
+    size = 0
+    for part in _iter_json(obj, args):
+        parts.append(part)
+        size += len(part)
+        if size >= chunk_size:
+            yield "".join(parts).encode("utf-8")
+            parts = []
+            size = 0
+    if parts:
+        yield "".join(parts).encode("utf-8")
+
+
+# The arguments of _encode after the object
+_EncoderArgs = Tuple[
+    Optional[IncEx],
+    Optional[IncEx],
+    bool,
+    bool,
+    bool,
+    bool,
+    Dict[Any, Callable[[Any], Any]],
+    bool,
+]
+
+# For data that was already converted, e.g. by a Pydantic model
+_ENCODED_ARGS: _EncoderArgs = (None, None, True, False, False, False, {}, False)
+
+
+# The most plain values yielded together, to keep the chunks small
+_MAX_PARTS = 1000
+
+
+class _JSONValue(NamedTuple):
+    value: Any
+    args: _EncoderArgs
+
+
+# The same options as JSONResponse
+_json_encoder = json.JSONEncoder(
+    ensure_ascii=False,
+    allow_nan=False,
+    indent=None,
+    separators=(",", ":"),
+)
+
+
+_encode_string: Callable[[str], str] = json.encoder.encode_basestring  # type: ignore[attr-defined]
+
+# Faster than the encoder for single plain values, with the same output
+_dumps_by_type: Dict[Type[Any], Callable[[Any], str]] = {
+    str: _encode_string,
+    int: int.__repr__,
+    bool: lambda o: "true" if o else "false",
+    type(None): lambda o: "null",
+    float: lambda o: float.__repr__(o) if math.isfinite(o) else _json_encoder.encode(o),
+}
+
+
+def _dumps(obj: Any) -> str:
+    dumps = _dumps_by_type.get(type(obj))
+    if dumps is not None:
+        return dumps(obj)
+    encoded: str = _json_encoder.encode(obj)
+    return encoded
+
+
+def _dumps_key(key: Any) -> str:
+    if type(key) is str:
+        return _encode_string(key)
+    # Other keys are converted to strings the same way as by json.dumps()
+    return _dumps({key: None})[1:-6]
+
+
+def _iter_json(obj: Any, args: _EncoderArgs) -> Iterator[str]:
+    # An explicit stack of the dicts and sequences being traversed
+    stack: List[Iterator[Union[str, _JSONValue]]] = [iter([_JSONValue(obj, args)])]
+    while stack:
+        item = next(stack[-1], None)
+        if item is None:
+            stack.pop()
+            continue
+        if isinstance(item, str):
+            yield item
+            continue
+        value, value_args = item
+        custom_encoder = value_args[6]
+        if custom_encoder:
+            custom = _get_custom_encoder(value, custom_encoder)
+            if custom is not None:
+                yield _dumps(custom(value))
+                continue
+        encoder = _encoders_by_type.get(type(value)) or _get_type_encoder(type(value))
+        if encoder is _encode_dict:
+            stack.append(_iter_dict_json(value, value_args))
+        elif encoder is _encode_sequence:
+            stack.append(_iter_sequence_json(value, value_args))
+        elif encoder is _encode_model:
+            encoded = _encode_model(value, *value_args)
+            stack.append(iter([_JSONValue(encoded, _ENCODED_ARGS)]))
+        elif encoder is _encode_dataclass or (
+            encoder is _encode_class and dataclasses.is_dataclass(value)
+        ):
+            obj_dict = _get_dataclass_dict(value)
+            stack.append(iter([_JSONValue(obj_dict, value_args)]))
+        elif encoder is _encode_other or encoder is _encode_class:
+            registered = _get_registered_encoder(value)
+            if registered is not None:
+                yield _dumps(registered(value))
+            else:
+                stack.append(iter([_JSONValue(_to_dict(value), value_args)]))
+        else:
+            yield _dumps(encoder(value, *value_args))
+
+
+def _iter_dict_json(obj: Any, args: _EncoderArgs) -> Iterator[Union[str, _JSONValue]]:
+    (
+        include,
+        exclude,
+        by_alias,
+        exclude_unset,
+        _,
+        exclude_none,
+        custom_encoder,
+        sqlalchemy_safe,
+    ) = args
+    value_args: _EncoderArgs = (
+        None,
+        None,
+        by_alias,
+        exclude_unset,
+        False,
+        exclude_none,
+        custom_encoder,
+        sqlalchemy_safe,
+    )
+    allowed_keys: Optional[Set[Any]] = None
+    if include is not None or exclude is not None:
+        allowed_keys = set(obj.keys())
+        if include is not None:
+            allowed_keys &= set(include)
+        if exclude is not None:
+            allowed_keys -= set(exclude)
+    # Consecutive plain values are yielded together
+    parts: List[str] = []
+    separator = "{"
+    for key, value in obj.items():
+        if (
+            (
+                not sqlalchemy_safe
+                or (not isinstance(key, str))
+                or (not key.startswith("_sa"))
+            )
+            and (value is not None or not exclude_none)
+            and (allowed_keys is None or key in allowed_keys)
+        ):
+            if not custom_encoder and type(key) is str:
+                parts.append(separator + _encode_string(key) + ":")
+            else:
+                encoded_key = _encode(key, *value_args)
+                parts.append(separator + _dumps_key(encoded_key) + ":")
+            separator = ","
+            value_encoder = _encoders_by_type.get(type(value)) or _get_type_encoder(
+                type(value)
+            )
+            if not custom_encoder and value_encoder is _encode_primitive:
+                parts.append(_dumps(value))
+                if len(parts) >= _MAX_PARTS:
+                    yield "".join(parts)
+                    parts = []
+            else:
+                yield "".join(parts)
+                parts = []
+                yield _JSONValue(value, value_args)
+    parts.append("{}" if separator == "{" else "}")
+    yield "".join(parts)
+
+
+def _iter_sequence_json(
+    obj: Any, args: _EncoderArgs
+) -> Iterator[Union[str, _JSONValue]]:
+    custom_encoder = args[6]
+    parts: List[str] = []
+    separator = "["
+    for item in obj:
+        item_encoder = _encoders_by_type.get(type(item)) or _get_type_encoder(
+            type(item)
+        )
+        if not custom_encoder and item_encoder is _encode_primitive:
+            parts.append(separator + _dumps(item))
+            if len(parts) >= _MAX_PARTS:
+                yield "".join(parts)
+                parts = []
+        else:
+            parts.append(separator)
+            yield "".join(parts)
+            parts = []
+            yield _JSONValue(item, args)
+        separator = ","
+    parts.append("[]" if separator == "[" else "]")
+    yield "".join(parts)
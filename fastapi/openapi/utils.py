@@ -1,10 +1,26 @@
+import hashlib
 import http.client
 import inspect
+import re
 import warnings
-from typing import Any, Dict, List, Optional, Sequence, Set, Tuple, Type, Union, cast
+from enum import Enum
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+    Union,
+    cast,
+)
 
 from fastapi import routing
 from fastapi._compat import (
+    PYDANTIC_V2,
     GenerateJsonSchema,
     JsonSchemaValue,
     ModelField,
@@ -36,7 +52,7 @@ from pydantic import BaseModel
 from starlette.responses import JSONResponse
 from starlette.routing import BaseRoute
 from starlette.status import HTTP_422_UNPROCESSABLE_ENTITY
-from typing_extensions import Literal
+from typing_extensions import Literal, get_args, get_origin
 
 validation_error_definition = {
     "title": "ValidationError",
@@ -474,6 +490,366 @@ def get_fields_from_routes(
     return flat_models
 
 
+def _get_refs(value: Any, refs: Set[str]) -> Set[str]:
+    if isinstance(value, dict):
+        for key, item in value.items():
+            if key == "$ref" and isinstance(item, str):
+                if item.startswith(REF_PREFIX):
+                    refs.add(item[len(REF_PREFIX) :])
+            else:
+                _get_refs(item, refs)
+    elif isinstance(value, list):
+        for item in value:
+            _get_refs(item, refs)
+    return refs
+
+
+class _PathFragment:
+    __slots__ = ("route", "path", "security_schemes", "definitions", "refs")
+
+    def __init__(
+        self,
+        route: routing.APIRoute,
+        path: Dict[str, Any],
+        security_schemes: Dict[str, Any],
+        definitions: Dict[str, Any],
+    ) -> None:
+        self.route = route
+        self.path = path
+        self.security_schemes = security_schemes
+        self.definitions = definitions
+        self.refs = _get_refs(path, set())
+
+
+class OpenAPIFragments:
+    """
+    The parts of an OpenAPI schema generated for each *path operation*, to generate
+    the schema again after *path operations* are added or removed, only generating
+    the parts of the new ones.
+
+    Pass the same instance to `get_openapi()` each time. The definitions of the
+    new *path operations* are generated on their own, and if they don't match the
+    existing ones, e.g. because two different models have the same name, the
+    whole schema is generated again.
+
+    The definitions that are not used by any *path operation* are not included.
+    A *path operation* modified in place is not generated again, call `clear()`
+    after modifying one.
+    """
+
+    def __init__(self) -> None:
+        self._fragments: Dict[int, _PathFragment] = {}
+        self._operation_ids: Dict[int, Set[str]] = {}
+        self._definitions: Dict[str, Any] = {}
+        self._separate_input_output_schemas: Optional[bool] = None
+
+    def __len__(self) -> int:
+        return len(self._fragments)
+
+    def clear(self) -> None:
+        self._fragments.clear()
+        self._operation_ids.clear()
+        self._definitions.clear()
+        self._separate_input_output_schemas = None
+
+    def _generate(
+        self,
+        routes: List[routing.APIRoute],
+        operation_ids: Set[str],
+        separate_input_output_schemas: bool,
+    ) -> Dict[str, Any]:
+        all_fields = get_fields_from_routes(routes)
+        model_name_map = get_compat_model_name_map(all_fields)
+        schema_generator = GenerateJsonSchema(ref_template=REF_TEMPLATE)
+        field_mapping, definitions = get_definitions(
+            fields=all_fields,
+            schema_generator=schema_generator,
+            model_name_map=model_name_map,
+            separate_input_output_schemas=separate_input_output_schemas,
+        )
+        for route in routes:
+            previous_operation_ids = set(operation_ids)
+            path, security_schemes, path_definitions = get_openapi_path(
+                route=route,
+                operation_ids=operation_ids,
+                schema_generator=schema_generator,
+                model_name_map=model_name_map,
+                field_mapping=field_mapping,
+                separate_input_output_schemas=separate_input_output_schemas,
+            )
+            self._fragments[id(route)] = _PathFragment(
+                route, path, security_schemes, path_definitions
+            )
+            self._operation_ids[id(route)] = operation_ids - previous_operation_ids
+        return definitions
+
+    def _get_used_definitions(
+        self, fragments: Iterable[_PathFragment]
+    ) -> Dict[str, Any]:
+        definitions: Dict[str, Any] = {}
+        pending: List[str] = []
+        for fragment in fragments:
+            pending.extend(fragment.refs)
+        while pending:
+            name = pending.pop()
+            if name in definitions or name not in self._definitions:
+                continue
+            definitions[name] = self._definitions[name]
+            pending.extend(_get_refs(definitions[name], set()))
+        return definitions
+
+    def _can_merge(self, definitions: Dict[str, Any]) -> bool:
+        for name, definition in definitions.items():
+            existing = self._definitions.get(name)
+            if existing is not None and existing != definition:
+                return False
+        # A model is named with -Input and -Output when it's used in both modes,
+        # generating them all together could give different names
+        names = set(self._definitions) | set(definitions)
+        for name in names:
+            if name + "-Input" in names or name + "-Output" in names:
+                return False
+            if name.endswith("-Input") and name[:-6] + "-Output" not in names:
+                return False
+            if name.endswith("-Output") and name[:-7] + "-Input" not in names:
+                return False
+        return True
+
+    def update(
+        self,
+        routes: Sequence[routing.APIRoute],
+        separate_input_output_schemas: bool = True,
+    ) -> bool:
+        """
+        Generate the fragments of the new *path operations*, and forget the ones
+        removed. Return `True` if only the new ones were generated, or `False` if
+        all of them were.
+        """
+        current = {id(route) for route in routes}
+        removed = [key for key in self._fragments if key not in current]
+        for key in removed:
+            del self._fragments[key]
+            del self._operation_ids[key]
+        if (
+            self._fragments
+            and self._separate_input_output_schemas == separate_input_output_schemas
+        ):
+            if removed:
+                self._definitions = self._get_used_definitions(self._fragments.values())
+            new_routes = [route for route in routes if id(route) not in self._fragments]
+            definitions: Dict[str, Any] = {}
+            if new_routes:
+                definitions = self._generate(
+                    new_routes,
+                    set().union(*self._operation_ids.values()),
+                    separate_input_output_schemas,
+                )
+            if self._can_merge(definitions):
+                self._definitions.update(definitions)
+                return True
+        self.clear()
+        self._separate_input_output_schemas = separate_input_output_schemas
+        self._definitions = self._generate(
+            list(routes), set(), separate_input_output_schemas
+        )
+        return False
+
+    def _get_fragments(
+        self, routes: Sequence[BaseRoute]
+    ) -> Tuple[List[_PathFragment], Dict[str, Any]]:
+        fragments = [
+            self._fragments[id(route)]
+            for route in routes
+            if isinstance(route, routing.APIRoute)
+        ]
+        return fragments, self._get_used_definitions(fragments)
+
+
+_address_re = re.compile(r" at 0x[0-9a-fA-F]+")
+
+
+def _sort_sets(value: Any) -> Any:
+    # The order of the items of a set changes in each process with the hashes of
+    # the strings, sort them by their repr
+    if isinstance(value, (set, frozenset)):
+        return (
+            type(value).__name__,
+            sorted((_sort_sets(item) for item in value), key=_stable_repr),
+        )
+    if isinstance(value, dict):
+        return {key: _sort_sets(item) for key, item in value.items()}
+    if type(value) in (list, tuple):
+        return type(value)(_sort_sets(item) for item in value)
+    return value
+
+
+def _stable_repr(value: Any) -> str:
+    # Without the memory addresses, that change in each process
+    return _address_re.sub("", repr(_sort_sets(value)))
+
+
+def _get_model_schemas(model: Type[BaseModel]) -> Any:
+    # The JSON Schemas of the model cover what its fields don't, like its config
+    # and a custom __get_pydantic_json_schema__()
+    try:
+        if PYDANTIC_V2:
+            return [
+                model.model_json_schema(mode="validation"),
+                model.model_json_schema(mode="serialization"),
+            ]
+        return model.schema()
+    except Exception:
+        # The schema can't be generated, e.g. with arbitrary types, it's not part
+        # of the OpenAPI either
+        return None
+
+
+def _get_type_signature(annotation: Any, seen: Set[Any]) -> Any:
+    if lenient_issubclass(annotation, BaseModel):
+        name = f"{annotation.__module__}.{annotation.__qualname__}"
+        if annotation in seen:
+            return name
+        seen.add(annotation)
+        if PYDANTIC_V2:
+            fields = [
+                (field_name, field_info.annotation, field_info)
+                for field_name, field_info in annotation.model_fields.items()
+            ]
+        else:
+            fields = [
+                (field_name, field.outer_type_, field.field_info)
+                for field_name, field in annotation.__fields__.items()
+            ]
+        return (
+            name,
+            annotation.__doc__,
+            [
+                (
+                    field_name,
+                    _get_type_signature(field_annotation, seen),
+                    _stable_repr(field_info),
+                )
+                for field_name, field_annotation, field_info in fields
+            ],
+            _get_model_schemas(annotation),
+        )
+    if lenient_issubclass(annotation, Enum):
+        return (
+            _stable_repr(annotation),
+            [(member.name, _stable_repr(member.value)) for member in annotation],
+        )
+    args = get_args(annotation)
+    if args:
+        return (
+            _stable_repr(get_origin(annotation)),
+            [_get_type_signature(arg, seen) for arg in args],
+        )
+    return _stable_repr(annotation)
+
+
+def _get_field_signature(field: Optional[ModelField], seen: Set[Any]) -> Any:
+    if field is None:
+        return None
+    return (
+        field.name,
+        field.alias,
+        field.required,
+        _get_type_signature(getattr(field, "outer_type_", field.type_), seen),
+        _stable_repr(field.field_info),
+    )
+
+
+def _get_route_signature(route: routing.APIRoute, seen: Set[Any]) -> Any:
+    response_class = route.response_class
+    if isinstance(response_class, DefaultPlaceholder):
+        response_class = response_class.value
+    flat_dependant = get_flat_dependant(route.dependant, skip_repeats=True)
+    return (
+        route.path_format,
+        sorted(route.methods or []),
+        route.name,
+        route.operation_id,
+        route.unique_id,
+        route.summary,
+        route.description,
+        route.response_description,
+        [str(tag) for tag in route.tags],
+        route.deprecated,
+        route.include_in_schema,
+        route.status_code,
+        _stable_repr(response_class),
+        _stable_repr(route.responses),
+        _stable_repr(route.openapi_extra),
+        [
+            _get_field_signature(field, seen)
+            for field in get_flat_params(route.dependant)
+        ],
+        [
+            (_stable_repr(requirement.security_scheme.model), requirement.scopes)
+            for requirement in flat_dependant.security_requirements
+        ],
+        _get_field_signature(route.body_field, seen),
+        _get_field_signature(route.response_field, seen),
+        [
+            (status_code, _get_field_signature(field, seen))
+            for status_code, field in route.response_fields.items()
+        ],
+        [
+            _get_route_signature(callback, seen)
+            for callback in route.callbacks or []
+            if isinstance(callback, routing.APIRoute)
+        ],
+    )
+
+
+def get_openapi_checksum(
+    *,
+    title: str,
+    version: str,
+    openapi_version: str = "3.1.0",
+    summary: Optional[str] = None,
+    description: Optional[str] = None,
+    routes: Sequence[BaseRoute],
+    webhooks: Optional[Sequence[BaseRoute]] = None,
+    tags: Optional[List[Dict[str, Any]]] = None,
+    servers: Optional[List[Dict[str, Union[str, Any]]]] = None,
+    terms_of_service: Optional[str] = None,
+    contact: Optional[Dict[str, Union[str, Any]]] = None,
+    license_info: Optional[Dict[str, Union[str, Any]]] = None,
+    separate_input_output_schemas: bool = True,
+) -> str:
+    """
+    Return a checksum of what `get_openapi()` generates the schema from, the *path
+    operations* (their parameters, models, and metadata) and the rest of the
+    arguments, without generating it.
+    """
+    seen: Set[Any] = set()
+    signature = (
+        title,
+        version,
+        openapi_version,
+        summary,
+        description,
+        tags,
+        servers,
+        terms_of_service,
+        contact,
+        license_info,
+        separate_input_output_schemas,
+        [
+            _get_route_signature(route, seen)
+            for route in routes
+            if isinstance(route, routing.APIRoute)
+        ],
+        [
+            _get_route_signature(route, seen)
+            for route in webhooks or []
+            if isinstance(route, routing.APIRoute)
+        ],
+    )
+    return hashlib.sha256(_stable_repr(signature).encode("utf-8")).hexdigest()
+
+
 def get_openapi(
     *,
     title: str,
@@ -489,6 +865,8 @@ def get_openapi(
     contact: Optional[Dict[str, Union[str, Any]]] = None,
     license_info: Optional[Dict[str, Union[str, Any]]] = None,
     separate_input_output_schemas: bool = True,
+    fragments: Optional[OpenAPIFragments] = None,
+    validate: bool = True,
 ) -> Dict[str, Any]:
     info: Dict[str, Any] = {"title": title, "version": version}
     if summary:
@@ -507,63 +885,92 @@ def get_openapi(
     components: Dict[str, Dict[str, Any]] = {}
     paths: Dict[str, Dict[str, Any]] = {}
     webhook_paths: Dict[str, Dict[str, Any]] = {}
-    operation_ids: Set[str] = set()
-    all_fields = get_fields_from_routes(list(routes or []) + list(webhooks or []))
-    model_name_map = get_compat_model_name_map(all_fields)
-    schema_generator = GenerateJsonSchema(ref_template=REF_TEMPLATE)
-    field_mapping, definitions = get_definitions(
-        fields=all_fields,
-        schema_generator=schema_generator,
-        model_name_map=model_name_map,
-        separate_input_output_schemas=separate_input_output_schemas,
-    )
-    for route in routes or []:
-        if isinstance(route, routing.APIRoute):
-            result = get_openapi_path(
-                route=route,
-                operation_ids=operation_ids,
-                schema_generator=schema_generator,
-                model_name_map=model_name_map,
-                field_mapping=field_mapping,
-                separate_input_output_schemas=separate_input_output_schemas,
-            )
-            if result:
-                path, security_schemes, path_definitions = result
-                if path:
-                    paths.setdefault(route.path_format, {}).update(path)
-                if security_schemes:
-                    components.setdefault("securitySchemes", {}).update(
-                        security_schemes
+    if fragments is not None:
+        all_routes = list(routes or []) + list(webhooks or [])
+        fragments.update(
+            [route for route in all_routes if isinstance(route, routing.APIRoute)],
+            separate_input_output_schemas=separate_input_output_schemas,
+        )
+        route_fragments, definitions = fragments._get_fragments(routes or [])
+        webhook_fragments, webhook_definitions = fragments._get_fragments(
+            webhooks or []
+        )
+        definitions.update(webhook_definitions)
+        for fragment_paths, path_fragments in [
+            (paths, route_fragments),
+            (webhook_paths, webhook_fragments),
+        ]:
+            for fragment in path_fragments:
+                if fragment.path:
+                    fragment_paths.setdefault(fragment.route.path_format, {}).update(
+                        fragment.path
                     )
-                if path_definitions:
-                    definitions.update(path_definitions)
-    for webhook in webhooks or []:
-        if isinstance(webhook, routing.APIRoute):
-            result = get_openapi_path(
-                route=webhook,
-                operation_ids=operation_ids,
-                schema_generator=schema_generator,
-                model_name_map=model_name_map,
-                field_mapping=field_mapping,
-                separate_input_output_schemas=separate_input_output_schemas,
-            )
-            if result:
-                path, security_schemes, path_definitions = result
-                if path:
-                    webhook_paths.setdefault(webhook.path_format, {}).update(path)
-                if security_schemes:
+                if fragment.security_schemes:
                     components.setdefault("securitySchemes", {}).update(
-                        security_schemes
+                        fragment.security_schemes
                     )
-                if path_definitions:
-                    definitions.update(path_definitions)
+                if fragment.definitions:
+                    definitions.update(fragment.definitions)
+    else:
+        operation_ids: Set[str] = set()
+        all_fields = get_fields_from_routes(list(routes or []) + list(webhooks or []))
+        model_name_map = get_compat_model_name_map(all_fields)
+        schema_generator = GenerateJsonSchema(ref_template=REF_TEMPLATE)
+        field_mapping, definitions = get_definitions(
+            fields=all_fields,
+            schema_generator=schema_generator,
+            model_name_map=model_name_map,
+            separate_input_output_schemas=separate_input_output_schemas,
+        )
+        for route in routes or []:
+            if isinstance(route, routing.APIRoute):
+                result = get_openapi_path(
+                    route=route,
+                    operation_ids=operation_ids,
+                    schema_generator=schema_generator,
+                    model_name_map=model_name_map,
+                    field_mapping=field_mapping,
+                    separate_input_output_schemas=separate_input_output_schemas,
+                )
+                if result:
+                    path, security_schemes, path_definitions = result
+                    if path:
+                        paths.setdefault(route.path_format, {}).update(path)
+                    if security_schemes:
+                        components.setdefault("securitySchemes", {}).update(
+                            security_schemes
+                        )
+                    if path_definitions:
+                        definitions.update(path_definitions)
+        for webhook in webhooks or []:
+            if isinstance(webhook, routing.APIRoute):
+                result = get_openapi_path(
+                    route=webhook,
+                    operation_ids=operation_ids,
+                    schema_generator=schema_generator,
+                    model_name_map=model_name_map,
+                    field_mapping=field_mapping,
+                    separate_input_output_schemas=separate_input_output_schemas,
+                )
+                if result:
+                    path, security_schemes, path_definitions = result
+                    if path:
+                        webhook_paths.setdefault(webhook.path_format, {}).update(path)
+                    if security_schemes:
+                        components.setdefault("securitySchemes", {}).update(
+                            security_schemes
+                        )
+                    if path_definitions:
+                        definitions.update(path_definitions)
+    output["paths"] = paths
+    if webhook_paths:
+        output["webhooks"] = webhook_paths
     if definitions:
         components["schemas"] = {k: definitions[k] for k in sorted(definitions)}
     if components:
         output["components"] = components
-    output["paths"] = paths
-    if webhook_paths:
-        output["webhooks"] = webhook_paths
     if tags:
         output["tags"] = tags
+    if not validate:
+        return jsonable_encoder(output, exclude_none=True)  # type: ignore[no-any-return]
     return jsonable_encoder(OpenAPI(**output), by_alias=True, exclude_none=True)  # type: ignore
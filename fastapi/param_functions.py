@@ -2,8 +2,9 @@ from typing import Any, Callable, Dict, List, Optional, Sequence, Union
 
 from fastapi import params
 from fastapi._compat import Undefined
+from fastapi.cache import TTLCache
 from fastapi.openapi.models import Example
-from typing_extensions import Annotated, Doc, deprecated
+from typing_extensions import Annotated, Doc, Literal, deprecated
 
 _Unset: Any = Undefined
 
@@ -2244,6 +2245,55 @@ def Depends(  # noqa: N802
             """
         ),
     ] = True,
+    concurrent: Annotated[
+        bool,
+        Doc(
+            """
+            By default, dependencies are solved one after the other.
+
+            Set `concurrent` to `True` to allow this dependency to be solved at the
+            same time as the sibling dependencies next to it that also allow it.
+
+            Only `async def` dependencies without `yield` are solved concurrently,
+            and only when they don't share sub-dependencies with their siblings.
+            """
+        ),
+    ] = False,
+    scope: Annotated[
+        Literal["request", "app"],
+        Doc(
+            """
+            By default (`"request"`), the dependency is solved for each request.
+
+            Set `scope` to `"app"` to solve the dependency only once, when the
+            application starts, and re-use the same value for all the requests. If
+            the dependency uses `yield`, the code after `yield` is run when the
+            application shuts down. This is useful for things like connection pools,
+            HTTP clients, or settings.
+
+            Dependencies with `scope="app"`, and their sub-dependencies, can't
+            declare request parameters (like query parameters or the body) or use
+            the `Request`, `WebSocket`, `Response`, or `BackgroundTasks`.
+            """
+        ),
+    ] = "request",
+    cache: Annotated[
+        Optional[TTLCache],
+        Doc(
+            """
+            A `TTLCache` to keep the result of the dependency across requests, keyed
+            by the values of its parameters (including the results of its
+            sub-dependencies).
+
+            The same value is returned to all the requests with the same parameters,
+            so it should not be modified. Concurrent requests that miss the cache
+            with the same parameters call the dependency only once.
+
+            Dependencies with `yield` can't be cached, and cached dependencies can't
+            use the `Request`, `WebSocket`, `Response`, or `BackgroundTasks`.
+            """
+        ),
+    ] = None,
 ) -> Any:
     """
     Declare a FastAPI dependency.
@@ -2274,7 +2324,13 @@ def Depends(  # noqa: N802
         return commons
     ```
     """
-    return params.Depends(dependency=dependency, use_cache=use_cache)
+    return params.Depends(
+        dependency=dependency,
+        use_cache=use_cache,
+        concurrent=concurrent,
+        scope=scope,
+        cache=cache,
+    )
 
 
 def Security(  # noqa: N802
@@ -2321,6 +2377,55 @@ def Security(  # noqa: N802
             """
         ),
     ] = True,
+    concurrent: Annotated[
+        bool,
+        Doc(
+            """
+            By default, dependencies are solved one after the other.
+
+            Set `concurrent` to `True` to allow this dependency to be solved at the
+            same time as the sibling dependencies next to it that also allow it.
+
+            Only `async def` dependencies without `yield` are solved concurrently,
+            and only when they don't share sub-dependencies with their siblings.
+            """
+        ),
+    ] = False,
+    scope: Annotated[
+        Literal["request", "app"],
+        Doc(
+            """
+            By default (`"request"`), the dependency is solved for each request.
+
+            Set `scope` to `"app"` to solve the dependency only once, when the
+            application starts, and re-use the same value for all the requests. If
+            the dependency uses `yield`, the code after `yield` is run when the
+            application shuts down. This is useful for things like connection pools,
+            HTTP clients, or settings.
+
+            Dependencies with `scope="app"`, and their sub-dependencies, can't
+            declare request parameters (like query parameters or the body) or use
+            the `Request`, `WebSocket`, `Response`, or `BackgroundTasks`.
+            """
+        ),
+    ] = "request",
+    cache: Annotated[
+        Optional[TTLCache],
+        Doc(
+            """
+            A `TTLCache` to keep the result of the dependency across requests, keyed
+            by the values of its parameters (including the results of its
+            sub-dependencies).
+
+            The same value is returned to all the requests with the same parameters,
+            so it should not be modified. Concurrent requests that miss the cache
+            with the same parameters call the dependency only once.
+
+            Dependencies with `yield` can't be cached, and cached dependencies can't
+            use the `Request`, `WebSocket`, `Response`, or `BackgroundTasks`.
+            """
+        ),
+    ] = None,
 ) -> Any:
     """
     Declare a FastAPI Security dependency.
@@ -2357,4 +2462,11 @@ def Security(  # noqa: N802
         return [{"item_id": "Foo", "owner": current_user.username}]
     ```
     """
-    return params.Security(dependency=dependency, scopes=scopes, use_cache=use_cache)
+    return params.Security(
+        dependency=dependency,
+        scopes=scopes,
+        use_cache=use_cache,
+        concurrent=concurrent,
+        scope=scope,
+        cache=cache,
+    )
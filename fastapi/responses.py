@@ -1,5 +1,8 @@
-from typing import Any
+from typing import Any, AsyncIterator, Mapping, Optional
 
+import anyio
+from fastapi.encoders import iter_json
+from starlette.background import BackgroundTask
 from starlette.responses import FileResponse as FileResponse  # noqa
 from starlette.responses import HTMLResponse as HTMLResponse  # noqa
 from starlette.responses import JSONResponse as JSONResponse  # noqa
@@ -46,3 +49,38 @@ class ORJSONResponse(JSONResponse):
         return orjson.dumps(
             content, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
         )
+
+
+class StreamingJSONResponse(StreamingResponse):
+    """
+    JSON response that converts the content with `jsonable_encoder` and sends it
+    in chunks as it is encoded, without building the whole body in memory.
+
+    Other requests can run between chunks, so a very large response doesn't block
+    them.
+    """
+
+    media_type = "application/json"
+
+    def __init__(
+        self,
+        content: Any,
+        status_code: int = 200,
+        headers: Optional[Mapping[str, str]] = None,
+        media_type: Optional[str] = None,
+        background: Optional[BackgroundTask] = None,
+        chunk_size: int = 65536,
+    ) -> None:
+        super().__init__(
+            self._iter_chunks(content, chunk_size),
+            status_code=status_code,
+            headers=headers,
+            media_type=media_type,
+            background=background,
+        )
+
+    async def _iter_chunks(self, content: Any, chunk_size: int) -> AsyncIterator[bytes]:
+        for chunk in iter_json(content, chunk_size=chunk_size):
+            yield chunk
+            # Let other tasks run before encoding the next chunk
+            await anyio.sleep(0)
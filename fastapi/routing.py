@@ -1,8 +1,10 @@
 import asyncio
 import dataclasses
 import email.message
+import heapq
 import inspect
 import json
+import re
 from contextlib import AsyncExitStack, asynccontextmanager
 from enum import Enum, IntEnum
 from typing import (
@@ -11,9 +13,11 @@ from typing import (
     Callable,
     Coroutine,
     Dict,
+    Iterable,
     List,
     Mapping,
     Optional,
+    Pattern,
     Sequence,
     Set,
     Tuple,
@@ -29,19 +33,31 @@ from fastapi._compat import (
     _model_dump,
     _normalize_errors,
     lenient_issubclass,
+    rename_model_field,
+)
+from fastapi.cache import (
+    RequestCoalescer,
+    ResponseCache,
+    _etag_matches,
+    _get_conditional_response,
+    _get_not_modified_response,
+    _quote_etag,
+    _set_etag,
 )
 from fastapi.datastructures import Default, DefaultPlaceholder
 from fastapi.dependencies.models import Dependant
 from fastapi.dependencies.utils import (
+    DependencyPlan,
     _should_embed_body_fields,
     get_body_field,
     get_dependant,
+    get_dependency_plan,
     get_flat_dependant,
     get_parameterless_sub_dependant,
     get_typed_return_annotation,
-    solve_dependencies,
+    solve_dependency_plan,
 )
-from fastapi.encoders import jsonable_encoder
+from fastapi.encoders import _get_dataclass_dict, jsonable_encoder
 from fastapi.exceptions import (
     FastAPIError,
     RequestValidationError,
@@ -53,15 +69,17 @@ from fastapi.utils import (
     create_cloned_field,
     create_model_field,
     generate_unique_id,
+    get_path_param_names,
     get_value_or_default,
     is_body_allowed_for_status_code,
 )
 from pydantic import BaseModel
-from starlette import routing
+from starlette import convertors, routing
 from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import URL
 from starlette.exceptions import HTTPException
 from starlette.requests import Request
-from starlette.responses import JSONResponse, Response
+from starlette.responses import JSONResponse, RedirectResponse, Response
 from starlette.routing import (
     BaseRoute,
     Match,
@@ -71,7 +89,7 @@ from starlette.routing import (
     websocket_session,
 )
 from starlette.routing import Mount as Mount  # noqa
-from starlette.types import AppType, ASGIApp, Lifespan, Scope
+from starlette.types import AppType, ASGIApp, Lifespan, Receive, Scope, Send
 from starlette.websockets import WebSocket
 from typing_extensions import Annotated, Doc, deprecated
 
@@ -119,10 +137,36 @@ def _prepare_response_content(
             for k, v in res.items()
         }
     elif dataclasses.is_dataclass(res):
-        return dataclasses.asdict(res)
+        return _dataclass_to_dict(res)
     return res
 
 
+def _dataclass_to_dict(obj: Any) -> Any:
+    # Like dataclasses.asdict(), without the deep copy of the other values, they are
+    # only validated with the response model
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return {
+            name: _dataclass_to_dict(value)
+            for name, value in _get_dataclass_dict(obj).items()
+        }
+    elif isinstance(obj, tuple) and hasattr(obj, "_fields"):
+        # A named tuple
+        return type(obj)(*[_dataclass_to_dict(value) for value in obj])
+    elif isinstance(obj, (list, tuple)):
+        return type(obj)(_dataclass_to_dict(value) for value in obj)
+    elif isinstance(obj, dict):
+        if hasattr(type(obj), "default_factory"):
+            result = type(obj)(obj.default_factory)  # type: ignore[attr-defined]
+            for key, value in obj.items():
+                result[_dataclass_to_dict(key)] = _dataclass_to_dict(value)
+            return result
+        return type(obj)(
+            (_dataclass_to_dict(key), _dataclass_to_dict(value))
+            for key, value in obj.items()
+        )
+    return obj
+
+
 def _merge_lifespan_context(
     original_context: Lifespan[Any], nested_context: Lifespan[Any]
 ) -> Lifespan[Any]:
@@ -151,6 +195,7 @@ async def serialize_response(
     exclude_defaults: bool = False,
     exclude_none: bool = False,
     is_coroutine: bool = True,
+    dump_json: bool = False,
 ) -> Any:
     if field:
         errors = []
@@ -177,6 +222,17 @@ async def serialize_response(
                 errors=_normalize_errors(errors), body=response_content
             )
 
+        if dump_json and hasattr(field, "serialize_json"):
+            return field.serialize_json(
+                value,
+                include=include,
+                exclude=exclude,
+                by_alias=by_alias,
+                exclude_unset=exclude_unset,
+                exclude_defaults=exclude_defaults,
+                exclude_none=exclude_none,
+            )
+
         if hasattr(field, "serialize"):
             return field.serialize(
                 value,
@@ -201,6 +257,42 @@ async def serialize_response(
         return jsonable_encoder(response_content)
 
 
+class _JSONBytesResponse(JSONResponse):
+    # The content was already serialized to JSON bytes by Pydantic
+    def render(self, content: bytes) -> bytes:
+        return content
+
+
+def _is_json_bytes_body_field(field: ModelField) -> bool:
+    # Only a Pydantic model that is not re-validated can be validated from the raw
+    # bytes, request_body_to_args() then takes the validated instance as is
+    if not hasattr(field, "validate_json") or not lenient_issubclass(
+        field.type_, BaseModel
+    ):
+        return False
+    config = _get_model_config(field.type_)
+    return bool(config.get("revalidate_instances", "never") != "always")
+
+
+def _get_current_dependency_plan(
+    dependant: Dependant,
+    *,
+    dependency_plan: DependencyPlan,
+    dependency_overrides_provider: Optional[Any],
+) -> DependencyPlan:
+    # The plan compiled at startup can't know about dependency overrides, they can
+    # be set and changed at any point (e.g. in tests)
+    if dependency_overrides_provider and getattr(
+        dependency_overrides_provider, "dependency_overrides", None
+    ):
+        return get_dependency_plan(
+            dependant,
+            dependency_overrides_provider=dependency_overrides_provider,
+            concurrent=dependency_plan.concurrent,
+        )
+    return dependency_plan
+
+
 async def run_endpoint_function(
     *, dependant: Dependant, values: Dict[str, Any], is_coroutine: bool
 ) -> Any:
@@ -228,17 +320,55 @@ def get_request_handler(
     response_model_exclude_none: bool = False,
     dependency_overrides_provider: Optional[Any] = None,
     embed_body_fields: bool = False,
+    validate_json_bytes: Union[bool, DefaultPlaceholder] = Default(False),
+    serialize_json_bytes: Union[bool, DefaultPlaceholder] = Default(False),
+    concurrent_dependencies: Union[bool, DefaultPlaceholder] = Default(False),
+    etag: Union[bool, DefaultPlaceholder] = Default(False),
+    response_cache: Optional[ResponseCache] = None,
+    request_coalescer: Optional[RequestCoalescer] = None,
 ) -> Callable[[Request], Coroutine[Any, Any, Response]]:
     assert dependant.call is not None, "dependant.call must be a function"
     is_coroutine = asyncio.iscoroutinefunction(dependant.call)
     is_body_form = body_field and isinstance(body_field.field_info, params.Form)
+    if isinstance(concurrent_dependencies, DefaultPlaceholder):
+        concurrent_dependencies = concurrent_dependencies.value
+    if isinstance(etag, DefaultPlaceholder):
+        etag = etag.value
+    dependency_plan = get_dependency_plan(
+        dependant, concurrent=bool(concurrent_dependencies)
+    )
+    app_dependency_store = getattr(
+        dependency_overrides_provider, "app_dependency_store", None
+    )
     if isinstance(response_class, DefaultPlaceholder):
         actual_response_class: Type[Response] = response_class.value
     else:
         actual_response_class = response_class
-
-    async def app(request: Request) -> Response:
+    if isinstance(serialize_json_bytes, DefaultPlaceholder):
+        serialize_json_bytes = serialize_json_bytes.value
+    # Serialize directly to JSON bytes with Pydantic when enabled and the
+    # response class wouldn't do anything different from json.dumps()
+    dump_json = bool(
+        serialize_json_bytes
+        and response_field is not None
+        and actual_response_class is JSONResponse
+        and hasattr(response_field, "serialize_json")
+    )
+    if isinstance(validate_json_bytes, DefaultPlaceholder):
+        validate_json_bytes = validate_json_bytes.value
+    json_bytes_body_field: Optional[ModelField] = None
+    if (
+        validate_json_bytes
+        and body_field
+        and not is_body_form
+        and not embed_body_fields
+        and _is_json_bytes_body_field(body_field)
+    ):
+        json_bytes_body_field = body_field
+
+    async def handle_request(request: Request) -> Response:
         response: Union[Response, None] = None
+        body_validated_from_bytes = False
         async with AsyncExitStack() as file_stack:
             try:
                 body: Any = None
@@ -250,16 +380,30 @@ def get_request_handler(
                         body_bytes = await request.body()
                         if body_bytes:
                             json_body: Any = Undefined
+                            is_json_body = False
                             content_type_value = request.headers.get("content-type")
                             if not content_type_value:
-                                json_body = await request.json()
+                                is_json_body = True
                             else:
                                 message = email.message.Message()
                                 message["content-type"] = content_type_value
                                 if message.get_content_maintype() == "application":
                                     subtype = message.get_content_subtype()
                                     if subtype == "json" or subtype.endswith("+json"):
-                                        json_body = await request.json()
+                                        is_json_body = True
+                            if is_json_body and json_bytes_body_field:
+                                # Parse and validate in a single pass, the validated
+                                # model is then accepted as is by
+                                # request_body_to_args(). On any error, fall back to
+                                # the standard JSON parsing to generate the same errors.
+                                value, errors_ = json_bytes_body_field.validate_json(
+                                    body_bytes, loc=("body",)
+                                )
+                                if not errors_:
+                                    json_body = value
+                                    body_validated_from_bytes = True
+                            if is_json_body and json_body is Undefined:
+                                json_body = await request.json()
                             if json_body != Undefined:
                                 body = json_body
                             else:
@@ -288,13 +432,17 @@ def get_request_handler(
                 raise http_error from e
             errors: List[Any] = []
             async with AsyncExitStack() as async_exit_stack:
-                solved_result = await solve_dependencies(
+                solved_result = await solve_dependency_plan(
                     request=request,
-                    dependant=dependant,
+                    plan=_get_current_dependency_plan(
+                        dependant,
+                        dependency_plan=dependency_plan,
+                        dependency_overrides_provider=dependency_overrides_provider,
+                    ),
                     body=body,
-                    dependency_overrides_provider=dependency_overrides_provider,
                     async_exit_stack=async_exit_stack,
                     embed_body_fields=embed_body_fields,
+                    app_dependency_store=app_dependency_store,
                 )
                 errors = solved_result.errors
                 if not errors:
@@ -324,6 +472,23 @@ def get_request_handler(
                             response_args["status_code"] = (
                                 solved_result.response.status_code
                             )
+                        version_etag = solved_result.response.headers.get("etag")
+                        if (
+                            etag
+                            and version_etag is not None
+                            and request.method in ("GET", "HEAD")
+                            and response_args.get("status_code", 200) == 200
+                        ):
+                            # The ETag set by the endpoint is enough to know if
+                            # the client has this version, without serializing it
+                            version_etag = _quote_etag(version_etag)
+                            solved_result.response.headers["etag"] = version_etag
+                            if _etag_matches(request, version_etag):
+                                response = _get_not_modified_response(
+                                    solved_result.response
+                                )
+                                response.background = solved_result.background_tasks
+                                return response
                         content = await serialize_response(
                             field=response_field,
                             response_content=raw_response,
@@ -334,12 +499,19 @@ def get_request_handler(
                             exclude_defaults=response_model_exclude_defaults,
                             exclude_none=response_model_exclude_none,
                             is_coroutine=is_coroutine,
+                            dump_json=dump_json,
                         )
-                        response = actual_response_class(content, **response_args)
+                        if dump_json:
+                            response = _JSONBytesResponse(content, **response_args)
+                        else:
+                            response = actual_response_class(content, **response_args)
                         if not is_body_allowed_for_status_code(response.status_code):
                             response.body = b""
                         response.headers.raw.extend(solved_result.response.headers.raw)
             if errors:
+                if body_validated_from_bytes:
+                    # Keep the same body as when parsing JSON, not the model
+                    body = await request.json()
                 validation_error = RequestValidationError(
                     _normalize_errors(errors), body=body
                 )
@@ -352,6 +524,27 @@ def get_request_handler(
                 "and is not raising the exception again. Read more about it in the "
                 "docs: https://fastapi.tiangolo.com/tutorial/dependencies/dependencies-with-yield/#dependencies-with-yield-and-except"
             )
+        if etag and request.method in ("GET", "HEAD"):
+            _set_etag(response)
+        return response
+
+    if response_cache is None and request_coalescer is None and not etag:
+        return handle_request
+
+    async def render(request: Request) -> Response:
+        if request_coalescer is None:
+            return await handle_request(request)
+        # The same requests in flight wait for the response of the first one
+        return await request_coalescer.get_or_render(request, handle_request)
+
+    async def app(request: Request) -> Response:
+        if response_cache is None:
+            response = await render(request)
+        else:
+            # Cached responses skip the body parsing and the dependencies
+            response = await response_cache.get_or_render(request, render)
+        if etag:
+            response = _get_conditional_response(request, response)
         return response
 
     return app
@@ -362,18 +555,27 @@ def get_websocket_app(
     dependency_overrides_provider: Optional[Any] = None,
     embed_body_fields: bool = False,
 ) -> Callable[[WebSocket], Coroutine[Any, Any, Any]]:
+    dependency_plan = get_dependency_plan(dependant)
+    app_dependency_store = getattr(
+        dependency_overrides_provider, "app_dependency_store", None
+    )
+
     async def app(websocket: WebSocket) -> None:
         async with AsyncExitStack() as async_exit_stack:
             # TODO: remove this scope later, after a few releases
             # This scope fastapi_astack is no longer used by FastAPI, kept for
             # compatibility, just in case
             websocket.scope["fastapi_astack"] = async_exit_stack
-            solved_result = await solve_dependencies(
+            solved_result = await solve_dependency_plan(
                 request=websocket,
-                dependant=dependant,
-                dependency_overrides_provider=dependency_overrides_provider,
+                plan=_get_current_dependency_plan(
+                    dependant,
+                    dependency_plan=dependency_plan,
+                    dependency_overrides_provider=dependency_overrides_provider,
+                ),
                 async_exit_stack=async_exit_stack,
                 embed_body_fields=embed_body_fields,
+                app_dependency_store=app_dependency_store,
             )
             if solved_result.errors:
                 raise WebSocketRequestValidationError(
@@ -425,7 +627,26 @@ class APIWebSocketRoute(routing.WebSocketRoute):
         return match, child_scope
 
 
+# The attributes of an APIRoute that are set by APIRoute.compile()
+_compiled_route_attributes = frozenset(
+    (
+        "response_field",
+        "secure_cloned_response_field",
+        "response_fields",
+        "dependant",
+        "_flat_dependant",
+        "_embed_body_fields",
+        "body_field",
+        "app",
+    )
+)
+
+
 class APIRoute(routing.Route):
+    # Declared for mypy, they are also read from the source route of a copy
+    dependant: Dependant
+    response_field: ModelField
+
     def __init__(
         self,
         path: str,
@@ -459,6 +680,14 @@ class APIRoute(routing.Route):
         generate_unique_id_function: Union[
             Callable[["APIRoute"], str], DefaultPlaceholder
         ] = Default(generate_unique_id),
+        validate_json_bytes: Union[bool, DefaultPlaceholder] = Default(False),
+        serialize_json_bytes: Union[bool, DefaultPlaceholder] = Default(False),
+        concurrent_dependencies: Union[bool, DefaultPlaceholder] = Default(False),
+        etag: Union[bool, DefaultPlaceholder] = Default(False),
+        lazy_compile: Union[bool, DefaultPlaceholder] = Default(False),
+        source_route: Optional["APIRoute"] = None,
+        cache: Optional[ResponseCache] = None,
+        coalesce: Optional[RequestCoalescer] = None,
     ) -> None:
         self.path = path
         self.endpoint = endpoint
@@ -485,6 +714,13 @@ class APIRoute(routing.Route):
         self.callbacks = callbacks
         self.openapi_extra = openapi_extra
         self.generate_unique_id_function = generate_unique_id_function
+        self.validate_json_bytes = validate_json_bytes
+        self.serialize_json_bytes = serialize_json_bytes
+        self.concurrent_dependencies = concurrent_dependencies
+        self.etag = etag
+        self.lazy_compile = lazy_compile
+        self.cache = cache
+        self.coalesce = coalesce
         self.tags = tags or []
         self.responses = responses or {}
         self.name = get_name(endpoint) if name is None else name
@@ -492,6 +728,9 @@ class APIRoute(routing.Route):
         if methods is None:
             methods = ["GET"]
         self.methods: Set[str] = {method.upper() for method in methods}
+        assert cache is None or self.methods <= {"GET", "HEAD"}, (
+            "A response cache can only be used with GET and HEAD path operations"
+        )
         if isinstance(generate_unique_id_function, DefaultPlaceholder):
             current_generate_unique_id: Callable[[APIRoute], str] = (
                 generate_unique_id_function.value
@@ -503,35 +742,75 @@ class APIRoute(routing.Route):
         if isinstance(status_code, IntEnum):
             status_code = int(status_code)
         self.status_code = status_code
+        self.dependencies = list(dependencies or [])
+        self.description = description or inspect.cleandoc(self.endpoint.__doc__ or "")
+        # if a "form feed" character (page break) is found in the description text,
+        # truncate description text to the content preceding the first "form feed"
+        self.description = self.description.split("\f")[0].strip()
+        assert callable(endpoint), "An endpoint must be a callable"
+        # The route this one was included from, to reuse its analysis in compile()
+        self._source_route = source_route
+        self._compiled = False
+        if isinstance(lazy_compile, DefaultPlaceholder):
+            lazy_compile = lazy_compile.value
+        if not lazy_compile:
+            self.compile()
+
+    def compile(self) -> None:
+        """
+        Create the response fields, the dependant, the body field and the ASGI app
+        of this *path operation*.
+
+        With `lazy_compile`, this is called the first time one of them is used
+        instead of when the route is created.
+        """
+        if self._compiled:
+            return
+        source_route = self._get_source_route()
+        status_code = self.status_code
+        self.secure_cloned_response_field: Optional[ModelField]
         if self.response_model:
             assert is_body_allowed_for_status_code(status_code), (
                 f"Status code {status_code} must not have a response body"
             )
             response_name = "Response_" + self.unique_id
-            self.response_field = create_model_field(
-                name=response_name,
-                type_=self.response_model,
-                mode="serialization",
-            )
-            # Create a clone of the field, so that a Pydantic submodel is not returned
-            # as is just because it's an instance of a subclass of a more limited class
-            # e.g. UserInDB (containing hashed_password) could be a subclass of User
-            # that doesn't have the hashed_password. But because it's a subclass, it
-            # would pass the validation and be returned as is.
-            # By being a new field, no inheritance will be passed as is. A new model
-            # will always be created.
-            # TODO: remove when deprecating Pydantic v1
-            self.secure_cloned_response_field: Optional[ModelField] = (
-                create_cloned_field(self.response_field)
-            )
+            if (
+                source_route is not None
+                and source_route.response_model is self.response_model
+            ):
+                self.response_field = rename_model_field(
+                    source_route.response_field, response_name
+                )
+                if (
+                    source_route.secure_cloned_response_field
+                    is source_route.response_field
+                ):
+                    self.secure_cloned_response_field = self.response_field
+                else:
+                    self.secure_cloned_response_field = rename_model_field(
+                        source_route.secure_cloned_response_field,  # type: ignore[arg-type]
+                        response_name,
+                    )
+            else:
+                self.response_field = create_model_field(
+                    name=response_name,
+                    type_=self.response_model,
+                    mode="serialization",
+                )
+                # Create a clone of the field, so that a Pydantic submodel is not
+                # returned as is just because it's an instance of a subclass of a more
+                # limited class e.g. UserInDB (containing hashed_password) could be a
+                # subclass of User that doesn't have the hashed_password. But because
+                # it's a subclass, it would pass the validation and be returned as is.
+                # By being a new field, no inheritance will be passed as is. A new
+                # model will always be created.
+                # TODO: remove when deprecating Pydantic v1
+                self.secure_cloned_response_field = create_cloned_field(
+                    self.response_field
+                )
         else:
             self.response_field = None  # type: ignore
             self.secure_cloned_response_field = None
-        self.dependencies = list(dependencies or [])
-        self.description = description or inspect.cleandoc(self.endpoint.__doc__ or "")
-        # if a "form feed" character (page break) is found in the description text,
-        # truncate description text to the content preceding the first "form feed"
-        self.description = self.description.split("\f")[0].strip()
         response_fields = {}
         for additional_status_code, response in self.responses.items():
             assert isinstance(response, dict), "An additional response must be a dict"
@@ -541,22 +820,47 @@ class APIRoute(routing.Route):
                     f"Status code {additional_status_code} must not have a response body"
                 )
                 response_name = f"Response_{additional_status_code}_{self.unique_id}"
-                response_field = create_model_field(
-                    name=response_name, type_=model, mode="serialization"
-                )
+                source_field = None
+                if source_route is not None:
+                    source_response = source_route.responses.get(additional_status_code)
+                    if source_response and source_response.get("model") is model:
+                        source_field = source_route.response_fields.get(
+                            additional_status_code
+                        )
+                if source_field is not None:
+                    response_field = rename_model_field(source_field, response_name)
+                else:
+                    response_field = create_model_field(
+                        name=response_name, type_=model, mode="serialization"
+                    )
                 response_fields[additional_status_code] = response_field
         if response_fields:
             self.response_fields: Dict[Union[int, str], ModelField] = response_fields
         else:
             self.response_fields = {}
-
-        assert callable(endpoint), "An endpoint must be a callable"
-        self.dependant = get_dependant(path=self.path_format, call=self.endpoint)
-        for depends in self.dependencies[::-1]:
-            self.dependant.dependencies.insert(
-                0,
-                get_parameterless_sub_dependant(depends=depends, path=self.path_format),
+        if source_route is not None:
+            # Only the dependencies added when including the router are analyzed
+            included_count = len(self.dependencies) - len(source_route.dependencies)
+            self.dependant = dataclasses.replace(
+                source_route.dependant,
+                path=self.path_format,
+                dependencies=[
+                    get_parameterless_sub_dependant(
+                        depends=depends, path=self.path_format
+                    )
+                    for depends in self.dependencies[:included_count]
+                ]
+                + source_route.dependant.dependencies,
             )
+        else:
+            self.dependant = get_dependant(path=self.path_format, call=self.endpoint)
+            for depends in self.dependencies[::-1]:
+                self.dependant.dependencies.insert(
+                    0,
+                    get_parameterless_sub_dependant(
+                        depends=depends, path=self.path_format
+                    ),
+                )
         self._flat_dependant = get_flat_dependant(self.dependant)
         self._embed_body_fields = _should_embed_body_fields(
             self._flat_dependant.body_params
@@ -567,6 +871,43 @@ class APIRoute(routing.Route):
             embed_body_fields=self._embed_body_fields,
         )
         self.app = request_response(self.get_route_handler())
+        self._compiled = True
+        self._source_route = None
+
+    def _get_source_route(self) -> Optional["APIRoute"]:
+        # The analysis of the included route can be reused if it was already
+        # compiled, its path has the same path params and it has the same
+        # dependencies at the end
+        source_route = self._source_route
+        if (
+            source_route is None
+            or not source_route._compiled
+            or source_route.endpoint is not self.endpoint
+            or get_path_param_names(source_route.path_format)
+            != get_path_param_names(self.path_format)
+        ):
+            return None
+        included_count = len(self.dependencies) - len(source_route.dependencies)
+        if included_count < 0 or any(
+            depends is not source_depends
+            for depends, source_depends in zip(
+                self.dependencies[included_count:], source_route.dependencies
+            )
+        ):
+            return None
+        return source_route
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for the attributes that are not set, with lazy_compile, the
+        # ones set by compile()
+        if name in _compiled_route_attributes and not self.__dict__.get(
+            "_compiled", True
+        ):
+            self.compile()
+            return getattr(self, name)
+        raise AttributeError(
+            f"{type(self).__name__!r} object has no attribute {name!r}"
+        )
 
     def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
         return get_request_handler(
@@ -583,6 +924,12 @@ class APIRoute(routing.Route):
             response_model_exclude_none=self.response_model_exclude_none,
             dependency_overrides_provider=self.dependency_overrides_provider,
             embed_body_fields=self._embed_body_fields,
+            validate_json_bytes=self.validate_json_bytes,
+            serialize_json_bytes=self.serialize_json_bytes,
+            concurrent_dependencies=self.concurrent_dependencies,
+            etag=self.etag,
+            response_cache=self.cache,
+            request_coalescer=self.coalesce,
         )
 
     def matches(self, scope: Scope) -> Tuple[Match, Scope]:
@@ -592,6 +939,216 @@ class APIRoute(routing.Route):
         return match, child_scope
 
 
+# Convertors that only match within a single path segment
+_segment_convertors = (
+    convertors.StringConvertor,
+    convertors.IntegerConvertor,
+    convertors.FloatConvertor,
+    convertors.UUIDConvertor,
+)
+
+
+# Taken from Starlette as is, it's not part of its public API
+def _get_route_path(scope: Scope) -> str:
+    path: str = scope["path"]
+    root_path = scope.get("root_path", "")
+    if not root_path:
+        return path
+
+    if not path.startswith(root_path):
+        return path
+
+    if path == root_path:
+        return ""
+
+    if path[len(root_path)] == "/":
+        return path[len(root_path) :]
+
+    return path
+
+
+def _track_changes(name: str, *, rebuild: bool = True) -> Any:
+    method = getattr(list, name)
+
+    def tracked(self: "_RouteList", *args: Any, **kwargs: Any) -> Any:
+        result = method(self, *args, **kwargs)
+        self.version += 1
+        if rebuild:
+            self.rebuild_version += 1
+        return result
+
+    tracked.__name__ = name
+    return tracked
+
+
+class _RouteList(List[BaseRoute]):
+    """
+    The routes of an `APIRouter`, a list that counts its changes, so that the
+    route index knows when it's out of date.
+
+    `version` changes with every change, `rebuild_version` only with the changes
+    that don't just add routes at the end.
+    """
+
+    version = 0
+    rebuild_version = 0
+
+    append = _track_changes("append", rebuild=False)
+    extend = _track_changes("extend", rebuild=False)
+    __iadd__ = _track_changes("__iadd__", rebuild=False)
+    insert = _track_changes("insert")
+    remove = _track_changes("remove")
+    pop = _track_changes("pop")
+    clear = _track_changes("clear")
+    sort = _track_changes("sort")
+    reverse = _track_changes("reverse")
+    __setitem__ = _track_changes("__setitem__")
+    __delitem__ = _track_changes("__delitem__")
+    __imul__ = _track_changes("__imul__")
+
+
+class _RouteIndexNode:
+    __slots__ = ("static", "params", "routes", "catch_all")
+
+    def __init__(self) -> None:
+        self.static: Dict[str, _RouteIndexNode] = {}
+        # The children for param segments, by the regex of their convertor, None
+        # for segments that mix params and text
+        self.params: Dict[
+            Optional[str], Tuple[Optional[Pattern[str]], _RouteIndexNode]
+        ] = {}
+        # The routes with a path that ends at this node
+        self.routes: List[int] = []
+        # The routes that can match any path that continues after this node, like
+        # mounts and routes with path params using the path convertor
+        self.catch_all: List[int] = []
+
+
+class _RouteIndex:
+    """
+    An index of the routes of a router, used to find the routes that could match a
+    path without trying all of them.
+
+    Routes with a static path are found in a dict by their path. With `radix`, the
+    rest are found with a prefix tree of their path segments, otherwise they are
+    all candidates.
+
+    It only narrows down the candidates, in their declaration order, each candidate
+    is still checked with `route.matches()`.
+    """
+
+    def __init__(self, routes: _RouteList, *, radix: bool = False) -> None:
+        self.routes = routes
+        self.radix = radix
+        self.size = 0
+        self.version = routes.version
+        self.rebuild_version = routes.rebuild_version
+        self.static: Dict[str, List[int]] = {}
+        self.dynamic: List[int] = []
+        self.root = _RouteIndexNode()
+        # The routes that can't be indexed by path, like Host routes
+        self.any_path: List[int] = []
+        self.add_routes()
+
+    def is_current(self) -> bool:
+        return self.routes.version == self.version
+
+    def can_extend(self) -> bool:
+        # If routes were only appended, the indexed routes didn't move
+        return self.routes.rebuild_version == self.rebuild_version
+
+    def add_routes(self) -> None:
+        for index in range(self.size, len(self.routes)):
+            self._add_route(index, self.routes[index])
+        self.size = len(self.routes)
+        self.version = self.routes.version
+
+    def _add_route(self, index: int, route: BaseRoute) -> None:
+        path_format = getattr(route, "path_format", None)
+        param_convertors = getattr(route, "param_convertors", None)
+        if (
+            isinstance(route, (routing.Route, routing.WebSocketRoute))
+            and not param_convertors
+            and path_format == route.path
+        ):
+            self.static.setdefault(route.path, []).append(index)
+            return
+        self.dynamic.append(index)
+        if not self.radix:
+            return
+        if (
+            not isinstance(route, (routing.Route, routing.WebSocketRoute, Mount))
+            or not isinstance(path_format, str)
+            or not path_format.startswith("/")
+            or param_convertors is None
+        ):
+            self.any_path.append(index)
+            return
+        node = self.root
+        for segment in path_format.split("/")[1:]:
+            if "{" not in segment:
+                node = node.static.setdefault(segment, _RouteIndexNode())
+                continue
+            param_match = routing.PARAM_REGEX.fullmatch(segment)
+            if param_match:
+                convertor = param_convertors.get(param_match.group(1))
+                if not isinstance(convertor, _segment_convertors):
+                    node.catch_all.append(index)
+                    return
+                key: Optional[str] = convertor.regex
+            else:
+                names = routing.PARAM_REGEX.findall(segment)
+                if not all(
+                    isinstance(param_convertors.get(name), _segment_convertors)
+                    for name, _ in names
+                ):
+                    node.catch_all.append(index)
+                    return
+                key = None
+            if key not in node.params:
+                regex = None if key is None else re.compile(key)
+                node.params[key] = (regex, _RouteIndexNode())
+            node = node.params[key][1]
+        node.routes.append(index)
+
+    def get_candidates(self, route_path: str) -> Iterable[BaseRoute]:
+        # "$" in the route regexes also matches before a trailing newline
+        if not route_path.startswith("/") or route_path.endswith("\n"):
+            return self.routes
+        static_indexes = self.static.get(route_path)
+        dynamic_indexes = (
+            self._get_dynamic_candidates(route_path) if self.radix else self.dynamic
+        )
+        if not static_indexes:
+            indexes: Iterable[int] = dynamic_indexes
+        elif not dynamic_indexes:
+            indexes = static_indexes
+        else:
+            indexes = heapq.merge(static_indexes, dynamic_indexes)
+        routes = self.routes
+        return [routes[index] for index in indexes]
+
+    def _get_dynamic_candidates(self, route_path: str) -> List[int]:
+        segments = route_path.split("/")[1:]
+        indexes = list(self.any_path)
+        nodes: List[Tuple[_RouteIndexNode, int]] = [(self.root, 0)]
+        while nodes:
+            node, position = nodes.pop()
+            if position == len(segments):
+                indexes.extend(node.routes)
+                continue
+            indexes.extend(node.catch_all)
+            segment = segments[position]
+            child = node.static.get(segment)
+            if child is not None:
+                nodes.append((child, position + 1))
+            for regex, param_child in node.params.values():
+                if regex is None or regex.fullmatch(segment):
+                    nodes.append((param_child, position + 1))
+        indexes.sort()
+        return indexes
+
+
 class APIRouter(routing.Router):
     """
     `APIRouter` class, used to group *path operations*, for example to structure
@@ -833,6 +1390,93 @@ class APIRouter(routing.Router):
                 """
             ),
         ] = Default(generate_unique_id),
+        validate_json_bytes: Annotated[
+            bool,
+            Doc(
+                """
+                Validate JSON request bodies with Pydantic directly from the raw
+                bytes, parsing and validating them in a single pass, for the *path
+                operations* in this router that receive a single (not embedded)
+                Pydantic model as the body.
+
+                The JSON is validated in Pydantic's JSON mode, so, for example, models
+                with `strict=True` accept values that are only valid in JSON, like
+                strings for dates.
+                """
+            ),
+        ] = Default(False),
+        serialize_json_bytes: Annotated[
+            bool,
+            Doc(
+                """
+                Serialize the responses of the *path operations* in this router with a
+                response model and the default `JSONResponse` with Pydantic directly to
+                JSON bytes, in a single pass, instead of converting them to JSON-
+                compatible data and then encoding it with `json.dumps()`.
+
+                The JSON is generated by Pydantic, so some floats are formatted
+                differently, like `1e16` instead of `1e+16`, and `NaN` and infinite
+                floats are sent as `null` instead of raising an error.
+                """
+            ),
+        ] = Default(False),
+        concurrent_dependencies: Annotated[
+            bool,
+            Doc(
+                """
+                Solve the sibling dependencies of the *path operations* in this router
+                at the same time, when they are `async def` functions without `yield`
+                that don't share sub-dependencies.
+
+                The values cached with `use_cache`, the validation errors, and the exit
+                order of dependencies with `yield` are the same as when they are solved
+                one after the other.
+                """
+            ),
+        ] = Default(False),
+        etag: Annotated[
+            bool,
+            Doc(
+                """
+                Add a strong `ETag` header to the `200` responses of the `GET` and
+                `HEAD` path operations in this router, and reply with an empty `304 Not
+                Modified` when the request's `If-None-Match` header matches it.
+
+                The `ETag` is a hash of the rendered body. If the path operation
+                function already sets an `ETag` header in the `Response` parameter, for
+                example with a version of the data it returns, that value is used
+                instead, and the response is not serialized at all when it matches.
+                """
+            ),
+        ] = Default(False),
+        lazy_compile: Annotated[
+            bool,
+            Doc(
+                """
+                Compile the *path operations* in this router lazily, the first time they
+                match a request or when they are needed, for example to generate the
+                OpenAPI schema, instead of when they are declared.
+
+                This makes startup faster for apps with a large number of routes. Errors
+                in the declaration of a *path operation* are only raised when it's
+                compiled, call `app.compile_all()` to compile all of them at once, for
+                example in tests or to warm up the app.
+                """
+            ),
+        ] = Default(False),
+        radix_routing: Annotated[
+            bool,
+            Doc(
+                """
+                Find the route for each request with a prefix tree of the path
+                segments of the routes, instead of trying each route in order.
+
+                The routes are still matched with the same precedence (the first one
+                declared wins), including "405 Method Not Allowed" responses. This is
+                useful for routers with a large number of routes.
+                """
+            ),
+        ] = False,
     ) -> None:
         super().__init__(
             routes=routes,
@@ -858,6 +1502,90 @@ class APIRouter(routing.Router):
         self.route_class = route_class
         self.default_response_class = default_response_class
         self.generate_unique_id_function = generate_unique_id_function
+        self.validate_json_bytes = validate_json_bytes
+        self.serialize_json_bytes = serialize_json_bytes
+        self.concurrent_dependencies = concurrent_dependencies
+        self.etag = etag
+        self.lazy_compile = lazy_compile
+        self.radix_routing = radix_routing
+        self._route_index: Optional[_RouteIndex] = None
+
+    @property  # type: ignore[override]
+    def routes(self) -> _RouteList:
+        return self._routes
+
+    @routes.setter
+    def routes(self, routes: List[BaseRoute]) -> None:
+        self._routes = routes if isinstance(routes, _RouteList) else _RouteList(routes)
+
+    def _get_route_index(self) -> _RouteIndex:
+        route_index = self._route_index
+        if (
+            route_index is None
+            or route_index.routes is not self.routes
+            or route_index.radix != self.radix_routing
+        ):
+            route_index = self._route_index = _RouteIndex(
+                self.routes, radix=self.radix_routing
+            )
+        elif not route_index.is_current():
+            # Routes are normally only appended, any other change rebuilds the index
+            if route_index.can_extend():
+                route_index.add_routes()
+            else:
+                route_index = self._route_index = _RouteIndex(
+                    self.routes, radix=self.radix_routing
+                )
+        return route_index
+
+    async def app(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "lifespan":
+            await super().app(scope, receive, send)
+            return
+        # The same as Starlette's Router.app(), only with the candidate routes
+        if "router" not in scope:
+            scope["router"] = self
+        route_index = self._get_route_index()
+        route_path = _get_route_path(scope)
+        partial = None
+        partial_scope: Scope = {}
+        for route in route_index.get_candidates(route_path):
+            match, child_scope = route.matches(scope)
+            if match == Match.FULL:
+                scope.update(child_scope)
+                await route.handle(scope, receive, send)
+                return
+            elif match == Match.PARTIAL and partial is None:
+                partial = route
+                partial_scope = child_scope
+        if partial is not None:
+            scope.update(partial_scope)
+            await partial.handle(scope, receive, send)
+            return
+        if scope["type"] == "http" and self.redirect_slashes and route_path != "/":
+            redirect_scope = dict(scope)
+            if route_path.endswith("/"):
+                redirect_scope["path"] = redirect_scope["path"].rstrip("/")
+            else:
+                redirect_scope["path"] = redirect_scope["path"] + "/"
+            redirect_path = _get_route_path(redirect_scope)
+            for route in route_index.get_candidates(redirect_path):
+                match, child_scope = route.matches(redirect_scope)
+                if match != Match.NONE:
+                    redirect_url = URL(scope=redirect_scope)
+                    response = RedirectResponse(url=str(redirect_url))
+                    await response(scope, receive, send)
+                    return
+        await self.default(scope, receive, send)
+
+    def compile_all(self) -> None:
+        """
+        Compile all the *path operations* in this router that were not compiled yet,
+        because they were declared with `lazy_compile`.
+        """
+        for route in self.routes:
+            if isinstance(route, APIRoute):
+                route.compile()
 
     def route(
         self,
@@ -911,6 +1639,14 @@ class APIRouter(routing.Router):
         generate_unique_id_function: Union[
             Callable[[APIRoute], str], DefaultPlaceholder
         ] = Default(generate_unique_id),
+        coalesce: Optional[RequestCoalescer] = None,
+        cache: Optional[ResponseCache] = None,
+        validate_json_bytes: Union[bool, DefaultPlaceholder] = Default(False),
+        serialize_json_bytes: Union[bool, DefaultPlaceholder] = Default(False),
+        concurrent_dependencies: Union[bool, DefaultPlaceholder] = Default(False),
+        etag: Union[bool, DefaultPlaceholder] = Default(False),
+        lazy_compile: Union[bool, DefaultPlaceholder] = Default(False),
+        source_route: Optional[APIRoute] = None,
     ) -> None:
         route_class = route_class_override or self.route_class
         responses = responses or {}
@@ -930,6 +1666,17 @@ class APIRouter(routing.Router):
         current_generate_unique_id = get_value_or_default(
             generate_unique_id_function, self.generate_unique_id_function
         )
+        current_validate_json_bytes = get_value_or_default(
+            validate_json_bytes, self.validate_json_bytes
+        )
+        current_serialize_json_bytes = get_value_or_default(
+            serialize_json_bytes, self.serialize_json_bytes
+        )
+        current_concurrent_dependencies = get_value_or_default(
+            concurrent_dependencies, self.concurrent_dependencies
+        )
+        current_etag = get_value_or_default(etag, self.etag)
+        current_lazy_compile = get_value_or_default(lazy_compile, self.lazy_compile)
         route = route_class(
             self.prefix + path,
             endpoint=endpoint,
@@ -957,6 +1704,14 @@ class APIRouter(routing.Router):
             callbacks=current_callbacks,
             openapi_extra=openapi_extra,
             generate_unique_id_function=current_generate_unique_id,
+            validate_json_bytes=current_validate_json_bytes,
+            serialize_json_bytes=current_serialize_json_bytes,
+            concurrent_dependencies=current_concurrent_dependencies,
+            etag=current_etag,
+            lazy_compile=current_lazy_compile,
+            source_route=source_route,
+            cache=cache,
+            coalesce=coalesce,
         )
         self.routes.append(route)
 
@@ -989,6 +1744,9 @@ class APIRouter(routing.Router):
         generate_unique_id_function: Callable[[APIRoute], str] = Default(
             generate_unique_id
         ),
+        coalesce: Optional[RequestCoalescer] = None,
+        etag: Union[bool, DefaultPlaceholder] = Default(False),
+        cache: Optional[ResponseCache] = None,
     ) -> Callable[[DecoratedCallable], DecoratedCallable]:
         def decorator(func: DecoratedCallable) -> DecoratedCallable:
             self.add_api_route(
@@ -1017,6 +1775,9 @@ class APIRouter(routing.Router):
                 callbacks=callbacks,
                 openapi_extra=openapi_extra,
                 generate_unique_id_function=generate_unique_id_function,
+                coalesce=coalesce,
+                etag=etag,
+                cache=cache,
             )
             return func
 
@@ -1299,6 +2060,19 @@ class APIRouter(routing.Router):
                     generate_unique_id_function,
                     self.generate_unique_id_function,
                 )
+                current_validate_json_bytes = get_value_or_default(
+                    route.validate_json_bytes, router.validate_json_bytes
+                )
+                current_serialize_json_bytes = get_value_or_default(
+                    route.serialize_json_bytes, router.serialize_json_bytes
+                )
+                current_concurrent_dependencies = get_value_or_default(
+                    route.concurrent_dependencies, router.concurrent_dependencies
+                )
+                current_etag = get_value_or_default(route.etag, router.etag)
+                current_lazy_compile = get_value_or_default(
+                    route.lazy_compile, router.lazy_compile
+                )
                 self.add_api_route(
                     prefix + route.path,
                     route.endpoint,
@@ -1328,6 +2102,14 @@ class APIRouter(routing.Router):
                     callbacks=current_callbacks,
                     openapi_extra=route.openapi_extra,
                     generate_unique_id_function=current_generate_unique_id,
+                    validate_json_bytes=current_validate_json_bytes,
+                    serialize_json_bytes=current_serialize_json_bytes,
+                    concurrent_dependencies=current_concurrent_dependencies,
+                    etag=current_etag,
+                    lazy_compile=current_lazy_compile,
+                    source_route=route,
+                    cache=route.cache,
+                    coalesce=route.coalesce,
                 )
             elif isinstance(route, routing.Route):
                 methods = list(route.methods or [])
@@ -1694,6 +2476,45 @@ class APIRouter(routing.Router):
                 """
             ),
         ] = Default(generate_unique_id),
+        coalesce: Annotated[
+            Optional[RequestCoalescer],
+            Doc(
+                """
+                A `RequestCoalescer` to handle only once the concurrent `GET` and `HEAD`
+                requests to this *path operation* that are the same. The others wait for
+                the response of the first one and get a copy of it.
+                """
+            ),
+        ] = None,
+        etag: Annotated[
+            Union[bool, DefaultPlaceholder],
+            Doc(
+                """
+                Add a strong `ETag` header to the `200` responses of this path operation
+                to `GET` and `HEAD` requests, and reply with an empty `304 Not Modified`
+                when the request's `If-None-Match` header matches it.
+
+                The `ETag` is a hash of the rendered body. If the path operation
+                function already sets an `ETag` header in the `Response` parameter, for
+                example with a version of the data it returns, that value is used
+                instead, and the response is not serialized at all when it matches.
+                """
+            ),
+        ] = Default(False),
+        cache: Annotated[
+            Optional[ResponseCache],
+            Doc(
+                """
+                A `ResponseCache` to cache the responses of this *path operation*, it
+                can only be used with `GET` and `HEAD` *path operations*.
+
+                A cached response is returned without parsing the request, solving the
+                dependencies, or calling the *path operation function*, so any request
+                header the response depends on, like `Authorization`, has to be declared
+                in its `vary`.
+                """
+            ),
+        ] = None,
     ) -> Callable[[DecoratedCallable], DecoratedCallable]:
         """
         Add a *path operation* using an HTTP GET operation.
@@ -1738,6 +2559,9 @@ class APIRouter(routing.Router):
             callbacks=callbacks,
             openapi_extra=openapi_extra,
             generate_unique_id_function=generate_unique_id_function,
+            coalesce=coalesce,
+            etag=etag,
+            cache=cache,
         )
 
     def put(
@@ -2071,6 +2895,45 @@ class APIRouter(routing.Router):
                 """
             ),
         ] = Default(generate_unique_id),
+        coalesce: Annotated[
+            Optional[RequestCoalescer],
+            Doc(
+                """
+                A `RequestCoalescer` to handle only once the concurrent `GET` and `HEAD`
+                requests to this *path operation* that are the same. The others wait for
+                the response of the first one and get a copy of it.
+                """
+            ),
+        ] = None,
+        etag: Annotated[
+            Union[bool, DefaultPlaceholder],
+            Doc(
+                """
+                Add a strong `ETag` header to the `200` responses of this path operation
+                to `GET` and `HEAD` requests, and reply with an empty `304 Not Modified`
+                when the request's `If-None-Match` header matches it.
+
+                The `ETag` is a hash of the rendered body. If the path operation
+                function already sets an `ETag` header in the `Response` parameter, for
+                example with a version of the data it returns, that value is used
+                instead, and the response is not serialized at all when it matches.
+                """
+            ),
+        ] = Default(False),
+        cache: Annotated[
+            Optional[ResponseCache],
+            Doc(
+                """
+                A `ResponseCache` to cache the responses of this *path operation*, it
+                can only be used with `GET` and `HEAD` *path operations*.
+
+                A cached response is returned without parsing the request, solving the
+                dependencies, or calling the *path operation function*, so any request
+                header the response depends on, like `Authorization`, has to be declared
+                in its `vary`.
+                """
+            ),
+        ] = None,
     ) -> Callable[[DecoratedCallable], DecoratedCallable]:
         """
         Add a *path operation* using an HTTP PUT operation.
@@ -2120,6 +2983,9 @@ class APIRouter(routing.Router):
             callbacks=callbacks,
             openapi_extra=openapi_extra,
             generate_unique_id_function=generate_unique_id_function,
+            coalesce=coalesce,
+            etag=etag,
+            cache=cache,
         )
 
     def post(
@@ -2453,6 +3319,45 @@ class APIRouter(routing.Router):
                 """
             ),
         ] = Default(generate_unique_id),
+        coalesce: Annotated[
+            Optional[RequestCoalescer],
+            Doc(
+                """
+                A `RequestCoalescer` to handle only once the concurrent `GET` and `HEAD`
+                requests to this *path operation* that are the same. The others wait for
+                the response of the first one and get a copy of it.
+                """
+            ),
+        ] = None,
+        etag: Annotated[
+            Union[bool, DefaultPlaceholder],
+            Doc(
+                """
+                Add a strong `ETag` header to the `200` responses of this path operation
+                to `GET` and `HEAD` requests, and reply with an empty `304 Not Modified`
+                when the request's `If-None-Match` header matches it.
+
+                The `ETag` is a hash of the rendered body. If the path operation
+                function already sets an `ETag` header in the `Response` parameter, for
+                example with a version of the data it returns, that value is used
+                instead, and the response is not serialized at all when it matches.
+                """
+            ),
+        ] = Default(False),
+        cache: Annotated[
+            Optional[ResponseCache],
+            Doc(
+                """
+                A `ResponseCache` to cache the responses of this *path operation*, it
+                can only be used with `GET` and `HEAD` *path operations*.
+
+                A cached response is returned without parsing the request, solving the
+                dependencies, or calling the *path operation function*, so any request
+                header the response depends on, like `Authorization`, has to be declared
+                in its `vary`.
+                """
+            ),
+        ] = None,
     ) -> Callable[[DecoratedCallable], DecoratedCallable]:
         """
         Add a *path operation* using an HTTP POST operation.
@@ -2502,6 +3407,9 @@ class APIRouter(routing.Router):
             callbacks=callbacks,
             openapi_extra=openapi_extra,
             generate_unique_id_function=generate_unique_id_function,
+            coalesce=coalesce,
+            etag=etag,
+            cache=cache,
         )
 
     def delete(
@@ -2835,6 +3743,45 @@ class APIRouter(routing.Router):
                 """
             ),
         ] = Default(generate_unique_id),
+        coalesce: Annotated[
+            Optional[RequestCoalescer],
+            Doc(
+                """
+                A `RequestCoalescer` to handle only once the concurrent `GET` and `HEAD`
+                requests to this *path operation* that are the same. The others wait for
+                the response of the first one and get a copy of it.
+                """
+            ),
+        ] = None,
+        etag: Annotated[
+            Union[bool, DefaultPlaceholder],
+            Doc(
+                """
+                Add a strong `ETag` header to the `200` responses of this path operation
+                to `GET` and `HEAD` requests, and reply with an empty `304 Not Modified`
+                when the request's `If-None-Match` header matches it.
+
+                The `ETag` is a hash of the rendered body. If the path operation
+                function already sets an `ETag` header in the `Response` parameter, for
+                example with a version of the data it returns, that value is used
+                instead, and the response is not serialized at all when it matches.
+                """
+            ),
+        ] = Default(False),
+        cache: Annotated[
+            Optional[ResponseCache],
+            Doc(
+                """
+                A `ResponseCache` to cache the responses of this *path operation*, it
+                can only be used with `GET` and `HEAD` *path operations*.
+
+                A cached response is returned without parsing the request, solving the
+                dependencies, or calling the *path operation function*, so any request
+                header the response depends on, like `Authorization`, has to be declared
+                in its `vary`.
+                """
+            ),
+        ] = None,
     ) -> Callable[[DecoratedCallable], DecoratedCallable]:
         """
         Add a *path operation* using an HTTP DELETE operation.
@@ -2879,6 +3826,9 @@ class APIRouter(routing.Router):
             callbacks=callbacks,
             openapi_extra=openapi_extra,
             generate_unique_id_function=generate_unique_id_function,
+            coalesce=coalesce,
+            etag=etag,
+            cache=cache,
         )
 
     def options(
@@ -3212,6 +4162,45 @@ class APIRouter(routing.Router):
                 """
             ),
         ] = Default(generate_unique_id),
+        coalesce: Annotated[
+            Optional[RequestCoalescer],
+            Doc(
+                """
+                A `RequestCoalescer` to handle only once the concurrent `GET` and `HEAD`
+                requests to this *path operation* that are the same. The others wait for
+                the response of the first one and get a copy of it.
+                """
+            ),
+        ] = None,
+        etag: Annotated[
+            Union[bool, DefaultPlaceholder],
+            Doc(
+                """
+                Add a strong `ETag` header to the `200` responses of this path operation
+                to `GET` and `HEAD` requests, and reply with an empty `304 Not Modified`
+                when the request's `If-None-Match` header matches it.
+
+                The `ETag` is a hash of the rendered body. If the path operation
+                function already sets an `ETag` header in the `Response` parameter, for
+                example with a version of the data it returns, that value is used
+                instead, and the response is not serialized at all when it matches.
+                """
+            ),
+        ] = Default(False),
+        cache: Annotated[
+            Optional[ResponseCache],
+            Doc(
+                """
+                A `ResponseCache` to cache the responses of this *path operation*, it
+                can only be used with `GET` and `HEAD` *path operations*.
+
+                A cached response is returned without parsing the request, solving the
+                dependencies, or calling the *path operation function*, so any request
+                header the response depends on, like `Authorization`, has to be declared
+                in its `vary`.
+                """
+            ),
+        ] = None,
     ) -> Callable[[DecoratedCallable], DecoratedCallable]:
         """
         Add a *path operation* using an HTTP OPTIONS operation.
@@ -3256,6 +4245,9 @@ class APIRouter(routing.Router):
             callbacks=callbacks,
             openapi_extra=openapi_extra,
             generate_unique_id_function=generate_unique_id_function,
+            coalesce=coalesce,
+            etag=etag,
+            cache=cache,
         )
 
     def head(
@@ -3589,6 +4581,45 @@ class APIRouter(routing.Router):
                 """
             ),
         ] = Default(generate_unique_id),
+        coalesce: Annotated[
+            Optional[RequestCoalescer],
+            Doc(
+                """
+                A `RequestCoalescer` to handle only once the concurrent `GET` and `HEAD`
+                requests to this *path operation* that are the same. The others wait for
+                the response of the first one and get a copy of it.
+                """
+            ),
+        ] = None,
+        etag: Annotated[
+            Union[bool, DefaultPlaceholder],
+            Doc(
+                """
+                Add a strong `ETag` header to the `200` responses of this path operation
+                to `GET` and `HEAD` requests, and reply with an empty `304 Not Modified`
+                when the request's `If-None-Match` header matches it.
+
+                The `ETag` is a hash of the rendered body. If the path operation
+                function already sets an `ETag` header in the `Response` parameter, for
+                example with a version of the data it returns, that value is used
+                instead, and the response is not serialized at all when it matches.
+                """
+            ),
+        ] = Default(False),
+        cache: Annotated[
+            Optional[ResponseCache],
+            Doc(
+                """
+                A `ResponseCache` to cache the responses of this *path operation*, it
+                can only be used with `GET` and `HEAD` *path operations*.
+
+                A cached response is returned without parsing the request, solving the
+                dependencies, or calling the *path operation function*, so any request
+                header the response depends on, like `Authorization`, has to be declared
+                in its `vary`.
+                """
+            ),
+        ] = None,
     ) -> Callable[[DecoratedCallable], DecoratedCallable]:
         """
         Add a *path operation* using an HTTP HEAD operation.
@@ -3638,6 +4669,9 @@ class APIRouter(routing.Router):
             callbacks=callbacks,
             openapi_extra=openapi_extra,
             generate_unique_id_function=generate_unique_id_function,
+            coalesce=coalesce,
+            etag=etag,
+            cache=cache,
         )
 
     def patch(
@@ -3971,6 +5005,45 @@ class APIRouter(routing.Router):
                 """
             ),
         ] = Default(generate_unique_id),
+        coalesce: Annotated[
+            Optional[RequestCoalescer],
+            Doc(
+                """
+                A `RequestCoalescer` to handle only once the concurrent `GET` and `HEAD`
+                requests to this *path operation* that are the same. The others wait for
+                the response of the first one and get a copy of it.
+                """
+            ),
+        ] = None,
+        etag: Annotated[
+            Union[bool, DefaultPlaceholder],
+            Doc(
+                """
+                Add a strong `ETag` header to the `200` responses of this path operation
+                to `GET` and `HEAD` requests, and reply with an empty `304 Not Modified`
+                when the request's `If-None-Match` header matches it.
+
+                The `ETag` is a hash of the rendered body. If the path operation
+                function already sets an `ETag` header in the `Response` parameter, for
+                example with a version of the data it returns, that value is used
+                instead, and the response is not serialized at all when it matches.
+                """
+            ),
+        ] = Default(False),
+        cache: Annotated[
+            Optional[ResponseCache],
+            Doc(
+                """
+                A `ResponseCache` to cache the responses of this *path operation*, it
+                can only be used with `GET` and `HEAD` *path operations*.
+
+                A cached response is returned without parsing the request, solving the
+                dependencies, or calling the *path operation function*, so any request
+                header the response depends on, like `Authorization`, has to be declared
+                in its `vary`.
+                """
+            ),
+        ] = None,
     ) -> Callable[[DecoratedCallable], DecoratedCallable]:
         """
         Add a *path operation* using an HTTP PATCH operation.
@@ -4020,6 +5093,9 @@ class APIRouter(routing.Router):
             callbacks=callbacks,
             openapi_extra=openapi_extra,
             generate_unique_id_function=generate_unique_id_function,
+            coalesce=coalesce,
+            etag=etag,
+            cache=cache,
         )
 
     def trace(
@@ -4353,6 +5429,45 @@ class APIRouter(routing.Router):
                 """
             ),
         ] = Default(generate_unique_id),
+        coalesce: Annotated[
+            Optional[RequestCoalescer],
+            Doc(
+                """
+                A `RequestCoalescer` to handle only once the concurrent `GET` and `HEAD`
+                requests to this *path operation* that are the same. The others wait for
+                the response of the first one and get a copy of it.
+                """
+            ),
+        ] = None,
+        etag: Annotated[
+            Union[bool, DefaultPlaceholder],
+            Doc(
+                """
+                Add a strong `ETag` header to the `200` responses of this path operation
+                to `GET` and `HEAD` requests, and reply with an empty `304 Not Modified`
+                when the request's `If-None-Match` header matches it.
+
+                The `ETag` is a hash of the rendered body. If the path operation
+                function already sets an `ETag` header in the `Response` parameter, for
+                example with a version of the data it returns, that value is used
+                instead, and the response is not serialized at all when it matches.
+                """
+            ),
+        ] = Default(False),
+        cache: Annotated[
+            Optional[ResponseCache],
+            Doc(
+                """
+                A `ResponseCache` to cache the responses of this *path operation*, it
+                can only be used with `GET` and `HEAD` *path operations*.
+
+                A cached response is returned without parsing the request, solving the
+                dependencies, or calling the *path operation function*, so any request
+                header the response depends on, like `Authorization`, has to be declared
+                in its `vary`.
+                """
+            ),
+        ] = None,
     ) -> Callable[[DecoratedCallable], DecoratedCallable]:
         """
         Add a *path operation* using an HTTP TRACE operation.
@@ -4402,6 +5517,9 @@ class APIRouter(routing.Router):
             callbacks=callbacks,
             openapi_extra=openapi_extra,
             generate_unique_id_function=generate_unique_id_function,
+            coalesce=coalesce,
+            etag=etag,
+            cache=cache,
         )
 
     @deprecated(
@@ -0,0 +1,123 @@
+import gc
+import weakref
+from collections import defaultdict
+from dataclasses import dataclass, make_dataclass
+from typing import Any, DefaultDict, Dict, List, NamedTuple
+
+from fastapi import FastAPI, encoders
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+
+class Note(str):
+    def __deepcopy__(self, memo: Dict[int, Any]) -> Any:
+        raise AssertionError("The value was copied")  # pragma: nocover
+
+
+@dataclass
+class Item:
+    __slots__ = ("name", "note")
+    name: str
+    note: Note
+
+
+class Point(NamedTuple):
+    x: int
+    y: int
+
+
+@dataclass
+class Order:
+    items: List[Item]
+    location: Point
+    counts: DefaultDict[str, int]
+
+
+class ItemOut(BaseModel):
+    name: str
+    note: str
+
+
+class OrderOut(BaseModel):
+    items: List[ItemOut]
+    location: Point
+    counts: Dict[str, int]
+
+
+def get_order() -> Order:
+    return Order(
+        items=[Item(name="foo", note=Note("Fragile"))],
+        location=Point(1, 2),
+        counts=defaultdict(int, {"foo": 1}),
+    )
+
+
+app = FastAPI()
+
+
+@app.get("/items/")
+def read_items():
+    return [Item(name="foo", note=Note("Fragile")), Item(name="bar", note=Note(""))]
+
+
+@app.get("/orders/no-response-model")
+def read_order_no_response_model():
+    return get_order()
+
+
+@app.get("/orders/", response_model=OrderOut)
+def read_order():
+    return get_order()
+
+
+@app.get("/orders/list", response_model=List[OrderOut])
+def read_orders():
+    return [get_order()]
+
+
+client = TestClient(app)
+
+expected_order = {
+    "items": [{"name": "foo", "note": "Fragile"}],
+    "location": [1, 2],
+    "counts": {"foo": 1},
+}
+
+
+def test_slotted_dataclasses():
+    response = client.get("/items/")
+    assert response.status_code == 200, response.text
+    assert response.json() == [
+        {"name": "foo", "note": "Fragile"},
+        {"name": "bar", "note": ""},
+    ]
+
+
+def test_no_response_model():
+    response = client.get("/orders/no-response-model")
+    assert response.status_code == 200, response.text
+    assert response.json() == expected_order
+
+
+def test_response_model():
+    response = client.get("/orders/")
+    assert response.status_code == 200, response.text
+    assert response.json() == expected_order
+
+
+def test_response_model_list():
+    response = client.get("/orders/list")
+    assert response.status_code == 200, response.text
+    assert response.json() == [expected_order]
+
+
+def test_dataclass_field_names_bounded():
+    Dynamic = make_dataclass("Dynamic", ["name"])
+    dynamic_ref = weakref.ref(Dynamic)
+    assert encoders.jsonable_encoder(Dynamic(name="foo")) == {"name": "foo"}
+    for index in range(encoders._MAX_CACHED_TYPES):
+        encoders.jsonable_encoder(make_dataclass(f"Dynamic{index}", ["name"])("foo"))
+    assert len(encoders._dataclass_field_names) <= encoders._MAX_CACHED_TYPES
+    del Dynamic
+    gc.collect()
+    assert dynamic_ref() is None
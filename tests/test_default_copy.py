@@ -0,0 +1,107 @@
+from copy import copy, deepcopy
+from enum import Enum
+from typing import Any, Dict, List, Optional, Tuple
+
+import pytest
+from fastapi import Body, FastAPI, Query
+from fastapi._compat import _get_default_copier, _return_value
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+from .utils import needs_pydanticv2
+
+
+class Color(Enum):
+    red = "red"
+
+
+class Frozen(BaseModel):
+    name: str = "foo"
+    tags: Tuple[str, ...] = ()
+
+    if hasattr(BaseModel, "model_config"):
+        model_config = {"frozen": True}
+    else:
+
+        class Config:
+            frozen = True
+
+
+class FrozenWithList(Frozen):
+    items: List[str] = []
+
+
+class Item(BaseModel):
+    name: str = "foo"
+
+
+app = FastAPI()
+
+
+@app.get("/items/")
+def read_items(tags: List[str] = Query(["a"]), q: Optional[str] = None):
+    tags.append("mutated")
+    return {"tags": tags, "q": q}
+
+
+@app.post("/items/")
+def create_item(extra: Dict[str, str] = Body({"a": "b"}, embed=True)):
+    extra["mutated"] = "yes"
+    return extra
+
+
+client = TestClient(app)
+
+
+def test_mutable_query_default_copied():
+    for _ in range(2):
+        response = client.get("/items/")
+        assert response.status_code == 200, response.text
+        assert response.json() == {"tags": ["a", "mutated"], "q": None}
+
+
+def test_mutable_body_default_copied():
+    for _ in range(2):
+        response = client.post("/items/")
+        assert response.status_code == 200, response.text
+        assert response.json() == {"a": "b", "mutated": "yes"}
+
+
+@pytest.mark.parametrize(
+    "default,copier",
+    [
+        (None, _return_value),
+        (1, _return_value),
+        (1.5, _return_value),
+        ("foo", _return_value),
+        (b"foo", _return_value),
+        (Color.red, _return_value),
+        ((1, ("a", None)), _return_value),
+        (frozenset({1}), _return_value),
+        (Frozen(), _return_value),
+        (["a"], copy),
+        ({"a"}, copy),
+        ({"a": 1}, copy),
+        ((1, []), deepcopy),
+        ([["a"]], deepcopy),
+        ({"a": []}, deepcopy),
+        (Item(), deepcopy),
+        (FrozenWithList(), deepcopy),
+    ],
+)
+def test_default_copier(default: Any, copier: Any):
+    assert _get_default_copier(default) is copier
+
+
+@needs_pydanticv2
+def test_copier_decided_once():
+    from fastapi._compat import ModelField
+
+    field = ModelField(
+        field_info=Query(annotation=Optional[str], default=None), name="q"
+    )
+    assert field._default_copier is _return_value
+    field = ModelField(
+        field_info=Query(annotation=List[str], default_factory=list), name="q"
+    )
+    assert field._default_copier is deepcopy
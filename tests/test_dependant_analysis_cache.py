@@ -0,0 +1,200 @@
+import gc
+import weakref
+from typing import Any, Callable, Dict, List
+
+import pytest
+from fastapi import Depends, FastAPI, Security
+from fastapi.dependencies import utils
+from fastapi.dependencies.models import Dependant
+from fastapi.dependencies.utils import get_dependant
+from fastapi.routing import APIRoute
+from fastapi.security import OAuth2PasswordBearer, SecurityScopes
+from fastapi.testclient import TestClient
+
+oauth2_scheme = OAuth2PasswordBearer(
+    tokenUrl="token", scopes={"me": "", "items": "", "admin": ""}
+)
+
+
+def get_token(security_scopes: SecurityScopes, token: str = Depends(oauth2_scheme)):
+    return {"token": token, "scopes": security_scopes.scopes}
+
+
+def get_current_user(
+    token: Dict[str, Any] = Security(get_token, scopes=["me"]), tenant: str = "main"
+):
+    return {"token": token, "tenant": tenant}
+
+
+def create_app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/users/me")
+    def read_me(user=Depends(get_current_user)):
+        return user
+
+    @app.get("/items/")
+    def read_items(user=Security(get_current_user, scopes=["items"])):
+        return user
+
+    @app.get("/tenants/{tenant}")
+    def read_tenant(user=Depends(get_current_user)):
+        return user
+
+    return app
+
+
+def get_routes(app: FastAPI) -> Dict[str, APIRoute]:
+    return {route.name: route for route in app.routes if isinstance(route, APIRoute)}
+
+
+@pytest.fixture
+def analyzed_calls(monkeypatch: pytest.MonkeyPatch) -> List[Callable[..., Any]]:
+    calls: List[Callable[..., Any]] = []
+    get_typed_signature = utils.get_typed_signature
+
+    def get_counted_signature(call: Callable[..., Any]):
+        calls.append(call)
+        return get_typed_signature(call)
+
+    monkeypatch.setattr(utils, "get_typed_signature", get_counted_signature)
+    return calls
+
+
+def test_analyzed_once(analyzed_calls: List[Callable[..., Any]]):
+    def get_user(token: str):
+        pass  # pragma: nocover
+
+    for _ in range(3):
+        dependant = get_dependant(path="/users/", call=get_user)
+        assert [param.name for param in dependant.query_params] == ["token"]
+    assert analyzed_calls == [get_user]
+
+
+def test_copies_are_isolated():
+    routes = get_routes(create_app())
+    me_user = routes["read_me"].dependant.dependencies[0]
+    tenant_user = routes["read_tenant"].dependant.dependencies[0]
+    other_me_user = get_routes(create_app())["read_me"].dependant.dependencies[0]
+    assert me_user is not other_me_user
+    assert me_user.query_params == other_me_user.query_params
+    assert me_user.query_params[0] is other_me_user.query_params[0]
+    me_user.query_params.clear()
+    me_user.dependencies.clear()
+    assert [param.name for param in other_me_user.query_params] == ["tenant"]
+    assert other_me_user.dependencies[0].call is get_token
+    # The path params of the route are different, so it's analyzed on its own
+    assert [param.name for param in tenant_user.path_params] == ["tenant"]
+    assert tenant_user.query_params == []
+
+
+def test_same_as_uncached(monkeypatch: pytest.MonkeyPatch):
+    def get_tree(dependant: Dependant) -> Any:
+        return (
+            getattr(dependant.call, "__name__", dependant.call),
+            dependant.name,
+            dependant.path,
+            dependant.security_scopes,
+            dependant.cache_key[1],
+            [param.name for param in dependant.query_params],
+            [
+                (requirement.security_scheme, requirement.scopes)
+                for requirement in dependant.security_requirements
+            ],
+            [get_tree(sub_dependant) for sub_dependant in dependant.dependencies],
+        )
+
+    cached = [get_tree(route.dependant) for route in get_routes(create_app()).values()]
+    cached_again = [
+        get_tree(route.dependant) for route in get_routes(create_app()).values()
+    ]
+
+    class NoAnalyses:
+        def setdefault(self, call: Callable[..., Any], default: Any) -> Any:
+            return default
+
+    monkeypatch.setattr(utils, "_dependant_analyses", NoAnalyses())
+    uncached = [
+        get_tree(route.dependant) for route in get_routes(create_app()).values()
+    ]
+    assert cached == uncached
+    assert cached_again == uncached
+
+
+def test_security_scopes():
+    client = TestClient(create_app())
+    headers = {"Authorization": "Bearer abc"}
+    response = client.get("/users/me", headers=headers)
+    assert response.json() == {
+        "token": {"token": "abc", "scopes": ["me"]},
+        "tenant": "main",
+    }
+    response = client.get("/items/", headers=headers)
+    assert response.json() == {
+        "token": {"token": "abc", "scopes": ["items", "me"]},
+        "tenant": "main",
+    }
+    response = client.get("/tenants/acme", headers=headers)
+    assert response.json() == {
+        "token": {"token": "abc", "scopes": ["me"]},
+        "tenant": "acme",
+    }
+
+
+def test_sibling_security_scopes_in_openapi():
+    def get_items_scope():
+        return "items"
+
+    def get_admin_user(
+        token: Dict[str, Any] = Security(get_token, scopes=["me"]),
+        scope: str = Security(get_items_scope, scopes=["items"]),
+    ):
+        return token  # pragma: nocover
+
+    app = FastAPI()
+
+    @app.get("/admin/")
+    def read_admin(user=Security(get_admin_user, scopes=["admin"])):
+        return user  # pragma: nocover
+
+    schema = app.openapi()
+    assert schema["paths"]["/admin/"]["get"]["security"] == [
+        {"OAuth2PasswordBearer": ["admin", "me", "items"]}
+    ]
+
+
+def test_caller_scopes_extended():
+    scopes = ["items"]
+    get_dependant(path="/", call=get_current_user, security_scopes=scopes)
+    assert scopes == ["items", "me"]
+    scopes = ["items"]
+    dependant = get_dependant(path="/", call=get_current_user, security_scopes=scopes)
+    assert scopes == ["items", "me"]
+    assert dependant.security_scopes is scopes
+
+
+def test_unhashable_call(analyzed_calls: List[Callable[..., Any]]):
+    class GetUser:
+        __hash__ = None  # type: ignore[assignment]
+
+        def __call__(self, token: str):
+            pass  # pragma: nocover
+
+    get_user = GetUser()
+    for _ in range(2):
+        dependant = get_dependant(path="/", call=get_user)
+        assert dependant.call is get_user
+        assert [param.name for param in dependant.query_params] == ["token"]
+    assert analyzed_calls == [get_user, get_user]
+
+
+def test_removed_when_unused():
+    def get_user(token: str):
+        pass  # pragma: nocover
+
+    get_dependant(path="/", call=get_user)
+    assert get_user in utils._dependant_analyses
+    get_user_ref = weakref.ref(get_user)
+    del get_user
+    gc.collect()
+    assert get_user_ref() is None
@@ -0,0 +1,174 @@
+from contextlib import asynccontextmanager
+from typing import Any, Dict, List
+
+import pytest
+from fastapi import APIRouter, Depends, FastAPI, Request, WebSocket
+from fastapi.testclient import TestClient
+
+state: Dict[str, Any] = {}
+events: List[str] = []
+
+
+def get_settings():
+    events.append("settings")
+    return {"url": "sqlite://"}
+
+
+async def get_pool(settings: dict = Depends(get_settings)):
+    events.append("pool startup")
+    state["pools"] = state.get("pools", 0) + 1
+    yield f"pool {state['pools']} for {settings['url']}"
+    events.append("pool shutdown")
+
+
+async def get_connection(pool: str = Depends(get_pool, scope="app")):
+    return f"connection from {pool}"
+
+
+def create_app() -> FastAPI:
+    app = FastAPI()
+    router = APIRouter()
+
+    @router.get("/pool")
+    def read_pool(pool: str = Depends(get_pool, scope="app")):
+        return {"pool": pool}
+
+    @router.get("/connection")
+    def read_connection(connection: str = Depends(get_connection)):
+        return {"connection": connection}
+
+    @router.websocket("/ws")
+    async def websocket_pool(
+        websocket: WebSocket, pool: str = Depends(get_pool, scope="app")
+    ):
+        await websocket.accept()
+        await websocket.send_text(pool)
+        await websocket.close()
+
+    app.include_router(router)
+    return app
+
+
+@pytest.fixture(autouse=True)
+def reset_state():
+    state.clear()
+    events.clear()
+
+
+def test_solved_on_startup_and_exited_on_shutdown():
+    app = create_app()
+    with TestClient(app) as client:
+        assert events == ["settings", "pool startup"]
+        response = client.get("/pool")
+        assert response.status_code == 200, response.text
+        assert response.json() == {"pool": "pool 1 for sqlite://"}
+        response = client.get("/connection")
+        assert response.status_code == 200, response.text
+        assert response.json() == {"connection": "connection from pool 1 for sqlite://"}
+        with client.websocket_connect("/ws") as websocket:
+            assert websocket.receive_text() == "pool 1 for sqlite://"
+        assert events == ["settings", "pool startup"]
+    assert events == ["settings", "pool startup", "pool shutdown"]
+    assert app.app_dependency_store.values == {}
+
+
+def test_solved_on_first_use_without_lifespan():
+    app = create_app()
+    client = TestClient(app)
+    assert events == []
+    for _ in range(2):
+        response = client.get("/connection")
+        assert response.status_code == 200, response.text
+        assert response.json() == {"connection": "connection from pool 1 for sqlite://"}
+    assert events == ["settings", "pool startup"]
+
+
+def test_merged_with_app_lifespan():
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        events.append("app startup")
+        yield {"started": True}
+        events.append("app shutdown")
+
+    app = FastAPI(lifespan=lifespan)
+
+    @app.get("/")
+    def read_root(request: Request, pool: str = Depends(get_pool, scope="app")):
+        return {"pool": pool, "started": request.state.started}
+
+    with TestClient(app) as client:
+        response = client.get("/")
+        assert response.json() == {"pool": "pool 1 for sqlite://", "started": True}
+    assert events == [
+        "app startup",
+        "settings",
+        "pool startup",
+        "pool shutdown",
+        "app shutdown",
+    ]
+
+
+def test_router_without_app(monkeypatch: pytest.MonkeyPatch):
+    router = APIRouter()
+
+    @router.get("/pool")
+    def read_pool(pool: str = Depends(get_pool, scope="app")):
+        return {"pool": pool}
+
+    @router.get("/settings")
+    def read_settings(settings: dict = Depends(get_settings)):
+        return settings
+
+    client = TestClient(router)
+    response = client.get("/pool")
+    assert response.json() == {"pool": "pool 1 for sqlite://"}
+    assert events == ["settings", "pool startup", "pool shutdown"]
+    monkeypatch.setattr(
+        "fastapi.dependencies.utils.AppDependencyStore",
+        lambda: pytest.fail("A store was created"),  # pragma: nocover
+    )
+    response = client.get("/settings")
+    assert response.json() == {"url": "sqlite://"}
+
+
+def test_overrides():
+    app = create_app()
+
+    async def override_pool():
+        yield "override pool"
+
+    app.dependency_overrides[get_pool] = override_pool
+    with TestClient(app) as client:
+        response = client.get("/connection")
+        assert response.json() == {"connection": "connection from override pool"}
+    assert events == []
+
+
+def test_request_parameters_not_allowed():
+    app = FastAPI()
+
+    def get_user(token: str):
+        return token  # pragma: nocover
+
+    with pytest.raises(AssertionError, match='scope="app"'):
+
+        @app.get("/")
+        def read_root(user: str = Depends(get_user, scope="app")):
+            pass  # pragma: nocover
+
+
+def test_request_not_allowed():
+    app = FastAPI()
+
+    def get_client(request: Request):
+        return request  # pragma: nocover
+
+    with pytest.raises(AssertionError, match='scope="app"'):
+
+        @app.get("/")
+        def read_root(client: str = Depends(get_client, scope="app")):
+            pass  # pragma: nocover
+
+
+def test_repr():
+    assert repr(Depends(get_pool, scope="app")) == "Depends(get_pool, scope='app')"
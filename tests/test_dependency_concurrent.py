@@ -0,0 +1,181 @@
+from typing import List
+
+import anyio
+import pytest
+from fastapi import APIRouter, Depends, FastAPI, HTTPException
+from fastapi.dependencies.utils import (
+    ConcurrentDependencies,
+    get_dependant,
+    get_dependency_plan,
+)
+from fastapi.testclient import TestClient
+
+from .utils import needs_pydanticv2
+
+events: List[str] = []
+
+
+async def get_first():
+    # Waits for get_second, only works when both are solved at the same time
+    with anyio.fail_after(1):
+        while "second" not in events:
+            await anyio.sleep(0)
+    events.append("first")
+    return "first"
+
+
+async def get_second():
+    events.append("second")
+    return "second"
+
+
+async def get_shared():
+    return "shared"
+
+
+async def get_with_shared(shared: str = Depends(get_shared)):
+    return f"with {shared}"
+
+
+async def get_also_with_shared(shared: str = Depends(get_shared)):
+    return f"also with {shared}"
+
+
+async def get_yield():
+    yield "yield"
+
+
+def get_sync():
+    return "sync"
+
+
+async def get_first_error():
+    await anyio.sleep(0.05)
+    raise HTTPException(status_code=400, detail="first")
+
+
+async def get_second_error():
+    raise HTTPException(status_code=418, detail="second")
+
+
+async def get_q(q: int):
+    return q
+
+
+async def get_p(p: int):
+    return p
+
+
+app = FastAPI()
+
+
+@app.get("/concurrent")
+def concurrent(
+    first: str = Depends(get_first, concurrent=True),
+    second: str = Depends(get_second, concurrent=True),
+):
+    return {"first": first, "second": second}
+
+
+@app.get("/errors")
+def errors(
+    first: str = Depends(get_first_error, concurrent=True),
+    second: str = Depends(get_second_error, concurrent=True),
+):
+    return {}  # pragma: nocover
+
+
+router = APIRouter(concurrent_dependencies=True)
+
+
+@router.get("/router")
+def router_concurrent(first: str = Depends(get_first), second=Depends(get_second)):
+    return {"first": first, "second": second}
+
+
+@router.get("/validation")
+def validation(q: int = Depends(get_q), p: int = Depends(get_p)):
+    return {}  # pragma: nocover
+
+
+app.include_router(router)
+
+
+client = TestClient(app)
+
+
+@pytest.mark.parametrize("path", ["/concurrent", "/router"])
+def test_concurrent(path: str):
+    events.clear()
+    response = client.get(path)
+    assert response.status_code == 200, response.text
+    assert response.json() == {"first": "first", "second": "second"}
+    assert events == ["second", "first"]
+
+
+def test_exceptions_raised_in_declaration_order():
+    response = client.get("/errors")
+    assert response.status_code == 400, response.text
+    assert response.json() == {"detail": "first"}
+
+
+@needs_pydanticv2
+def test_errors_in_declaration_order():
+    response = client.get("/validation")
+    assert response.status_code == 422, response.text
+    assert [error["loc"] for error in response.json()["detail"]] == [
+        ["query", "q"],
+        ["query", "p"],
+    ]
+
+
+def test_plan_not_concurrent_by_default():
+    def endpoint(first=Depends(get_first), second=Depends(get_second)):
+        pass  # pragma: nocover
+
+    plan = get_dependency_plan(get_dependant(path="/", call=endpoint))
+    assert plan.units == [0, 1, 2]
+
+
+def test_plan_skips_dependencies_that_cannot_run_concurrently():
+    def endpoint(
+        with_shared=Depends(get_with_shared),
+        also_with_shared=Depends(get_also_with_shared),
+        first=Depends(get_first),
+        yield_value=Depends(get_yield),
+        second=Depends(get_second),
+        sync=Depends(get_sync),
+        q=Depends(get_q),
+    ):
+        pass  # pragma: nocover
+
+    plan = get_dependency_plan(get_dependant(path="/", call=endpoint), concurrent=True)
+    assert [step.call for step in plan.steps] == [
+        get_shared,
+        get_with_shared,
+        get_also_with_shared,
+        get_first,
+        get_yield,
+        get_second,
+        get_sync,
+        get_q,
+        None,
+    ]
+    assert plan.units == [
+        0,
+        1,
+        ConcurrentDependencies(branches=[[2], [3]]),
+        4,
+        5,
+        6,
+        7,
+        8,
+    ]
+
+
+def test_plan_groups_branches_with_their_sub_dependencies():
+    def endpoint(with_shared=Depends(get_with_shared), q=Depends(get_q)):
+        pass  # pragma: nocover
+
+    plan = get_dependency_plan(get_dependant(path="/", call=endpoint), concurrent=True)
+    assert plan.units == [ConcurrentDependencies(branches=[[0, 1], [2]]), 3]
@@ -0,0 +1,109 @@
+from typing import List
+
+from fastapi import Depends, FastAPI
+from fastapi.dependencies.utils import get_dependant, get_dependency_plan
+from fastapi.testclient import TestClient
+
+from .utils import needs_pydanticv2
+
+calls: List[str] = []
+
+
+def get_q(q: int):
+    calls.append("q")
+    return q
+
+
+def get_no_cache():
+    calls.append("no_cache")
+    return "no_cache"
+
+
+async def get_a(
+    q: int = Depends(get_q), no_cache=Depends(get_no_cache, use_cache=False)
+):
+    calls.append("a")
+    return f"a{q}"
+
+
+def get_b(q: int = Depends(get_q)):
+    calls.append("b")
+    return f"b{q}"
+
+
+def endpoint(a=Depends(get_a), b=Depends(get_b), a2=Depends(get_a)):
+    return {"a": a, "b": b, "a2": a2}
+
+
+app = FastAPI()
+app.get("/")(endpoint)
+
+
+client = TestClient(app)
+
+
+def test_plan_steps():
+    dependant = get_dependant(path="/", call=endpoint)
+    plan = get_dependency_plan(dependant)
+    assert [step.call for step in plan.steps] == [
+        get_q,
+        get_no_cache,
+        get_a,
+        get_b,
+        None,
+    ]
+    assert [step.kind for step in plan.steps] == [
+        "sync",
+        "sync",
+        "coroutine",
+        "sync",
+        "sync",
+    ]
+    assert plan.steps[2].sub_dependencies == [("q", 0), ("no_cache", 1)]
+    assert plan.steps[3].sub_dependencies == [("q", 0)]
+    # The second get_a is resolved from the cached step
+    assert plan.steps[4].sub_dependencies == [("a", 2), ("b", 3), ("a2", 2)]
+
+
+def test_solve():
+    calls.clear()
+    response = client.get("/", params={"q": 1})
+    assert response.status_code == 200, response.text
+    assert response.json() == {"a": "a1", "b": "b1", "a2": "a1"}
+    assert calls == ["q", "no_cache", "a", "b"]
+
+
+@needs_pydanticv2
+def test_shared_dependency_errors_reported_once():
+    calls.clear()
+    response = client.get("/")
+    assert response.status_code == 422, response.text
+    assert response.json() == {
+        "detail": [
+            {
+                "type": "missing",
+                "loc": ["query", "q"],
+                "msg": "Field required",
+                "input": None,
+            }
+        ]
+    }
+    assert calls == ["no_cache"]
+
+
+def test_overrides_recompile_plan():
+    def override_q():
+        calls.append("override_q")
+        return 42
+
+    calls.clear()
+    app.dependency_overrides[get_q] = override_q
+    try:
+        response = client.get("/")
+        assert response.status_code == 200, response.text
+        assert response.json() == {"a": "a42", "b": "b42", "a2": "a42"}
+        assert calls == ["override_q", "no_cache", "a", "b"]
+    finally:
+        app.dependency_overrides.clear()
+    response = client.get("/")
+    assert response.status_code == 422, response.text
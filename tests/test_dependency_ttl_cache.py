@@ -0,0 +1,229 @@
+from typing import List, Optional
+
+import anyio
+import pytest
+from fastapi import Depends, FastAPI, Header, Request
+from fastapi.cache import TTLCache
+from fastapi.testclient import TestClient
+
+calls: List[str] = []
+user_cache = TTLCache(maxsize=2, ttl=60)
+tenant_cache = TTLCache()
+
+
+def get_tenant(x_tenant: str = Header()):
+    calls.append(f"tenant {x_tenant}")
+    return {"name": x_tenant}
+
+
+async def get_user(
+    token: str,
+    tenant: dict = Depends(get_tenant, cache=tenant_cache),
+):
+    calls.append(f"user {token}")
+    return {"token": token, "tenant": tenant["name"]}
+
+
+app = FastAPI()
+
+
+@app.get("/users/me")
+def read_me(user: dict = Depends(get_user, cache=user_cache)):
+    return user
+
+
+client = TestClient(app)
+
+
+@pytest.fixture(autouse=True)
+def reset_caches():
+    calls.clear()
+    for cache in (user_cache, tenant_cache):
+        cache.clear()
+        cache.hits = cache.misses = 0
+
+
+def test_cached_across_requests():
+    for _ in range(3):
+        response = client.get(
+            "/users/me", params={"token": "a"}, headers={"x-tenant": "t1"}
+        )
+        assert response.status_code == 200, response.text
+        assert response.json() == {"token": "a", "tenant": "t1"}
+    assert calls == ["tenant t1", "user a"]
+    assert (user_cache.hits, user_cache.misses) == (2, 1)
+    assert (tenant_cache.hits, tenant_cache.misses) == (2, 1)
+
+
+def test_keyed_by_parameters_and_sub_dependencies():
+    client.get("/users/me", params={"token": "a"}, headers={"x-tenant": "t1"})
+    client.get("/users/me", params={"token": "b"}, headers={"x-tenant": "t1"})
+    response = client.get(
+        "/users/me", params={"token": "a"}, headers={"x-tenant": "t2"}
+    )
+    assert response.json() == {"token": "a", "tenant": "t2"}
+    assert calls == ["tenant t1", "user a", "user b", "tenant t2", "user a"]
+    # maxsize=2, the least recently used value was evicted
+    assert len(user_cache) == 2
+    client.get("/users/me", params={"token": "a"}, headers={"x-tenant": "t1"})
+    assert calls[-1] == "user a"
+
+
+def test_ttl(monkeypatch: pytest.MonkeyPatch):
+    now = 1000.0
+    monkeypatch.setattr("fastapi.cache.time.monotonic", lambda: now)
+    cache = TTLCache(maxsize=10, ttl=5)
+    cache.set("key", "value")
+    assert cache.get("key") == "value"
+    now += 5
+    assert cache.get("key") is None
+    assert "key" not in cache
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_lru_eviction():
+    cache = TTLCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+    assert "a" in cache
+    assert "b" not in cache
+    assert "c" in cache
+
+
+def test_single_flight():
+    cache = TTLCache()
+    results: List[int] = []
+    factory_calls: List[str] = []
+
+    async def factory():
+        factory_calls.append("call")
+        await anyio.sleep(0.01)
+        return 42
+
+    async def get():
+        results.append(await cache.get_or_set("key", factory))
+
+    async def main():
+        async with anyio.create_task_group() as tg:
+            for _ in range(5):
+                tg.start_soon(get)
+
+    anyio.run(main)
+    assert results == [42] * 5
+    assert factory_calls == ["call"]
+    assert (cache.hits, cache.misses) == (4, 1)
+
+
+def test_single_flight_retries_after_error():
+    cache = TTLCache()
+    factory_calls: List[str] = []
+
+    async def factory():
+        factory_calls.append("call")
+        await anyio.sleep(0.01)
+        if len(factory_calls) == 1:
+            raise ValueError("first")
+        return 42
+
+    async def main():
+        results = []
+
+        async def get():
+            try:
+                results.append(await cache.get_or_set("key", factory))
+            except ValueError as e:
+                results.append(str(e))
+
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(get)
+            await anyio.sleep(0)
+            tg.start_soon(get)
+        return results
+
+    assert anyio.run(main) == ["first", 42]
+    assert factory_calls == ["call", "call"]
+
+
+def test_dict_order_ignored():
+    cache = TTLCache()
+    values = [{"a": 1, "b": 2}, {"b": 2, "a": 1}]
+
+    def get_options():
+        return values.pop(0)
+
+    def get_settings(options: dict = Depends(get_options)):
+        calls.append("settings")
+        return options
+
+    @app.get("/settings")
+    def read_settings(settings: dict = Depends(get_settings, cache=cache)):
+        return settings
+
+    for _ in range(2):
+        assert client.get("/settings").json() == {"a": 1, "b": 2}
+    assert calls == ["settings"]
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_omitted_optional_param_cached():
+    cache = TTLCache()
+
+    def get_search(q: Optional[str] = None):
+        calls.append(f"search {q}")
+        return q
+
+    @app.get("/search")
+    def read_search(search: Optional[str] = Depends(get_search, cache=cache)):
+        return search
+
+    for _ in range(3):
+        assert client.get("/search").json() is None
+    assert calls == ["search None"]
+    assert (cache.hits, cache.misses) == (2, 1)
+
+
+def test_identity_hashed_not_cached():
+    cache = TTLCache()
+
+    class Connection:
+        pass
+
+    def get_connection():
+        return Connection()
+
+    def get_status(connection: Connection = Depends(get_connection)):
+        calls.append("status")
+        return "ok"
+
+    @app.get("/status")
+    def read_status(status: str = Depends(get_status, cache=cache)):
+        return status
+
+    for _ in range(2):
+        assert client.get("/status").json() == "ok"
+    assert calls == ["status", "status"]
+    assert len(cache) == 0
+
+
+def test_generator_not_allowed():
+    def get_db():
+        yield "db"  # pragma: nocover
+
+    with pytest.raises(AssertionError, match="yield"):
+
+        @app.get("/db")
+        def read_db(db: str = Depends(get_db, cache=TTLCache())):
+            pass  # pragma: nocover
+
+
+def test_request_not_allowed():
+    def get_client(request: Request):
+        return request  # pragma: nocover
+
+    with pytest.raises(AssertionError, match="cached across requests"):
+
+        @app.get("/client")
+        def read_client(client=Depends(get_client, cache=TTLCache())):
+            pass  # pragma: nocover
@@ -0,0 +1,183 @@
+from typing import Any, List
+
+import pytest
+from fastapi import APIRouter, BackgroundTasks, FastAPI, Response, routing
+from fastapi.cache import ResponseCache
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+
+class Item(BaseModel):
+    name: str
+
+
+calls: List[str] = []
+items = {"foo": Item(name="Foo")}
+
+app = FastAPI(etag=True)
+
+
+@app.api_route("/items/{item_id}", methods=["GET", "HEAD"], response_model=Item)
+def read_item(item_id: str, response: Response):
+    response.headers["cache-control"] = "max-age=10"
+    return items[item_id]
+
+
+@app.put("/items/{item_id}", response_model=Item)
+def update_item(item_id: str, item: Item):
+    items[item_id] = item
+    return item
+
+
+@app.get("/versions/{version}")
+def read_version(version: str, response: Response, background_tasks: BackgroundTasks):
+    background_tasks.add_task(calls.append, "background")
+    response.headers["etag"] = version
+    return {"version": version}
+
+
+@app.get("/text", response_class=PlainTextResponse)
+def read_text():
+    return "Hello"
+
+
+@app.get("/stream")
+def read_stream():
+    return StreamingResponse(iter([b"Hello"]))
+
+
+@app.get("/created", status_code=201)
+def read_created():
+    return {}
+
+
+@app.get("/cached", cache=ResponseCache())
+def read_cached():
+    calls.append("cached")
+    return {"cached": True}
+
+
+router = APIRouter()
+
+
+@router.get("/off", etag=False)
+def read_off():
+    return {}
+
+
+app.include_router(router)
+
+default_app = FastAPI()
+
+
+@default_app.get("/")
+def read_root():
+    return {}
+
+
+@default_app.get("/on", etag=True)
+def read_on():
+    return {}
+
+
+client = TestClient(app)
+
+
+@pytest.fixture(autouse=True)
+def reset():
+    calls.clear()
+    items["foo"] = Item(name="Foo")
+
+
+def test_not_modified():
+    response = client.get("/items/foo")
+    assert response.status_code == 200, response.text
+    etag = response.headers["etag"]
+    assert etag.startswith('"') and etag.endswith('"')
+    assert client.get("/items/foo").headers["etag"] == etag
+    response = client.get("/items/foo", headers={"If-None-Match": etag})
+    assert response.status_code == 304, response.text
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+    assert response.headers["cache-control"] == "max-age=10"
+    assert "content-type" not in response.headers
+    response = client.head("/items/foo", headers={"If-None-Match": etag})
+    assert response.status_code == 304, response.text
+
+
+def test_if_none_match_list():
+    etag = client.get("/items/foo").headers["etag"]
+    for if_none_match in [f'"other", {etag}', f"W/{etag}", "*"]:
+        response = client.get("/items/foo", headers={"If-None-Match": if_none_match})
+        assert response.status_code == 304, if_none_match
+    response = client.get("/items/foo", headers={"If-None-Match": '"other"'})
+    assert response.status_code == 200, response.text
+
+
+def test_changed_body():
+    etag = client.get("/items/foo").headers["etag"]
+    response = client.put("/items/foo", json={"name": "Bar"})
+    assert "etag" not in response.headers
+    response = client.get("/items/foo", headers={"If-None-Match": etag})
+    assert response.status_code == 200, response.text
+    assert response.json() == {"name": "Bar"}
+    assert response.headers["etag"] != etag
+
+
+def test_changed_body_same_length_and_crc32():
+    # Two CRC32 collisions of the same length
+    client.put("/items/foo", json={"name": "plumless"})
+    etag = client.get("/items/foo").headers["etag"]
+    client.put("/items/foo", json={"name": "buckeroo"})
+    response = client.get("/items/foo", headers={"If-None-Match": etag})
+    assert response.status_code == 200, response.text
+    assert response.json() == {"name": "buckeroo"}
+    assert response.headers["etag"] != etag
+
+
+def test_version_key(monkeypatch: pytest.MonkeyPatch):
+    serialize_response = routing.serialize_response
+
+    async def counted_serialize_response(**kwargs: Any) -> Any:
+        calls.append("serialized")
+        return await serialize_response(**kwargs)
+
+    monkeypatch.setattr(routing, "serialize_response", counted_serialize_response)
+    response = client.get("/versions/v1")
+    assert response.headers["etag"] == '"v1"'
+    assert calls == ["serialized", "background"]
+    calls.clear()
+    response = client.get("/versions/v1", headers={"If-None-Match": '"v1"'})
+    assert response.status_code == 304, response.text
+    assert response.headers["etag"] == '"v1"'
+    assert calls == ["background"]
+    response = client.get("/versions/v2", headers={"If-None-Match": '"v1"'})
+    assert response.status_code == 200, response.text
+    assert response.headers["etag"] == '"v2"'
+
+
+def test_other_responses():
+    response = client.get("/text")
+    assert response.headers["etag"]
+    response = client.get("/text", headers={"If-None-Match": response.headers["etag"]})
+    assert response.status_code == 304, response.text
+    assert "etag" not in client.get("/stream").headers
+    assert "etag" not in client.get("/created").headers
+    assert "etag" not in client.get("/off").headers
+
+
+def test_response_cache():
+    etag = client.get("/cached").headers["etag"]
+    response = client.get("/cached", headers={"If-None-Match": etag})
+    assert response.status_code == 304, response.text
+    response = client.get("/cached")
+    assert response.status_code == 200, response.text
+    assert response.headers["etag"] == etag
+    assert calls == ["cached"]
+
+
+def test_opt_in():
+    default_client = TestClient(default_app)
+    assert "etag" not in default_client.get("/").headers
+    assert "etag" in default_client.get("/on").headers
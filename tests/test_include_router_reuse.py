@@ -0,0 +1,146 @@
+from typing import List
+
+import pytest
+from fastapi import APIRouter, Depends, FastAPI
+from fastapi.routing import APIRoute
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+from .utils import needs_pydanticv2
+
+
+class Item(BaseModel):
+    name: str
+
+
+class Message(BaseModel):
+    detail: str
+
+
+calls: List[str] = []
+
+
+def dep_outer():
+    calls.append("outer")
+
+
+def dep_middle():
+    calls.append("middle")
+
+
+def dep_inner():
+    calls.append("inner")
+
+
+def create_app() -> FastAPI:
+    inner = APIRouter(dependencies=[Depends(dep_inner)])
+
+    @inner.post(
+        "/items/{item_id}",
+        response_model=Item,
+        responses={404: {"model": Message}},
+    )
+    def update_item(item_id: int, item: Item, q: str = "default"):
+        return {"name": f"{item.name} {item_id} {q}"}
+
+    @inner.get("/users")
+    def read_users(user_id: str = "all"):
+        return {"user_id": user_id}
+
+    middle = APIRouter(dependencies=[Depends(dep_middle)])
+    middle.include_router(inner, prefix="/inner", tags=["inner"])
+    outer = APIRouter()
+    outer.include_router(middle, prefix="/middle")
+    outer.include_router(middle, prefix="/org/{user_id}")
+    app = FastAPI()
+    app.include_router(outer, prefix="/outer", dependencies=[Depends(dep_outer)])
+    app.state.routers = [inner, middle, outer]
+    return app
+
+
+def get_route(router: APIRouter, name: str, path_prefix: str = "") -> APIRoute:
+    return next(
+        route
+        for route in router.routes
+        if isinstance(route, APIRoute)
+        and route.name == name
+        and route.path.startswith(path_prefix)
+    )
+
+
+def test_reuses_analysis():
+    app = create_app()
+    inner, middle, outer = app.state.routers
+    inner_route = get_route(inner, "update_item")
+    app_route = get_route(app.router, "update_item", "/outer/middle")
+    assert app_route.path == "/outer/middle/inner/items/{item_id}"
+    assert app_route.dependant is not inner_route.dependant
+    assert app_route.dependant.path == "/outer/middle/inner/items/{item_id}"
+    assert app_route.dependant.path_params == inner_route.dependant.path_params
+    assert app_route.dependant.query_params[0] is inner_route.dependant.query_params[0]
+    assert app_route.dependant.body_params[0] is inner_route.dependant.body_params[0]
+    assert [dep.call for dep in app_route.dependant.dependencies] == [
+        dep_outer,
+        dep_middle,
+        dep_inner,
+    ]
+    # The source routes are not modified
+    assert [dep.call for dep in inner_route.dependant.dependencies] == [dep_inner]
+    middle_route = get_route(middle, "update_item")
+    assert [dep.call for dep in middle_route.dependant.dependencies] == [
+        dep_middle,
+        dep_inner,
+    ]
+    assert app_route.response_field.name == "Response_" + app_route.unique_id
+    assert app_route.response_fields[404].name == (
+        "Response_404_" + app_route.unique_id
+    )
+
+
+@needs_pydanticv2
+def test_shares_type_adapters():
+    app = create_app()
+    inner, middle, outer = app.state.routers
+    inner_route = get_route(inner, "update_item")
+    app_route = get_route(app.router, "update_item", "/outer/middle")
+    assert app_route.response_field._type_adapter is (
+        inner_route.response_field._type_adapter
+    )
+    assert app_route.response_fields[404]._type_adapter is (
+        inner_route.response_fields[404]._type_adapter
+    )
+
+
+def test_not_reused_with_new_path_params():
+    app = create_app()
+    inner, middle, outer = app.state.routers
+    inner_route = get_route(inner, "read_users")
+    app_route = get_route(app.router, "read_users", "/outer/org")
+    assert [param.name for param in inner_route.dependant.query_params] == ["user_id"]
+    assert [param.name for param in app_route.dependant.path_params] == ["user_id"]
+    assert app_route.dependant.query_params == []
+    client = TestClient(app)
+    response = client.get("/outer/org/42/inner/users")
+    assert response.json() == {"user_id": "42"}
+    response = client.get("/outer/middle/inner/users")
+    assert response.json() == {"user_id": "all"}
+
+
+def test_requests():
+    calls.clear()
+    client = TestClient(create_app())
+    response = client.post(
+        "/outer/middle/inner/items/3", params={"q": "x"}, json={"name": "Foo"}
+    )
+    assert response.status_code == 200, response.text
+    assert response.json() == {"name": "Foo 3 x"}
+    assert calls == ["outer", "middle", "inner"]
+    response = client.post("/outer/middle/inner/items/3", json={})
+    assert response.status_code == 422, response.text
+
+
+def test_openapi_same_as_without_reuse(monkeypatch: pytest.MonkeyPatch):
+    openapi = TestClient(create_app()).get("/openapi.json").json()
+    monkeypatch.setattr(APIRoute, "_get_source_route", lambda self: None)
+    expected = TestClient(create_app()).get("/openapi.json").json()
+    assert openapi == expected
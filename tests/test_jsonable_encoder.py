@@ -1,3 +1,5 @@
+import gc
+import weakref
 from collections import deque
 from dataclasses import dataclass
 from datetime import datetime, timezone
@@ -7,8 +9,9 @@ from pathlib import PurePath, PurePosixPath, PureWindowsPath
 from typing import Optional
 
 import pytest
+from fastapi import encoders
 from fastapi._compat import PYDANTIC_V2, Undefined
-from fastapi.encoders import jsonable_encoder
+from fastapi.encoders import ENCODERS_BY_TYPE, jsonable_encoder
 from pydantic import BaseModel, Field, ValidationError
 
 from .utils import needs_pydanticv1, needs_pydanticv2
@@ -316,3 +319,53 @@ def test_encode_deque_encodes_child_models():
 def test_encode_pydantic_undefined():
     data = {"value": Undefined}
     assert jsonable_encoder(data) == {"value": None}
+
+
+def test_encode_registered_type_after_first_use(monkeypatch: pytest.MonkeyPatch):
+    class Token:
+        def __init__(self, value: str):
+            self.value = value
+
+    assert jsonable_encoder([Token("a")]) == [{"value": "a"}]
+    monkeypatch.setitem(ENCODERS_BY_TYPE, Token, lambda o: o.value.upper())
+    assert jsonable_encoder([Token("a")]) == ["A"]
+
+
+def test_encode_dataclass_type():
+    @dataclass
+    class Item:
+        name: str
+
+    assert jsonable_encoder({"item": Item(name="foo")}) == {"item": {"name": "foo"}}
+    with pytest.raises(TypeError):
+        jsonable_encoder(Item)
+
+
+def test_encode_subclasses_of_plain_types():
+    class Name(str):
+        pass
+
+    class Color(str, Enum):
+        red = "red"
+
+    data = {Name("a"): [Name("b"), Color.red, True, 1.5], Color.red: None}
+    assert jsonable_encoder(data) == {"a": ["b", "red", True, 1.5], "red": None}
+    assert jsonable_encoder(data, custom_encoder={Name: lambda o: "name"}) == {
+        "name": ["name", "red", True, 1.5],
+        "red": None,
+    }
+
+
+def test_encoders_by_type_bounded():
+    class Token:
+        def __init__(self, value: str):
+            self.value = value
+
+    token_ref = weakref.ref(Token)
+    assert jsonable_encoder(Token("a")) == {"value": "a"}
+    for index in range(encoders._MAX_CACHED_TYPES):
+        jsonable_encoder(type(f"Dynamic{index}", (), {})())
+    assert len(encoders._encoders_by_type) <= encoders._MAX_CACHED_TYPES
+    del Token
+    gc.collect()
+    assert token_ref() is None
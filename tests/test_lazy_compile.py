@@ -0,0 +1,121 @@
+from typing import List
+
+import pytest
+from fastapi import APIRouter, Depends, FastAPI
+from fastapi.routing import APIRoute
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+
+class Item(BaseModel):
+    name: str
+    price: float
+
+
+calls: List[str] = []
+
+
+def get_token(token: str):
+    calls.append(token)
+    return token
+
+
+def create_app() -> FastAPI:
+    app = FastAPI(lazy_compile=True)
+
+    @app.post("/items/", response_model=Item)
+    def create_item(item: Item, token: str = Depends(get_token)):
+        return item
+
+    @app.get("/items/{item_id}")
+    def read_item(item_id: int) -> Item:
+        return Item(name=f"item {item_id}", price=1.5)
+
+    router = APIRouter(lazy_compile=False)
+
+    @router.get("/eager")
+    def read_eager():
+        return {"route": "eager"}
+
+    app.include_router(router)
+    return app
+
+
+def get_api_routes(app: FastAPI) -> List[APIRoute]:
+    return [route for route in app.routes if isinstance(route, APIRoute)]
+
+
+def test_not_compiled_until_used():
+    app = create_app()
+    routes = {route.name: route for route in get_api_routes(app)}
+    assert not routes["create_item"]._compiled
+    assert not routes["read_item"]._compiled
+    assert routes["read_eager"]._compiled
+    assert "dependant" not in routes["create_item"].__dict__
+    assert routes["read_item"].path_format == "/items/{item_id}"
+    assert routes["read_item"].methods == {"GET"}
+
+    client = TestClient(app)
+    response = client.get("/items/3")
+    assert response.status_code == 200, response.text
+    assert response.json() == {"name": "item 3", "price": 1.5}
+    assert routes["read_item"]._compiled
+    assert not routes["create_item"]._compiled
+
+
+def test_compiled_on_attribute_access():
+    app = create_app()
+    route = next(route for route in get_api_routes(app) if route.name == "create_item")
+    assert [param.name for param in route.dependant.dependencies[0].query_params] == [
+        "token"
+    ]
+    assert route._compiled
+    assert route.body_field is not None
+
+
+def test_requests():
+    calls.clear()
+    client = TestClient(create_app())
+    response = client.post(
+        "/items/", params={"token": "secret"}, json={"name": "Foo", "price": 3}
+    )
+    assert response.status_code == 200, response.text
+    assert response.json() == {"name": "Foo", "price": 3.0}
+    assert calls == ["secret"]
+    response = client.post("/items/", json={"name": "Foo", "price": 3})
+    assert response.status_code == 422, response.text
+
+
+def test_openapi_same_as_eager():
+    lazy_app = create_app()
+    eager_app = create_app()
+    eager_app.compile_all()
+    assert TestClient(lazy_app).get("/openapi.json").json() == (
+        TestClient(eager_app).get("/openapi.json").json()
+    )
+    assert all(route._compiled for route in get_api_routes(lazy_app))
+
+
+def test_compile_all():
+    app = create_app()
+    app.compile_all()
+    assert all(route._compiled for route in get_api_routes(app))
+
+
+def test_errors_raised_on_compile():
+    app = FastAPI(lazy_compile=True)
+
+    @app.get("/", status_code=204)
+    def read_root() -> Item:
+        pass  # pragma: nocover
+
+    with pytest.raises(AssertionError, match="must not have a response body"):
+        app.compile_all()
+
+
+def test_unknown_attribute():
+    app = create_app()
+    route = get_api_routes(app)[0]
+    with pytest.raises(AttributeError, match="missing"):
+        route.missing  # noqa: B018
+    assert not route._compiled
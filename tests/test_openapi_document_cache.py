@@ -0,0 +1,107 @@
+import gzip
+import json
+from typing import Any, Dict
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+
+def create_app() -> FastAPI:
+    app = FastAPI(title="Items")
+
+    @app.get("/items/")
+    def read_items(q: str = ""):
+        return []  # pragma: nocover
+
+    return app
+
+
+def test_rendered_once(monkeypatch: pytest.MonkeyPatch):
+    app = create_app()
+    client = TestClient(app)
+    rendered = []
+    render = app.openapi
+
+    def counted_openapi() -> Dict[str, Any]:
+        schema = render()
+        rendered.append(schema)
+        return schema
+
+    monkeypatch.setattr(app, "openapi", counted_openapi)
+    dumps = json.dumps
+    dumped = []
+
+    def counted_dumps(obj: Any, **kwargs: Any) -> str:
+        dumped.append(obj)
+        return dumps(obj, **kwargs)
+
+    monkeypatch.setattr(json, "dumps", counted_dumps)
+    first = client.get("/openapi.json")
+    second = client.get("/openapi.json")
+    assert first.status_code == 200, first.text
+    assert first.json() == second.json()
+    assert first.json()["info"]["title"] == "Items"
+    assert len(rendered) == 2
+    assert len(dumped) == 1
+
+
+def test_etag():
+    client = TestClient(create_app())
+    response = client.get("/openapi.json", headers={"Accept-Encoding": "identity"})
+    etag = response.headers["etag"]
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert "content-encoding" not in response.headers
+    response = client.get(
+        "/openapi.json", headers={"Accept-Encoding": "identity", "If-None-Match": etag}
+    )
+    assert response.status_code == 304, response.text
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+
+
+def test_gzip():
+    client = TestClient(create_app())
+    identity = client.get("/openapi.json", headers={"Accept-Encoding": "identity"})
+    response = client.get("/openapi.json", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["etag"] != identity.headers["etag"]
+    assert response.content == identity.content
+    assert int(response.headers["content-length"]) < len(identity.content)
+    raw = client.get("/openapi.json", headers={"Accept-Encoding": "gzip;q=0, deflate"})
+    assert "content-encoding" not in raw.headers
+
+
+def test_gzip_bytes():
+    app = create_app()
+    client = TestClient(app)
+    client.get("/openapi.json")
+    schema, content = app._openapi_documents[""]
+    body, _ = content.variants["gzip"]
+    assert json.loads(gzip.decompress(body)) == schema
+
+
+def test_invalidated_when_reset():
+    app = create_app()
+    client = TestClient(app)
+    etag = client.get("/openapi.json").headers["etag"]
+
+    @app.get("/users/")
+    def read_users():
+        return []  # pragma: nocover
+
+    response = client.get("/openapi.json", headers={"If-None-Match": etag})
+    assert response.status_code == 304, response.text
+    app.openapi_schema = None
+    response = client.get("/openapi.json", headers={"If-None-Match": etag})
+    assert response.status_code == 200, response.text
+    assert "/users/" in response.json()["paths"]
+
+
+def test_root_path_variants():
+    app = create_app()
+    response = TestClient(app, root_path="/api").get("/openapi.json")
+    assert response.status_code == 200, response.text
+    response = TestClient(app).get("/openapi.json")
+    assert response.status_code == 200, response.text
+    assert set(app._openapi_documents) == {"/api", ""}
@@ -0,0 +1,186 @@
+from typing import Any, Callable, List, Optional
+
+import pytest
+from fastapi import APIRouter, FastAPI
+from fastapi.openapi.utils import OpenAPIFragments, get_openapi
+from fastapi.routing import APIRoute
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+from .utils import needs_pydanticv2
+
+
+class Item(BaseModel):
+    name: str
+    description: Optional[str] = None
+
+
+class User(BaseModel):
+    username: str
+
+
+def create_router() -> APIRouter:
+    router = APIRouter(prefix="/plugin")
+
+    @router.get("/users/{username}", response_model=User)
+    def read_user(username: str):
+        return {"username": username}  # pragma: nocover
+
+    return router
+
+
+def create_app(**kwargs: Any) -> FastAPI:
+    app = FastAPI(**kwargs)
+
+    @app.get("/items/", response_model=List[Item])
+    def read_items(q: str = ""):
+        return []  # pragma: nocover
+
+    @app.post("/items/")
+    def create_item(item: Item):
+        return item  # pragma: nocover
+
+    return app
+
+
+@pytest.fixture
+def generated_routes(monkeypatch: pytest.MonkeyPatch) -> List[List[str]]:
+    calls: List[List[str]] = []
+    generate: Callable[..., Any] = OpenAPIFragments._generate
+
+    def counted_generate(
+        self: OpenAPIFragments, routes: List[APIRoute], *args: Any
+    ) -> Any:
+        calls.append([route.name for route in routes])
+        return generate(self, routes, *args)
+
+    monkeypatch.setattr(OpenAPIFragments, "_generate", counted_generate)
+    return calls
+
+
+def test_added_routes(generated_routes: List[List[str]]):
+    app = create_app(incremental_openapi=True)
+    client = TestClient(app)
+    response = client.get("/openapi.json")
+    assert "/plugin/users/{username}" not in response.json()["paths"]
+    app.include_router(create_router())
+    response = client.get("/openapi.json")
+    expected_app = create_app()
+    expected_app.include_router(create_router())
+    assert response.json() == expected_app.openapi()
+    assert generated_routes == [["read_items", "create_item"], ["read_user"]]
+    assert app.openapi() is app.openapi()
+    assert generated_routes == [["read_items", "create_item"], ["read_user"]]
+
+
+def test_removed_routes(generated_routes: List[List[str]]):
+    app = create_app(incremental_openapi=True)
+    app.include_router(create_router())
+    assert "User" in app.openapi()["components"]["schemas"]
+    app.router.routes = [
+        route for route in app.routes if getattr(route, "name", "") != "read_user"
+    ]
+    assert app.openapi() == create_app().openapi()
+    assert "User" not in app.openapi()["components"]["schemas"]
+    assert generated_routes == [["read_items", "create_item", "read_user"]]
+
+
+def test_not_incremental_by_default():
+    app = create_app()
+    schema = app.openapi()
+    app.include_router(create_router())
+    assert app.openapi() is schema
+
+
+def test_custom_schema_kept():
+    app = create_app(incremental_openapi=True)
+    app.openapi_schema = {"openapi": "3.1.0", "custom": True}
+    app.include_router(create_router())
+    assert app.openapi() == {"openapi": "3.1.0", "custom": True}
+
+
+def test_conflicting_definitions(generated_routes: List[List[str]]):
+    app = create_app(incremental_openapi=True)
+    app.openapi()
+
+    class Item(BaseModel):  # type: ignore[no-redef]
+        title: str
+
+    @app.put("/other-items/")
+    def replace_item(item: Item):
+        return item  # pragma: nocover
+
+    schema = app.openapi()
+    assert generated_routes[-1] == ["read_items", "create_item", "replace_item"]
+    assert schema == get_openapi(
+        title=app.title, version=app.version, routes=app.routes
+    )
+
+
+@needs_pydanticv2
+def test_input_output_names(generated_routes: List[List[str]]):
+    class Item(BaseModel):  # type: ignore[no-redef]
+        name: str
+        description: Optional[str] = None
+        model_config = {"json_schema_serialization_defaults_required": True}
+
+    app = FastAPI(incremental_openapi=True)
+
+    @app.post("/items/")
+    def create_item(item: Item):
+        return item  # pragma: nocover
+
+    assert "Item" in app.openapi()["components"]["schemas"]
+
+    @app.get("/items/{name}", response_model=Item)
+    def read_item(name: str):
+        return {"name": name}  # pragma: nocover
+
+    schema = app.openapi()
+    assert generated_routes[-1] == ["create_item", "read_item"]
+    assert schema == get_openapi(
+        title=app.title, version=app.version, routes=app.routes
+    )
+    assert "Item-Output" in schema["components"]["schemas"]
+    assert "Item" not in schema["components"]["schemas"]
+
+    @app.get("/items/{name}/similar", response_model=List[Item])
+    def read_similar_items(name: str):
+        return []  # pragma: nocover
+
+    assert app.openapi() == get_openapi(
+        title=app.title, version=app.version, routes=app.routes
+    )
+    # Generated on its own, the model would be named just Item
+    assert generated_routes[-2:] == [
+        ["read_similar_items"],
+        ["create_item", "read_item", "read_similar_items"],
+    ]
+
+
+def test_duplicate_operation_id():
+    app = create_app(incremental_openapi=True)
+    app.openapi()
+
+    @app.get("/other-items/", operation_id="read_items_items__get")
+    def read_other_items():
+        return []  # pragma: nocover
+
+    with pytest.warns(UserWarning, match="Duplicate Operation ID"):
+        app.openapi()
+
+
+def test_fragments():
+    fragments = OpenAPIFragments()
+    app = create_app()
+    routes = [route for route in app.routes if isinstance(route, APIRoute)]
+    assert not fragments.update(routes)
+    assert len(fragments) == 2
+    assert fragments.update(routes)
+    assert not fragments.update(routes, separate_input_output_schemas=False)
+    fragments.clear()
+    assert len(fragments) == 0
+    schema = get_openapi(
+        title=app.title, version=app.version, routes=app.routes, fragments=fragments
+    )
+    assert schema == app.openapi()
@@ -0,0 +1,174 @@
+import json
+from decimal import Decimal
+from pathlib import Path
+from typing import Any, List, Optional, Type
+
+import pytest
+from fastapi import FastAPI
+from fastapi.exceptions import FastAPIError
+from fastapi.openapi.utils import get_openapi_checksum
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+from .utils import needs_pydanticv2
+
+
+class Item(BaseModel):
+    name: str
+    description: Optional[str] = None
+
+
+class OtherItem(BaseModel):
+    name: str
+    price: float
+
+
+def create_app(model: Type[BaseModel] = Item, **kwargs: Any) -> FastAPI:
+    app = FastAPI(title="Items", **kwargs)
+
+    @app.get("/items/", response_model=List[model])  # type: ignore[valid-type]
+    def read_items(q: str = ""):
+        return []  # pragma: nocover
+
+    return app
+
+
+@pytest.fixture
+def source(tmp_path: Path) -> str:
+    path = str(tmp_path / "openapi.json")
+    create_app().export_openapi(path)
+    return path
+
+
+def test_export(source: str):
+    with open(source, "rb") as f:
+        schema = json.load(f)
+    checksum = schema.pop("x-fastapi-checksum")
+    assert schema == create_app().openapi()
+    assert checksum == create_app()._get_openapi_checksum()
+
+
+def test_served_from_source(source: str, monkeypatch: pytest.MonkeyPatch):
+    app = create_app(openapi_source=source)
+    monkeypatch.setattr(
+        "fastapi.applications.get_openapi",
+        lambda **kwargs: pytest.fail("The schema was generated"),  # pragma: nocover
+    )
+    with TestClient(app) as client:
+        response = client.get("/openapi.json")
+    assert response.status_code == 200, response.text
+    with open(source, "rb") as f:
+        assert response.content == f.read()
+    assert app.openapi() == response.json()
+
+
+@pytest.mark.parametrize("lifespan", [True, False])
+def test_root_path(source: str, lifespan: bool):
+    app = create_app(openapi_source=source, root_path="/api/v1")
+    client = TestClient(app)
+    if lifespan:
+        with client:
+            response = client.get("/openapi.json")
+    else:
+        response = client.get("/openapi.json")
+    assert response.status_code == 200, response.text
+    schema = response.json()
+    del schema["x-fastapi-checksum"]
+    expected = TestClient(create_app(root_path="/api/v1")).get("/openapi.json")
+    assert schema == expected.json()
+    assert schema["servers"] == [{"url": "/api/v1"}]
+
+
+def test_added_route(source: str):
+    app = create_app(openapi_source=source)
+
+    @app.get("/users/")
+    def read_users():
+        return []  # pragma: nocover
+
+    with pytest.raises(FastAPIError, match="export it again"):
+        with TestClient(app):
+            pass  # pragma: nocover
+    with pytest.raises(FastAPIError, match="export it again"):
+        app.openapi()
+
+
+def test_changed_model(source: str):
+    app = create_app(OtherItem, openapi_source=source)
+    with pytest.raises(FastAPIError, match="export it again"):
+        app.openapi()
+
+
+def test_checksum_set_order():
+    def create_tagged_app(tags: List[str]) -> FastAPI:
+        app = FastAPI()
+
+        @app.get("/items/", openapi_extra={"x-tags": set(tags)})
+        def read_items():
+            pass  # pragma: nocover
+
+        return app
+
+    def get_checksum(app: FastAPI) -> str:
+        return get_openapi_checksum(
+            title=app.title, version=app.version, routes=app.routes
+        )
+
+    tags = [f"tag{index}" for index in range(20)]
+    assert get_checksum(create_tagged_app(tags)) == get_checksum(
+        create_tagged_app(tags[::-1])
+    )
+
+
+@needs_pydanticv2
+def test_checksum_model_schema():
+    from pydantic import ConfigDict
+
+    def create_model(**config: Any) -> Type[BaseModel]:
+        # The same name and fields, only the JSON Schema changes
+        class Item(BaseModel):
+            model_config = ConfigDict(**config)
+            name: str
+            price: Decimal
+
+        return Item
+
+    class CustomItem(create_model()):  # type: ignore[misc]
+        @classmethod
+        def __get_pydantic_json_schema__(cls, core_schema: Any, handler: Any) -> Any:
+            schema = handler(core_schema)
+            schema["description"] = "Custom"
+            return schema
+
+    CustomItem.__qualname__ = create_model().__qualname__
+
+    def get_checksum(model: Type[BaseModel]) -> str:
+        app = create_app(model)
+        return get_openapi_checksum(
+            title=app.title, version=app.version, routes=app.routes
+        )
+
+    checksum = get_checksum(create_model())
+    assert get_checksum(create_model()) == checksum
+    assert get_checksum(create_model(title="Other")) != checksum
+    assert (
+        get_checksum(create_model(json_schema_extra={"examples": [{"name": "Foo"}]}))
+        != checksum
+    )
+    assert get_checksum(create_model(json_schema_mode_override="serialization")) != (
+        get_checksum(create_model(json_schema_mode_override="validation"))
+    )
+    assert get_checksum(CustomItem) != checksum
+
+
+def test_checksum():
+    def get_checksum(app: FastAPI) -> str:
+        return get_openapi_checksum(
+            title=app.title, version=app.version, routes=app.routes
+        )
+
+    assert get_checksum(create_app()) == get_checksum(create_app())
+    assert get_checksum(create_app()) != get_checksum(create_app(OtherItem))
+    assert get_checksum(create_app()) != get_openapi_checksum(
+        title="Other", version="0.1.0", routes=create_app().routes
+    )
@@ -0,0 +1,91 @@
+from enum import Enum
+from typing import Any, List, Optional
+
+import pytest
+from fastapi import Body, Depends, FastAPI, Query
+from fastapi.openapi.utils import get_openapi
+from fastapi.security import OAuth2PasswordBearer
+from fastapi.testclient import TestClient
+from pydantic import BaseModel, ValidationError
+
+
+class Color(str, Enum):
+    red = "red"
+    blue = "blue"
+
+
+class Item(BaseModel):
+    name: str
+    color: Color = Color.red
+    description: Optional[str] = None
+
+
+oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token", scopes={"read": "Read"})
+
+
+def create_app(**kwargs: Any) -> FastAPI:
+    kwargs.setdefault("openapi_tags", [{"name": "items", "description": "Items"}])
+    app = FastAPI(title="Items", servers=[{"url": "https://example.com"}], **kwargs)
+
+    @app.get("/items/", response_model=List[Item], tags=["items"])
+    def read_items(
+        q: Optional[str] = Query(None, examples=["foo"]),
+        token: str = Depends(oauth2_scheme),
+    ):
+        return []  # pragma: nocover
+
+    @app.post(
+        "/items/",
+        responses={404: {"description": "Not found"}},
+        openapi_extra={"x-extra": None},
+    )
+    def create_item(item: Item = Body(examples=[{"name": "Foo"}])):
+        return item  # pragma: nocover
+
+    @app.webhooks.post("new-item")
+    def new_item(item: Item):
+        pass  # pragma: nocover
+
+    return app
+
+
+def test_same_schema(monkeypatch: pytest.MonkeyPatch):
+    expected = create_app().openapi()
+    app = create_app(validate_openapi=False)
+    monkeypatch.setattr(
+        "fastapi.openapi.utils.OpenAPI",
+        lambda **kwargs: pytest.fail("The schema was validated"),  # pragma: nocover
+    )
+    schema = app.openapi()
+    assert schema == expected
+    assert list(schema) == list(expected)
+    assert "x-extra" not in schema["paths"]["/items/"]["post"]
+    response = TestClient(app).get("/openapi.json")
+    assert response.json() == expected
+
+
+def test_invalid_schema():
+    app = create_app(openapi_tags=[{"description": "Missing name"}])
+    with pytest.raises(ValidationError):
+        app.openapi()
+    app = create_app(
+        openapi_tags=[{"description": "Missing name"}], validate_openapi=False
+    )
+    assert app.openapi()["tags"] == [{"description": "Missing name"}]
+
+
+def test_get_openapi():
+    app = create_app()
+    schema = get_openapi(
+        title=app.title,
+        version=app.version,
+        routes=app.routes,
+        webhooks=app.webhooks.routes,
+        validate=False,
+    )
+    assert schema == get_openapi(
+        title=app.title,
+        version=app.version,
+        routes=app.routes,
+        webhooks=app.webhooks.routes,
+    )
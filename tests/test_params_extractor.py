@@ -0,0 +1,82 @@
+from fastapi import Cookie, Depends, FastAPI, Header, Request
+from fastapi.dependencies.utils import get_dependant, get_params_extractors
+from fastapi.params import ParamTypes
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+
+class CommonHeaders(BaseModel):
+    x_token: str
+    user_agent: str
+
+
+app = FastAPI()
+
+
+@app.get("/items/{item_id}")
+def read_item(item_id: int, request: Request):
+    return {
+        "item_id": item_id,
+        "query_params": hasattr(request, "_query_params"),
+        "headers": hasattr(request, "_headers"),
+        "cookies": hasattr(request, "_cookies"),
+    }
+
+
+def get_session(session: str = Cookie()):
+    return session
+
+
+@app.get("/session")
+def read_session(session: str = Depends(get_session)):
+    return {"session": session}
+
+
+client = TestClient(app)
+
+
+def test_sources_not_used_are_not_parsed():
+    response = client.get(
+        "/items/3?q=foo", headers={"x-token": "bar", "cookie": "session=baz"}
+    )
+    assert response.status_code == 200, response.text
+    assert response.json() == {
+        "item_id": 3,
+        "query_params": False,
+        "headers": False,
+        "cookies": False,
+    }
+
+
+def test_sub_dependency_params():
+    response = client.get("/session", headers={"cookie": "session=baz"})
+    assert response.status_code == 200, response.text
+    assert response.json() == {"session": "baz"}
+
+
+def test_extractors_only_for_declared_sources():
+    def endpoint(item_id: int, q: str, x_token: str = Header()):
+        pass  # pragma: nocover
+
+    extractors = get_params_extractors(get_dependant(path="/{item_id}", call=endpoint))
+    assert [extractor.in_ for extractor in extractors] == [
+        ParamTypes.path,
+        ParamTypes.query,
+        ParamTypes.header,
+    ]
+    assert [key for _, key, _ in extractors[2].entries] == ["x-token"]
+
+
+def test_header_model_keys_precomputed():
+    def endpoint(headers: CommonHeaders = Header()):
+        pass  # pragma: nocover
+
+    (extractor,) = get_params_extractors(get_dependant(path="/", call=endpoint))
+    assert extractor.model_field is not None
+    assert [key for _, key, _ in extractor.entries] == ["x-token", "user-agent"]
+    assert extractor.processed_keys == {
+        "x-token",
+        "x_token",
+        "user-agent",
+        "user_agent",
+    }
@@ -0,0 +1,198 @@
+from typing import List
+
+import pytest
+from fastapi import APIRouter, FastAPI, WebSocket
+from fastapi.responses import PlainTextResponse
+from fastapi.routing import _RouteIndex
+from fastapi.testclient import TestClient
+from starlette.routing import Host, Route
+
+
+def create_app(radix_routing: bool) -> FastAPI:
+    app = FastAPI(radix_routing=radix_routing)
+
+    @app.get("/users/{user_id}")
+    def read_user(user_id: str):
+        return {"route": "user", "user_id": user_id}
+
+    @app.get("/users/me")
+    def read_me():
+        return {"route": "me"}  # pragma: nocover
+
+    @app.post("/users/me")
+    def update_me():
+        return {"route": "update me"}
+
+    @app.get("/items/{item_id:int}")
+    def read_item(item_id: int):
+        return {"route": "item", "item_id": item_id}
+
+    @app.get("/items/{name}")
+    def read_item_by_name(name: str):
+        return {"route": "item by name", "name": name}
+
+    @app.get("/files/{file_path:path}")
+    def read_file(file_path: str):
+        return {"route": "file", "file_path": file_path}
+
+    @app.get("/reports/{year}-{month}.json")
+    def read_report(year: int, month: int):
+        return {"route": "report", "year": year, "month": month}
+
+    @app.put("/items/{item_id}")
+    def update_item(item_id: str):
+        return {"route": "update item", "item_id": item_id}
+
+    @app.get("/trailing/")
+    def read_trailing():
+        return {"route": "trailing"}
+
+    @app.get("/")
+    def read_root():
+        return {"route": "root"}
+
+    @app.websocket("/ws/{room}")
+    async def websocket(websocket: WebSocket):
+        await websocket.accept()
+        await websocket.send_text(websocket.path_params["room"])
+        await websocket.close()
+
+    sub_app = FastAPI()
+
+    @sub_app.get("/status")
+    def read_sub_status():
+        return {"route": "sub status"}
+
+    app.mount("/sub", sub_app)
+
+    router = APIRouter(prefix="/v1")
+
+    @router.get("/orders/search")
+    def search_orders():
+        return {"route": "search orders"}
+
+    app.include_router(router)
+    app.router.routes.append(
+        Host("api.example.com", app=PlainTextResponse("host"), name="host")
+    )
+    return app
+
+
+paths = [
+    ("GET", "/"),
+    ("GET", "/users/me"),
+    ("POST", "/users/me"),
+    ("DELETE", "/users/me"),
+    ("GET", "/users/42"),
+    ("GET", "/users/"),
+    ("GET", "/users"),
+    ("GET", "/items/3"),
+    ("GET", "/items/foo"),
+    ("PUT", "/items/3"),
+    ("DELETE", "/items/3"),
+    ("GET", "/items/3/extra"),
+    ("GET", "/files/"),
+    ("GET", "/files/a/b/c.txt"),
+    ("GET", "/files"),
+    ("GET", "/reports/2024-05.json"),
+    ("GET", "/reports/2024.json"),
+    ("GET", "/trailing"),
+    ("GET", "/trailing/"),
+    ("GET", "/sub/status"),
+    ("GET", "/sub/missing"),
+    ("GET", "/sub"),
+    ("GET", "/v1/orders/search"),
+    ("GET", "/v1/orders/search/"),
+    ("GET", "/missing"),
+    ("GET", "/openapi.json"),
+]
+
+
+@pytest.mark.parametrize("method,path", paths)
+def test_same_as_linear(method: str, path: str):
+    linear = TestClient(create_app(radix_routing=False))
+    radix = TestClient(create_app(radix_routing=True))
+    expected = linear.request(method, path, follow_redirects=False)
+    response = radix.request(method, path, follow_redirects=False)
+    assert response.status_code == expected.status_code
+    assert response.content == expected.content
+    assert response.headers.get("location") == expected.headers.get("location")
+    assert response.headers.get("allow") == expected.headers.get("allow")
+
+
+def test_host():
+    client = TestClient(
+        create_app(radix_routing=True), base_url="http://api.example.com"
+    )
+    response = client.get("/anything")
+    assert response.text == "host"
+
+
+def test_websocket():
+    client = TestClient(create_app(radix_routing=True))
+    with client.websocket_connect("/ws/general") as websocket:
+        assert websocket.receive_text() == "general"
+
+
+def test_routes_added_later():
+    app = create_app(radix_routing=True)
+    client = TestClient(app)
+    assert client.get("/late").status_code == 404
+
+    @app.get("/late")
+    def read_late():
+        return {"route": "late"}
+
+    assert client.get("/late").json() == {"route": "late"}
+    app.router.routes.insert(0, Route("/late", PlainTextResponse("first")))
+    assert client.get("/late").text == "first"
+    app.router.routes = [Route("/late", PlainTextResponse("replaced"))]
+    assert client.get("/late").text == "replaced"
+
+
+def test_routes_removed_and_appended():
+    app = create_app(radix_routing=True)
+    client = TestClient(app)
+    assert client.get("/users/me").json() == {"route": "user", "user_id": "me"}
+    routes = app.router.routes
+    routes.remove(routes[0])
+    routes.append(Route("/late", PlainTextResponse("late")))
+    assert client.get("/late").text == "late"
+    assert client.get("/users/me").json() == {"route": "user", "user_id": "me"}
+
+
+def test_routes_replaced_in_place():
+    app = create_app(radix_routing=True)
+    client = TestClient(app)
+    assert client.get("/late").status_code == 404
+    assert app.router.routes[0].path == "/openapi.json"  # type: ignore[attr-defined]
+    app.router.routes[0] = Route("/late", PlainTextResponse("replaced"))
+    assert client.get("/late").text == "replaced"
+    assert client.get("/openapi.json").status_code == 404
+    app.router.routes[:] = [Route("/other", PlainTextResponse("other"))]
+    assert client.get("/other").text == "other"
+    assert client.get("/late").status_code == 404
+
+
+def test_candidates():
+    app = create_app(radix_routing=True)
+    index = _RouteIndex(app.router.routes, radix=True)
+
+    def candidate_paths(path: str) -> List[str]:
+        return [
+            getattr(route, "path", None) or getattr(route, "host", "")
+            for route in index.get_candidates(path)
+        ]
+
+    assert candidate_paths("/users/me") == [
+        "/users/{user_id}",
+        "/users/me",
+        "/users/me",
+        "api.example.com",
+    ]
+    assert candidate_paths("/items/foo") == [
+        "/items/{name}",
+        "/items/{item_id}",
+        "api.example.com",
+    ]
+    assert candidate_paths("/missing") == ["api.example.com"]
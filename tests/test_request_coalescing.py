@@ -0,0 +1,214 @@
+from typing import List
+
+import anyio
+import pytest
+from fastapi import (
+    BackgroundTasks,
+    FastAPI,
+    Header,
+    HTTPException,
+    Request,
+    Response,
+)
+from fastapi.cache import RequestCoalescer, ResponseCache
+from fastapi.responses import StreamingResponse
+from httpx import ASGITransport, AsyncClient
+
+calls: List[str] = []
+release = anyio.Event()
+coalescer = RequestCoalescer(vary=["x-tenant"])
+response_cache = ResponseCache()
+
+app = FastAPI()
+
+
+@app.get("/reports/", coalesce=coalescer)
+async def read_report(
+    background_tasks: BackgroundTasks, q: str = "", x_tenant: str = Header("")
+):
+    calls.append(f"report {q} {x_tenant}")
+    background_tasks.add_task(calls.append, "background")
+    await release.wait()
+    if q == "missing":
+        raise HTTPException(status_code=404)
+    return {"q": q, "tenant": x_tenant}
+
+
+@app.post("/reports/", coalesce=coalescer)
+async def create_report():
+    calls.append("create")
+    await release.wait()
+    return {}
+
+
+@app.get("/cookie", coalesce=RequestCoalescer())
+async def read_cookie(response: Response):
+    calls.append("cookie")
+    await release.wait()
+    response.set_cookie("session", "abc")
+    return {}
+
+
+@app.get("/stream", coalesce=RequestCoalescer())
+async def read_stream():
+    calls.append("stream")
+    await release.wait()
+    return StreamingResponse(iter([b"Hello"]))
+
+
+@app.get("/me", coalesce=RequestCoalescer())
+async def read_me(authorization: str = Header()):
+    calls.append(f"me {authorization}")
+    await release.wait()
+    return {"authorization": authorization}
+
+
+@app.get("/cached", cache=response_cache, coalesce=RequestCoalescer())
+async def read_cached():
+    calls.append("cached")
+    await release.wait()
+    return {"cached": True}
+
+
+@pytest.fixture(autouse=True)
+def reset():
+    global release
+    calls.clear()
+    coalescer.coalesced = 0
+    response_cache.clear()
+    release = anyio.Event()
+
+
+async def send_requests(*requests: dict) -> list:
+    responses = [None] * len(requests)
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+
+        async def send(index: int, request: dict) -> None:
+            responses[index] = await client.request(**request)
+
+        async with anyio.create_task_group() as tg:
+            for index, request in enumerate(requests):
+                tg.start_soon(send, index, request)
+            await anyio.wait_all_tasks_blocked()
+            release.set()
+    return responses
+
+
+@pytest.mark.anyio
+async def test_coalesced():
+    request = {"method": "GET", "url": "/reports/", "params": {"q": "a"}}
+    responses = await send_requests(*[request] * 5)
+    assert [response.json() for response in responses] == [{"q": "a", "tenant": ""}] * 5
+    assert len({response.headers["content-length"] for response in responses}) == 1
+    assert calls == ["report a ", "background"]
+    assert coalescer.coalesced == 4
+
+
+@pytest.mark.anyio
+async def test_key():
+    responses = await send_requests(
+        {"method": "GET", "url": "/reports/", "params": {"q": "a"}},
+        {"method": "GET", "url": "/reports/", "params": {"q": "b"}},
+        {
+            "method": "GET",
+            "url": "/reports/",
+            "params": {"q": "a"},
+            "headers": {"x-tenant": "acme"},
+        },
+        {"method": "POST", "url": "/reports/"},
+        {"method": "POST", "url": "/reports/"},
+    )
+    assert [response.status_code for response in responses] == [200] * 5
+    assert sorted(calls) == [
+        "background",
+        "background",
+        "background",
+        "create",
+        "create",
+        "report a ",
+        "report a acme",
+        "report b ",
+    ]
+    assert coalescer.coalesced == 0
+
+
+@pytest.mark.anyio
+async def test_error_shared():
+    request = {"method": "GET", "url": "/reports/", "params": {"q": "missing"}}
+    responses = await send_requests(*[request] * 3)
+    assert [response.status_code for response in responses] == [404] * 3
+    assert calls == ["report missing "]
+    assert coalescer.coalesced == 2
+
+
+@pytest.mark.anyio
+async def test_error_copied():
+    coalescer = RequestCoalescer()
+    error = HTTPException(status_code=404)
+    errors: List[BaseException] = []
+    started = anyio.Event()
+
+    async def render(request: Request) -> Response:
+        started.set()
+        await release.wait()
+        raise error
+
+    async def get() -> None:
+        request = Request(
+            {
+                "type": "http",
+                "method": "GET",
+                "path": "/",
+                "query_string": b"",
+                "headers": [],
+            }
+        )
+        try:
+            await coalescer.get_or_render(request, render)
+        except HTTPException as e:
+            errors.append(e)
+
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(get)
+        await started.wait()
+        tg.start_soon(get)
+        tg.start_soon(get)
+        await anyio.wait_all_tasks_blocked()
+        release.set()
+    assert errors[0] is error
+    assert errors[1] is not error and errors[2] is not error
+    assert errors[1] is not errors[2]
+    assert [e.__cause__ for e in errors[1:]] == [error, error]
+    assert [e.status_code for e in errors] == [404] * 3
+
+
+@pytest.mark.anyio
+async def test_credentials_not_coalesced():
+    responses = await send_requests(
+        {"method": "GET", "url": "/me", "headers": {"Authorization": "Bearer a"}},
+        {"method": "GET", "url": "/me", "headers": {"Authorization": "Bearer b"}},
+    )
+    assert [response.json() for response in responses] == [
+        {"authorization": "Bearer a"},
+        {"authorization": "Bearer b"},
+    ]
+    assert sorted(calls) == ["me Bearer a", "me Bearer b"]
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("path", ["/cookie", "/stream"])
+async def test_not_copied(path: str):
+    responses = await send_requests(*[{"method": "GET", "url": path}] * 3)
+    assert [response.status_code for response in responses] == [200] * 3
+    assert calls == [path[1:]] * 3
+
+
+@pytest.mark.anyio
+async def test_response_cache():
+    responses = await send_requests(*[{"method": "GET", "url": "/cached"}] * 3)
+    assert [response.json() for response in responses] == [{"cached": True}] * 3
+    responses = await send_requests({"method": "GET", "url": "/cached"})
+    assert responses[0].json() == {"cached": True}
+    assert calls == ["cached"]
@@ -0,0 +1,194 @@
+from typing import List
+
+import pytest
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    FastAPI,
+    HTTPException,
+    Response,
+)
+from fastapi.cache import ResponseCache
+from fastapi.testclient import TestClient
+
+calls: List[str] = []
+items_cache = ResponseCache(ttl=10, maxsize=2, vary=["Authorization"])
+stale_cache = ResponseCache(ttl=10, stale_while_revalidate=20)
+uncacheable_cache = ResponseCache()
+versions = {"item": 1}
+
+
+def get_user():
+    calls.append("user")
+    return "user"
+
+
+app = FastAPI()
+
+
+@app.get("/items/", cache=items_cache)
+def read_items(q: str = "", user: str = Depends(get_user)):
+    calls.append(f"items {q}")
+    return {"q": q, "count": len(calls)}
+
+
+@app.get("/stale", cache=stale_cache)
+def read_stale(background_tasks: BackgroundTasks):
+    background_tasks.add_task(calls.append, "background")
+    if versions["item"] is None:
+        raise HTTPException(status_code=404)
+    calls.append("stale")
+    return {"version": versions["item"]}
+
+
+@app.get("/cookie", cache=uncacheable_cache)
+def read_cookie(response: Response):
+    calls.append("cookie")
+    response.set_cookie("session", "abc")
+    return {}
+
+
+@app.get("/not-found", cache=uncacheable_cache)
+def read_not_found():
+    calls.append("not found")
+    raise HTTPException(status_code=404)
+
+
+@app.get("/no-store", cache=uncacheable_cache)
+def read_no_store(response: Response):
+    calls.append("no store")
+    response.headers["cache-control"] = "no-store"
+    return {}
+
+
+router = APIRouter()
+
+
+@router.get("/included", cache=uncacheable_cache)
+def read_included():
+    calls.append("included")
+    return {}
+
+
+app.include_router(router, prefix="/router")
+
+client = TestClient(app)
+
+
+@pytest.fixture(autouse=True)
+def reset():
+    calls.clear()
+    client.cookies.clear()
+    versions["item"] = 1
+    for cache in (items_cache, stale_cache, uncacheable_cache):
+        cache.clear()
+        cache.hits = cache.stale_hits = cache.misses = 0
+
+
+def test_hit_skips_dependencies_and_endpoint():
+    response = client.get("/items/", params={"q": "a"})
+    assert response.status_code == 200, response.text
+    assert response.json() == {"q": "a", "count": 2}
+    cached = client.get("/items/", params={"q": "a"})
+    assert cached.status_code == 200, cached.text
+    assert cached.content == response.content
+    assert cached.headers["content-type"] == "application/json"
+    assert cached.headers["content-length"] == response.headers["content-length"]
+    assert calls == ["user", "items a"]
+    assert (items_cache.hits, items_cache.misses) == (1, 1)
+
+
+def test_key():
+    client.get("/items/", params=[("q", "a"), ("x", "1")])
+    client.get("/items/", params=[("x", "1"), ("q", "a")])
+    assert calls == ["user", "items a"]
+    client.get("/items/", params={"q": "a"}, headers={"Authorization": "Bearer x"})
+    client.get("/items/", params={"q": "a"}, headers={"Authorization": "Bearer y"})
+    assert calls == ["user", "items a", "user", "items a", "user", "items a"]
+    assert len(items_cache) == 2
+
+
+def test_lru_eviction():
+    client.get("/items/", params={"q": "a"})
+    client.get("/items/", params={"q": "b"})
+    client.get("/items/", params={"q": "a"})
+    client.get("/items/", params={"q": "c"})
+    calls.clear()
+    client.get("/items/", params={"q": "a"})
+    client.get("/items/", params={"q": "b"})
+    assert calls == ["user", "items b"]
+
+
+def test_ttl(monkeypatch: pytest.MonkeyPatch):
+    now = 1000.0
+    monkeypatch.setattr("fastapi.cache.time.monotonic", lambda: now)
+    client.get("/items/")
+    now += 9
+    client.get("/items/")
+    assert calls == ["user", "items "]
+    now += 1
+    client.get("/items/")
+    assert calls == ["user", "items ", "user", "items "]
+
+
+def test_credentials_not_cached():
+    client.get("/router/included", headers={"Authorization": "Bearer x"})
+    client.get("/router/included", headers={"Cookie": "session=abc"})
+    assert calls == ["included", "included"]
+    assert len(uncacheable_cache) == 0
+    client.get("/router/included")
+    client.get("/router/included")
+    assert calls == ["included", "included", "included"]
+
+
+@pytest.mark.parametrize("methods", [["POST"], ["GET", "POST"]])
+def test_only_get_and_head(methods: List[str]):
+    def create_item():
+        pass  # pragma: nocover
+
+    with pytest.raises(AssertionError, match="GET and HEAD"):
+        app.add_api_route("/items/", create_item, methods=methods, cache=items_cache)
+
+
+def test_stale_while_revalidate(monkeypatch: pytest.MonkeyPatch):
+    now = 1000.0
+    monkeypatch.setattr("fastapi.cache.time.monotonic", lambda: now)
+    assert client.get("/stale").json() == {"version": 1}
+    assert calls == ["stale", "background"]
+    versions["item"] = 2
+    now += 15
+    # The stale response is returned, and refreshed after it's sent
+    assert client.get("/stale").json() == {"version": 1}
+    assert calls == ["stale", "background", "stale", "background"]
+    assert client.get("/stale").json() == {"version": 2}
+    assert calls == ["stale", "background", "stale", "background"]
+    assert (stale_cache.hits, stale_cache.stale_hits, stale_cache.misses) == (1, 1, 1)
+    now += 30
+    versions["item"] = 3
+    assert client.get("/stale").json() == {"version": 3}
+
+
+def test_revalidation_error_removes_response(monkeypatch: pytest.MonkeyPatch):
+    now = 1000.0
+    monkeypatch.setattr("fastapi.cache.time.monotonic", lambda: now)
+    client.get("/stale")
+    versions["item"] = None
+    now += 15
+    assert client.get("/stale").json() == {"version": 1}
+    assert len(stale_cache) == 0
+    assert client.get("/stale").status_code == 404
+
+
+@pytest.mark.parametrize("path", ["/cookie", "/not-found", "/no-store"])
+def test_not_cacheable(path: str):
+    client.get(path)
+    client.get(path)
+    assert len(calls) == 2
+    assert len(uncacheable_cache) == 0
+
+
+def test_include_router():
+    client.get("/router/included")
+    client.get("/router/included")
+    assert calls == ["included"]
@@ -0,0 +1,139 @@
+from typing import Any, Dict, List, Optional
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse
+from fastapi.testclient import TestClient
+from pydantic import BaseModel, Field
+
+from .utils import needs_pydanticv2
+
+
+class Item(BaseModel):
+    name: str
+    description: Optional[str] = None
+    price: float = Field(alias="cost")
+    tags: List[str] = []
+
+
+class CustomJSONResponse(JSONResponse):
+    def render(self, content: Any) -> bytes:
+        return b"custom:" + super().render(content)
+
+
+app = FastAPI(serialize_json_bytes=True)
+
+
+@app.get("/items/", response_model=List[Item])
+def read_items():
+    return [
+        {"name": "Foo", "cost": 3.5},
+        Item(name="Bar", description="Ünïcödé", cost=2, tags=["a"]),
+    ]
+
+
+@app.get("/items/unset", response_model=Item, response_model_exclude_unset=True)
+def read_item_unset():
+    return {"name": "Foo", "cost": 1}
+
+
+@app.get(
+    "/items/include",
+    response_model=Item,
+    response_model_include={"name", "price"},
+    response_model_by_alias=False,
+)
+def read_item_include():
+    return {"name": "Foo", "cost": 1, "tags": ["a"]}
+
+
+@app.get("/items/none", response_model=Item, response_model_exclude_none=True)
+def read_item_none():
+    return {"name": "Foo", "cost": 1}
+
+
+@app.get("/items/custom", response_model=Item, response_class=CustomJSONResponse)
+def read_item_custom():
+    return {"name": "Foo", "cost": 1}
+
+
+@app.get("/items/status", response_model=Item, status_code=201)
+def read_item_status():
+    return {"name": "Foo", "cost": 1}
+
+
+client = TestClient(app)
+
+default_app = FastAPI()
+
+
+@default_app.get("/values/", response_model=Dict[str, float])
+def read_values(value: float):
+    return {"value": value}
+
+
+default_client = TestClient(default_app)
+
+
+@needs_pydanticv2
+def test_list_response_bytes():
+    response = client.get("/items/")
+    assert response.status_code == 200, response.text
+    assert response.headers["content-type"] == "application/json"
+    assert (
+        response.content
+        == (
+            '[{"name":"Foo","description":null,"cost":3.5,"tags":[]},'
+            '{"name":"Bar","description":"Ünïcödé","cost":2.0,"tags":["a"]}]'
+        ).encode()
+    )
+    assert response.headers["content-length"] == str(len(response.content))
+
+
+@needs_pydanticv2
+def test_exclude_unset():
+    response = client.get("/items/unset")
+    assert response.status_code == 200, response.text
+    assert response.content == b'{"name":"Foo","cost":1.0}'
+
+
+@needs_pydanticv2
+def test_include_by_alias():
+    response = client.get("/items/include")
+    assert response.status_code == 200, response.text
+    assert response.content == b'{"name":"Foo","price":1.0}'
+
+
+@needs_pydanticv2
+def test_exclude_none():
+    response = client.get("/items/none")
+    assert response.status_code == 200, response.text
+    assert response.content == b'{"name":"Foo","cost":1.0,"tags":[]}'
+
+
+def test_custom_response_class_renders_content():
+    response = client.get("/items/custom")
+    assert response.status_code == 200, response.text
+    assert response.content.startswith(b"custom:")
+
+
+def test_status_code():
+    response = client.get("/items/status")
+    assert response.status_code == 201, response.text
+    assert response.json() == {
+        "name": "Foo",
+        "description": None,
+        "cost": 1.0,
+        "tags": [],
+    }
+
+
+def test_default_float_format():
+    response = default_client.get("/values/", params={"value": "1e16"})
+    assert response.status_code == 200, response.text
+    assert response.content == b'{"value":1e+16}'
+
+
+def test_default_nan():
+    with pytest.raises(ValueError):
+        default_client.get("/values/", params={"value": "nan"})
@@ -0,0 +1,180 @@
+from enum import Enum
+from typing import Any, Optional
+from uuid import UUID
+
+import pytest
+from fastapi import FastAPI, Query
+from fastapi.testclient import TestClient
+
+from .utils import needs_pydanticv2
+
+
+class Color(str, Enum):
+    red = "red"
+    green = "green"
+
+
+class Size(int, Enum):
+    small = 1
+    large = 2
+
+
+app = FastAPI()
+
+
+@app.get("/items/")
+def read_items(
+    skip: int = 0,
+    price: Optional[float] = None,
+    active: bool = False,
+    color: Color = Color.red,
+    item_id: Optional[UUID] = None,
+    size: Size = Size.small,
+):
+    return {
+        "skip": skip,
+        "price": price,
+        "active": active,
+        "color": color,
+        "item_id": item_id,
+        "size": size,
+    }
+
+
+client = TestClient(app)
+
+inputs = [
+    "0",
+    "-0",
+    "007",
+    "+5",
+    " 5",
+    "1_000",
+    "123456789012345678",
+    "1234567890123456789012",
+    "1.5",
+    "-0.0",
+    "1e3",
+    "inf",
+    "nan",
+    "true",
+    "True",
+    "off",
+    "yes",
+    "2",
+    "",
+    "red",
+    "Red",
+    "a8098c1a-f86e-11da-bd1a-00112444be1e",
+    "A8098C1A-F86E-11DA-BD1A-00112444BE1E",
+    "a8098c1af86e11dabd1a00112444be1e",
+    "a8098c1a-f86e-11da-bd1a-00112444be1",
+    "٣",
+    5,
+    5.5,
+    True,
+    None,
+    Color.green,
+    Size.large,
+    UUID("a8098c1a-f86e-11da-bd1a-00112444be1e"),
+]
+
+
+def _same(a: Any, b: Any) -> bool:
+    if isinstance(a, float) and isinstance(b, float) and a != a:
+        return b != b
+    return type(a) is type(b) and a == b
+
+
+@needs_pydanticv2
+@pytest.mark.parametrize(
+    "annotation", [int, float, str, bool, UUID, Color, Size, Optional[int]]
+)
+def test_same_as_pydantic(annotation: Any):
+    from fastapi._compat import _MISSING, ModelField
+
+    field = ModelField(field_info=Query(annotation=annotation), name="q")
+    assert field._scalar_validator is not None
+    for value in inputs:
+        fast = field._scalar_validator(value)
+        if fast is _MISSING:
+            continue
+        expected = field._type_adapter.validate_python(value, from_attributes=True)
+        assert _same(fast, expected), (annotation, value)
+        assert field.validate(value) == (fast, None)
+
+
+@needs_pydanticv2
+@pytest.mark.parametrize(
+    "field_info",
+    [
+        Query(annotation=int, gt=1),
+        Query(annotation=str, max_length=3),
+        Query(annotation=str, pattern="^a"),
+        Query(annotation=int, strict=True),
+        Query(annotation=Optional[int]),
+        Query(annotation=Optional[bool]),
+    ],
+)
+def test_fast_path_only_for_unconstrained(field_info: Any):
+    from fastapi._compat import ModelField
+
+    field = ModelField(field_info=field_info, name="q")
+    has_fast_path = field._scalar_validator is not None
+    assert has_fast_path == (not field_info.metadata)
+
+
+@needs_pydanticv2
+def test_union_not_optional():
+    from typing import Union
+
+    from fastapi._compat import ModelField
+
+    field = ModelField(field_info=Query(annotation=Union[int, str]), name="q")
+    assert field._scalar_validator is None
+
+
+def test_query_params():
+    response = client.get(
+        "/items/",
+        params={
+            "skip": "3",
+            "price": "2.5",
+            "active": "yes",
+            "color": "green",
+            "item_id": "a8098c1a-f86e-11da-bd1a-00112444be1e",
+            "size": "2",
+        },
+    )
+    assert response.status_code == 200, response.text
+    assert response.json() == {
+        "skip": 3,
+        "price": 2.5,
+        "active": True,
+        "color": "green",
+        "item_id": "a8098c1a-f86e-11da-bd1a-00112444be1e",
+        "size": 2,
+    }
+
+
+@needs_pydanticv2
+def test_errors_from_pydantic():
+    response = client.get("/items/", params={"skip": "1.5", "color": "blue"})
+    assert response.status_code == 422, response.text
+    assert response.json() == {
+        "detail": [
+            {
+                "type": "int_parsing",
+                "loc": ["query", "skip"],
+                "msg": "Input should be a valid integer, unable to parse string as an integer",
+                "input": "1.5",
+            },
+            {
+                "type": "enum",
+                "loc": ["query", "color"],
+                "msg": "Input should be 'red' or 'green'",
+                "input": "blue",
+                "ctx": {"expected": "'red' or 'green'"},
+            },
+        ]
+    }
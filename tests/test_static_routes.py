@@ -0,0 +1,177 @@
+from typing import List
+
+import pytest
+from fastapi import APIRouter, FastAPI
+from fastapi.responses import PlainTextResponse
+from fastapi.routing import _RouteIndex
+from fastapi.testclient import TestClient
+from starlette.routing import Route, Router
+
+
+def create_app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/health")
+    def health():
+        return {"route": "health"}
+
+    @app.get("/users/{user_id}")
+    def read_user(user_id: str):
+        return {"route": "user", "user_id": user_id}
+
+    @app.get("/users/me")
+    def read_me():
+        return {"route": "me"}  # pragma: nocover
+
+    @app.post("/users/me")
+    def update_me():
+        return {"route": "update me"}
+
+    @app.get("/orders/{order_id:int}")
+    def read_order(order_id: int):
+        return {"route": "order", "order_id": order_id}
+
+    @app.get("/orders/search")
+    def search_orders():
+        return {"route": "search orders"}
+
+    @app.get("/trailing/")
+    def read_trailing():
+        return {"route": "trailing"}
+
+    router = APIRouter(prefix="/v1")
+
+    @router.get("/orders/search")
+    def search_orders_v1():
+        return {"route": "search orders v1"}
+
+    app.include_router(router)
+
+    sub_app = FastAPI()
+
+    @sub_app.get("/status")
+    def read_sub_status():
+        return {"route": "sub status"}
+
+    app.mount("/sub", sub_app)
+    app.add_route("/plain", PlainTextResponse("plain"))
+    return app
+
+
+paths = [
+    ("GET", "/health"),
+    ("POST", "/health"),
+    ("GET", "/users/me"),
+    ("POST", "/users/me"),
+    ("DELETE", "/users/me"),
+    ("GET", "/users/42"),
+    ("GET", "/orders/search"),
+    ("GET", "/orders/3"),
+    ("GET", "/v1/orders/search"),
+    ("GET", "/v1/orders/search/"),
+    ("GET", "/trailing"),
+    ("GET", "/sub/status"),
+    ("GET", "/plain"),
+    ("GET", "/health%0A"),
+    ("GET", "/missing"),
+    ("GET", "/openapi.json"),
+]
+
+
+@pytest.mark.parametrize("method,path", paths)
+def test_same_as_linear(method: str, path: str, monkeypatch: pytest.MonkeyPatch):
+    response = TestClient(create_app()).request(method, path, follow_redirects=False)
+    monkeypatch.setattr(APIRouter, "app", Router.app)
+    expected = TestClient(create_app()).request(method, path, follow_redirects=False)
+    assert response.status_code == expected.status_code
+    assert response.content == expected.content
+    assert response.headers.get("location") == expected.headers.get("location")
+    assert response.headers.get("allow") == expected.headers.get("allow")
+
+
+def test_shadowed_by_earlier_param_route():
+    client = TestClient(create_app())
+    response = client.get("/users/me")
+    assert response.json() == {"route": "user", "user_id": "me"}
+    response = client.post("/users/me")
+    assert response.json() == {"route": "update me"}
+
+
+def test_method_not_allowed():
+    client = TestClient(create_app())
+    response = client.delete("/health")
+    assert response.status_code == 405, response.text
+    assert response.headers["allow"] == "GET"
+
+
+def test_index_in_sync():
+    app = create_app()
+    client = TestClient(app)
+    assert client.get("/late").status_code == 404
+
+    @app.get("/late")
+    def read_late():
+        return {"route": "late"}
+
+    assert client.get("/late").json() == {"route": "late"}
+    router = APIRouter()
+
+    @router.get("/included")
+    def read_included():
+        return {"route": "included"}
+
+    app.include_router(router)
+    assert client.get("/included").json() == {"route": "included"}
+    app.add_route("/added", PlainTextResponse("added"))
+    assert client.get("/added").text == "added"
+    app.mount("/late", PlainTextResponse("mounted"))
+    assert client.get("/late/anything").text == "mounted"
+
+
+def test_index_in_sync_after_remove_and_append():
+    app = create_app()
+    client = TestClient(app)
+    assert client.get("/health").json() == {"route": "health"}
+    routes = app.router.routes
+    routes.remove(routes[0])
+    routes.append(Route("/late", PlainTextResponse("late")))
+    assert client.get("/late").text == "late"
+    assert client.get("/health").json() == {"route": "health"}
+
+
+def test_index_in_sync_after_replace_in_place():
+    app = create_app()
+    client = TestClient(app)
+    assert client.get("/health").json() == {"route": "health"}
+    health_index = next(
+        index
+        for index, route in enumerate(app.router.routes)
+        if getattr(route, "path", None) == "/health"
+    )
+    app.router.routes[health_index] = Route("/late", PlainTextResponse("late"))
+    assert client.get("/late").text == "late"
+    assert client.get("/health").status_code == 404
+
+
+def test_candidates():
+    app = create_app()
+    index = _RouteIndex(app.router.routes)
+
+    def candidate_paths(path: str) -> List[str]:
+        return [route.path for route in index.get_candidates(path)]  # type: ignore[attr-defined]
+
+    assert "/health" in index.static
+    assert "/users/{user_id}" not in index.static
+    assert candidate_paths("/users/me") == [
+        "/users/{user_id}",
+        "/users/me",
+        "/users/me",
+        "/orders/{order_id:int}",
+        "/sub",
+    ]
+    assert candidate_paths("/health") == [
+        "/health",
+        "/users/{user_id}",
+        "/orders/{order_id:int}",
+        "/sub",
+    ]
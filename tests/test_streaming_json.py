@@ -0,0 +1,109 @@
+import sys
+from dataclasses import dataclass
+from datetime import date
+from enum import Enum
+from typing import Any, Dict, List, Optional
+
+import anyio
+import pytest
+from fastapi import FastAPI
+from fastapi.encoders import iter_json, jsonable_encoder
+from fastapi.responses import JSONResponse, StreamingJSONResponse
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+
+class Color(Enum):
+    red = "red"
+
+
+class Item(BaseModel):
+    name: str
+    color: Color = Color.red
+    description: Optional[str] = None
+
+
+@dataclass
+class Order:
+    items: List[Item]
+    created: date
+
+
+data: Dict[Any, Any] = {
+    "items": [Item(name="foo"), Item(name="bar", description="Bar")],
+    "order": Order(items=[Item(name="baz")], created=date(2024, 1, 1)),
+    "tags": {"a"},
+    "values": (1, 2.5, True, None, "ñ"),
+    1: {"empty": {}, "list": []},
+    None: Color.red,
+    "_sa_instance_state": "ignored",
+}
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {},
+        {"exclude_none": True},
+        {"sqlalchemy_safe": False},
+        {"include": {"items", "values"}},
+        {"exclude": ["order"]},
+        {"custom_encoder": {date: lambda d: d.year}},
+    ],
+)
+@pytest.mark.parametrize("chunk_size", [1, 65536])
+def test_same_as_jsonable_encoder(kwargs: Dict[str, Any], chunk_size: int):
+    body = b"".join(iter_json(data, chunk_size=chunk_size, **kwargs))
+    assert body == JSONResponse(jsonable_encoder(data, **kwargs)).body
+
+
+def test_deeply_nested():
+    depth = sys.getrecursionlimit() * 2
+    nested: List[Any] = []
+    for _ in range(depth):
+        nested = [{"a": nested}]
+    body = b"".join(iter_json(nested))
+    assert body == b'[{"a":' * depth + b"[]" + b"}]" * depth
+
+
+def test_chunk_size():
+    chunks = list(iter_json(list(range(10000)), chunk_size=1024))
+    assert len(chunks) > 1
+    assert b"".join(chunks) == JSONResponse(list(range(10000))).body
+
+
+def test_invalid_float():
+    with pytest.raises(ValueError):
+        b"".join(iter_json({"value": float("nan")}))
+
+
+def test_response():
+    app = FastAPI()
+
+    @app.get("/items/")
+    def read_items():
+        return StreamingJSONResponse(data)
+
+    response = TestClient(app).get("/items/")
+    assert response.status_code == 200, response.text
+    assert response.headers["content-type"] == "application/json"
+    assert response.content == JSONResponse(jsonable_encoder(data)).body
+
+
+@pytest.mark.anyio
+async def test_yields_to_event_loop():
+    events: List[Any] = []
+    response = StreamingJSONResponse([{"a": 1}, {"b": 2}], chunk_size=1)
+
+    async def other() -> None:
+        events.append("other")
+
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(other)
+        async for chunk in response.body_iterator:
+            events.append(chunk)
+    # Trio runs the ready tasks in a random order, the other task runs between two
+    # chunks, not necessarily right after the first one
+    assert 0 < events.index("other") < len(events) - 1
+    events.remove("other")
+    assert b"".join(events) == b'[{"a":1},{"b":2}]'
@@ -0,0 +1,108 @@
+import gc
+from typing import List, Union
+
+from fastapi import FastAPI, Query
+from fastapi._compat import ModelField
+from fastapi.routing import APIRoute
+from fastapi.testclient import TestClient
+from pydantic import BaseModel, create_model
+from pydantic.fields import FieldInfo
+
+from .utils import needs_pydanticv2
+
+
+class Item(BaseModel):
+    name: str
+
+
+def create_field(annotation, field_info: FieldInfo, mode="validation") -> ModelField:
+    field_info.annotation = annotation
+    return ModelField(field_info=field_info, name="field", mode=mode)
+
+
+@needs_pydanticv2
+def test_shared_by_identical_fields():
+    app = FastAPI()
+
+    @app.get("/items/", response_model=List[Item])
+    def read_items(limit: int = Query(100)):
+        return []  # pragma: nocover
+
+    @app.get("/users/", response_model=List[Item])
+    def read_users(limit: int = Query(100)):
+        return []  # pragma: nocover
+
+    items_route, users_route = [
+        route for route in app.routes if isinstance(route, APIRoute)
+    ]
+    assert (
+        items_route.dependant.query_params[0]._type_adapter
+        is users_route.dependant.query_params[0]._type_adapter
+    )
+    assert (
+        items_route.response_field._type_adapter
+        is users_route.response_field._type_adapter
+    )
+    client = TestClient(app)
+    response = client.get("/openapi.json")
+    assert response.status_code == 200, response.text
+
+
+@needs_pydanticv2
+def test_not_shared_by_different_fields():
+    field = create_field(int, Query(100))
+    assert create_field(int, Query(100))._type_adapter is field._type_adapter
+    for other in [
+        create_field(int, Query(101)),
+        create_field(int, Query(True)),
+        create_field(int, Query(100, description="Limit")),
+        create_field(int, Query(100, gt=0)),
+        create_field(int, Query(100, alias="size")),
+        create_field(float, Query(100)),
+        create_field(int, FieldInfo(default=100)),
+        create_field(int, Query(100), mode="serialization"),
+    ]:
+        assert other._type_adapter is not field._type_adapter
+
+
+@needs_pydanticv2
+def test_union_order():
+    field = create_field(Union[int, str], Query())
+    other = create_field(Union[str, int], Query())
+    assert other._type_adapter is not field._type_adapter
+
+
+@needs_pydanticv2
+def test_pattern_metadata():
+    field = create_field(str, Query(pattern="^a"))
+    assert create_field(str, Query(pattern="^a"))._type_adapter is field._type_adapter
+    other = create_field(str, Query(pattern="^b"))
+    assert other._type_adapter is not field._type_adapter
+    assert other.validate("b", {}, loc=()) == ("b", None)
+
+
+@needs_pydanticv2
+def test_unhashable_values():
+    class Default:
+        __hash__ = None  # type: ignore[assignment]
+
+    default = Default()
+    field = create_field(object, Query(default))
+    other = create_field(object, Query(default))
+    assert other._type_adapter is not field._type_adapter
+    assert field.validate(default, {}, loc=()) == (default, None)
+
+
+@needs_pydanticv2
+def test_removed_when_unused():
+    from fastapi._compat import _type_adapters
+
+    Model = create_model("DynamicModel", name=(str, ...))
+    field = create_field(Model, FieldInfo())
+    keys = [
+        key for key, adapter in _type_adapters.items() if adapter is field._type_adapter
+    ]
+    assert len(keys) == 1
+    del field
+    gc.collect()
+    assert keys[0] not in _type_adapters
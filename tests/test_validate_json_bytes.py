@@ -0,0 +1,148 @@
+from typing import List
+
+import pytest
+from fastapi import APIRouter, Body, FastAPI, Query, Request
+from fastapi.encoders import jsonable_encoder
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import JSONResponse
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+from .utils import needs_pydanticv2
+
+
+class Item(BaseModel):
+    name: str
+    price: float
+    tags: List[str] = []
+
+
+app = FastAPI(validate_json_bytes=True)
+
+
+@app.exception_handler(RequestValidationError)
+async def validation_exception_handler(request: Request, exc: RequestValidationError):
+    return JSONResponse(
+        status_code=422,
+        content=jsonable_encoder({"detail": exc.errors(), "body": exc.body}),
+    )
+
+
+@app.post("/items/")
+def create_item(item: Item, request: Request):
+    return {"item": item, "parsed_json": hasattr(request, "_json")}
+
+
+@app.post("/items-query/")
+def create_item_query(item: Item, q: int = Query()):
+    return {"item": item, "q": q}
+
+
+@app.post("/embedded/")
+def create_embedded(item: Item = Body(embed=True)):
+    return {"item": item}
+
+
+@app.post("/list/")
+def create_list(items: List[Item]):
+    return {"items": items}
+
+
+router = APIRouter()
+
+
+@router.post("/router-items/")
+def router_create_item(item: Item):
+    return {"item": item}
+
+
+app.include_router(router)
+
+client = TestClient(app)
+
+
+@needs_pydanticv2
+@pytest.mark.parametrize("path", ["/items/", "/router-items/"])
+def test_valid_body(path: str):
+    response = client.post(path, json={"name": "Foo", "price": 3.5})
+    assert response.status_code == 200, response.text
+    assert response.json()["item"] == {"name": "Foo", "price": 3.5, "tags": []}
+
+
+@needs_pydanticv2
+def test_body_not_parsed_with_json():
+    response = client.post("/items/", json={"name": "Foo", "price": 3.5})
+    assert response.status_code == 200, response.text
+    assert response.json()["parsed_json"] is False
+
+
+@needs_pydanticv2
+def test_invalid_json():
+    response = client.post(
+        "/items/",
+        content=b'{"name": "Foo", "price": ',
+        headers={"content-type": "application/json"},
+    )
+    assert response.status_code == 422, response.text
+    assert response.json() == {
+        "detail": [
+            {
+                "type": "json_invalid",
+                "loc": ["body", 25],
+                "msg": "JSON decode error",
+                "input": {},
+                "ctx": {"error": "Expecting value"},
+            }
+        ],
+        "body": '{"name": "Foo", "price": ',
+    }
+
+
+@needs_pydanticv2
+def test_invalid_field():
+    response = client.post("/items/", json={"name": "Foo", "price": "bar"})
+    assert response.status_code == 422, response.text
+    assert response.json() == {
+        "detail": [
+            {
+                "type": "float_parsing",
+                "loc": ["body", "price"],
+                "msg": "Input should be a valid number, unable to parse string as a number",
+                "input": "bar",
+            }
+        ],
+        "body": {"name": "Foo", "price": "bar"},
+    }
+
+
+@needs_pydanticv2
+def test_valid_body_other_errors_keep_parsed_body():
+    response = client.post(
+        "/items-query/", params={"q": "bar"}, json={"name": "Foo", "price": 3.5}
+    )
+    assert response.status_code == 422, response.text
+    data = response.json()
+    assert data["detail"][0]["loc"] == ["query", "q"]
+    assert data["body"] == {"name": "Foo", "price": 3.5}
+
+
+@needs_pydanticv2
+def test_not_json_content_type():
+    response = client.post(
+        "/items/",
+        content=b'{"name": "Foo", "price": 3.5}',
+        headers={"content-type": "text/plain"},
+    )
+    assert response.status_code == 422, response.text
+    assert response.json()["detail"][0]["type"] == "model_attributes_type"
+    assert response.json()["body"] == '{"name": "Foo", "price": 3.5}'
+
+
+@needs_pydanticv2
+def test_embedded_and_list_bodies():
+    response = client.post("/embedded/", json={"item": {"name": "Foo", "price": 1}})
+    assert response.status_code == 200, response.text
+    assert response.json() == {"item": {"name": "Foo", "price": 1.0, "tags": []}}
+    response = client.post("/list/", json=[{"name": "Foo", "price": 1}])
+    assert response.status_code == 200, response.text
+    assert response.json() == {"items": [{"name": "Foo", "price": 1.0, "tags": []}]}